@@ -6,78 +6,218 @@ checking, and QSA-ready compliance report generation.
 """
 
 import re
+import sys
+import time
 import uuid
+from collections.abc import Iterator, Sequence
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, NamedTuple
 
+import orjson
 from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
 
+
+class _PCIRequirement(NamedTuple):
+    """A single PCI DSS v4.0 control in the requirement catalogue."""
+
+    req: str
+    control_id: str
+    description: str
+    risk: str
+    domain: str
+
+
 # PCI DSS v4.0 complete requirement catalogue with descriptions and risk levels
-_PCI_REQUIREMENTS: list[dict[str, Any]] = [
+_PCI_REQUIREMENTS: tuple[_PCIRequirement, ...] = (
     # Requirement 1: Network Security Controls
-    {"req": "1", "control_id": "1.1.1", "description": "Network security controls are defined and understood", "risk": "high", "domain": "Network Security"},
-    {"req": "1", "control_id": "1.2.1", "description": "Configuration standards for network security controls are defined and implemented", "risk": "high", "domain": "Network Security"},
-    {"req": "1", "control_id": "1.3.1", "description": "Inbound traffic to the CDE is restricted", "risk": "critical", "domain": "Network Security"},
-    {"req": "1", "control_id": "1.3.2", "description": "Outbound traffic from the CDE is restricted", "risk": "critical", "domain": "Network Security"},
-    {"req": "1", "control_id": "1.4.1", "description": "NSCs control traffic between trusted and untrusted networks", "risk": "high", "domain": "Network Security"},
+    _PCIRequirement("1", "1.1.1", "Network security controls are defined and understood", "high", "Network Security"),
+    _PCIRequirement(
+        "1", "1.2.1", "Configuration standards for network security controls are defined and implemented",
+        "high", "Network Security",
+    ),
+    _PCIRequirement("1", "1.3.1", "Inbound traffic to the CDE is restricted", "critical", "Network Security"),
+    _PCIRequirement("1", "1.3.2", "Outbound traffic from the CDE is restricted", "critical", "Network Security"),
+    _PCIRequirement(
+        "1", "1.4.1", "NSCs control traffic between trusted and untrusted networks",
+        "high", "Network Security",
+    ),
     # Requirement 2: Secure Configurations
-    {"req": "2", "control_id": "2.1.1", "description": "Configuration and hardening standards are developed and implemented", "risk": "high", "domain": "Secure Configuration"},
-    {"req": "2", "control_id": "2.2.1", "description": "System components are configured using a configuration standard", "risk": "medium", "domain": "Secure Configuration"},
-    {"req": "2", "control_id": "2.3.1", "description": "Wireless environments are configured with security settings", "risk": "high", "domain": "Secure Configuration"},
+    _PCIRequirement(
+        "2", "2.1.1", "Configuration and hardening standards are developed and implemented",
+        "high", "Secure Configuration",
+    ),
+    _PCIRequirement(
+        "2", "2.2.1", "System components are configured using a configuration standard",
+        "medium", "Secure Configuration",
+    ),
+    _PCIRequirement(
+        "2", "2.3.1", "Wireless environments are configured with security settings",
+        "high", "Secure Configuration",
+    ),
     # Requirement 3: Protect Account Data
-    {"req": "3", "control_id": "3.1.1", "description": "Account data storage policies exist", "risk": "critical", "domain": "Account Data Protection"},
-    {"req": "3", "control_id": "3.2.1", "description": "SAD is not retained after authorization", "risk": "critical", "domain": "Account Data Protection"},
-    {"req": "3", "control_id": "3.3.1", "description": "SAD is not retained after authorization is complete", "risk": "critical", "domain": "Account Data Protection"},
-    {"req": "3", "control_id": "3.4.1", "description": "PAN is unreadable anywhere it is stored", "risk": "critical", "domain": "Account Data Protection"},
-    {"req": "3", "control_id": "3.5.1", "description": "Primary account numbers are secured with strong cryptography", "risk": "critical", "domain": "Account Data Protection"},
+    _PCIRequirement("3", "3.1.1", "Account data storage policies exist", "critical", "Account Data Protection"),
+    _PCIRequirement("3", "3.2.1", "SAD is not retained after authorization", "critical", "Account Data Protection"),
+    _PCIRequirement(
+        "3", "3.3.1", "SAD is not retained after authorization is complete",
+        "critical", "Account Data Protection",
+    ),
+    _PCIRequirement("3", "3.4.1", "PAN is unreadable anywhere it is stored", "critical", "Account Data Protection"),
+    _PCIRequirement(
+        "3", "3.5.1", "Primary account numbers are secured with strong cryptography",
+        "critical", "Account Data Protection",
+    ),
     # Requirement 4: Protect Transmissions
-    {"req": "4", "control_id": "4.1.1", "description": "Processes to protect PAN during transmission are defined", "risk": "critical", "domain": "Data in Transit"},
-    {"req": "4", "control_id": "4.2.1", "description": "Strong cryptography is used to safeguard PAN during transmission", "risk": "critical", "domain": "Data in Transit"},
+    _PCIRequirement(
+        "4", "4.1.1", "Processes to protect PAN during transmission are defined",
+        "critical", "Data in Transit",
+    ),
+    _PCIRequirement(
+        "4", "4.2.1", "Strong cryptography is used to safeguard PAN during transmission",
+        "critical", "Data in Transit",
+    ),
     # Requirement 5: Protect Systems
-    {"req": "5", "control_id": "5.1.1", "description": "Anti-malware solution(s) are deployed", "risk": "high", "domain": "Malware Protection"},
-    {"req": "5", "control_id": "5.2.1", "description": "Anti-malware solutions are kept current", "risk": "high", "domain": "Malware Protection"},
-    {"req": "5", "control_id": "5.3.1", "description": "Anti-malware mechanisms cannot be disabled by users", "risk": "medium", "domain": "Malware Protection"},
+    _PCIRequirement("5", "5.1.1", "Anti-malware solution(s) are deployed", "high", "Malware Protection"),
+    _PCIRequirement("5", "5.2.1", "Anti-malware solutions are kept current", "high", "Malware Protection"),
+    _PCIRequirement(
+        "5", "5.3.1", "Anti-malware mechanisms cannot be disabled by users",
+        "medium", "Malware Protection",
+    ),
     # Requirement 6: Develop Secure Systems
-    {"req": "6", "control_id": "6.1.1", "description": "Policies for security in software development are defined", "risk": "high", "domain": "Secure Development"},
-    {"req": "6", "control_id": "6.2.1", "description": "Bespoke and custom software are developed securely", "risk": "high", "domain": "Secure Development"},
-    {"req": "6", "control_id": "6.3.1", "description": "Security vulnerabilities are identified and managed", "risk": "high", "domain": "Secure Development"},
-    {"req": "6", "control_id": "6.4.1", "description": "Public-facing web applications are protected against attacks", "risk": "critical", "domain": "Secure Development"},
+    _PCIRequirement(
+        "6", "6.1.1", "Policies for security in software development are defined",
+        "high", "Secure Development",
+    ),
+    _PCIRequirement("6", "6.2.1", "Bespoke and custom software are developed securely", "high", "Secure Development"),
+    _PCIRequirement("6", "6.3.1", "Security vulnerabilities are identified and managed", "high", "Secure Development"),
+    _PCIRequirement(
+        "6", "6.4.1", "Public-facing web applications are protected against attacks",
+        "critical", "Secure Development",
+    ),
     # Requirement 7: Restrict Access
-    {"req": "7", "control_id": "7.1.1", "description": "Access control system(s) are in place", "risk": "high", "domain": "Access Control"},
-    {"req": "7", "control_id": "7.2.1", "description": "Access is assigned based on need-to-know", "risk": "high", "domain": "Access Control"},
-    {"req": "7", "control_id": "7.3.1", "description": "All user accounts and access are assigned and managed", "risk": "high", "domain": "Access Control"},
+    _PCIRequirement("7", "7.1.1", "Access control system(s) are in place", "high", "Access Control"),
+    _PCIRequirement("7", "7.2.1", "Access is assigned based on need-to-know", "high", "Access Control"),
+    _PCIRequirement("7", "7.3.1", "All user accounts and access are assigned and managed", "high", "Access Control"),
     # Requirement 8: Identify Users
-    {"req": "8", "control_id": "8.1.1", "description": "Policies for user identification and authentication are defined", "risk": "high", "domain": "Identity Management"},
-    {"req": "8", "control_id": "8.2.1", "description": "All user accounts are assigned a unique ID", "risk": "high", "domain": "Identity Management"},
-    {"req": "8", "control_id": "8.3.1", "description": "Authentication factors are protected", "risk": "critical", "domain": "Identity Management"},
-    {"req": "8", "control_id": "8.4.1", "description": "MFA is implemented for all access into the CDE", "risk": "critical", "domain": "Identity Management"},
+    _PCIRequirement(
+        "8", "8.1.1", "Policies for user identification and authentication are defined",
+        "high", "Identity Management",
+    ),
+    _PCIRequirement("8", "8.2.1", "All user accounts are assigned a unique ID", "high", "Identity Management"),
+    _PCIRequirement("8", "8.3.1", "Authentication factors are protected", "critical", "Identity Management"),
+    _PCIRequirement("8", "8.4.1", "MFA is implemented for all access into the CDE", "critical", "Identity Management"),
     # Requirement 9: Restrict Physical Access
-    {"req": "9", "control_id": "9.1.1", "description": "Physical access controls manage entry into the CDE", "risk": "high", "domain": "Physical Security"},
-    {"req": "9", "control_id": "9.2.1", "description": "All media with cardholder data is physically secure", "risk": "high", "domain": "Physical Security"},
+    _PCIRequirement("9", "9.1.1", "Physical access controls manage entry into the CDE", "high", "Physical Security"),
+    _PCIRequirement("9", "9.2.1", "All media with cardholder data is physically secure", "high", "Physical Security"),
     # Requirement 10: Log and Monitor
-    {"req": "10", "control_id": "10.1.1", "description": "Audit logs are implemented and active", "risk": "high", "domain": "Logging and Monitoring"},
-    {"req": "10", "control_id": "10.2.1", "description": "Audit logs capture all required events", "risk": "high", "domain": "Logging and Monitoring"},
-    {"req": "10", "control_id": "10.3.1", "description": "Audit logs are protected from destruction and modification", "risk": "critical", "domain": "Logging and Monitoring"},
+    _PCIRequirement("10", "10.1.1", "Audit logs are implemented and active", "high", "Logging and Monitoring"),
+    _PCIRequirement("10", "10.2.1", "Audit logs capture all required events", "high", "Logging and Monitoring"),
+    _PCIRequirement(
+        "10", "10.3.1", "Audit logs are protected from destruction and modification",
+        "critical", "Logging and Monitoring",
+    ),
     # Requirement 11: Test Security
-    {"req": "11", "control_id": "11.1.1", "description": "Security vulnerability testing processes are defined", "risk": "high", "domain": "Security Testing"},
-    {"req": "11", "control_id": "11.3.1", "description": "Internal vulnerability scans are performed at least quarterly", "risk": "high", "domain": "Security Testing"},
-    {"req": "11", "control_id": "11.4.1", "description": "A penetration testing methodology is defined and implemented", "risk": "high", "domain": "Security Testing"},
+    _PCIRequirement("11", "11.1.1", "Security vulnerability testing processes are defined", "high", "Security Testing"),
+    _PCIRequirement(
+        "11", "11.3.1", "Internal vulnerability scans are performed at least quarterly",
+        "high", "Security Testing",
+    ),
+    _PCIRequirement(
+        "11", "11.4.1", "A penetration testing methodology is defined and implemented",
+        "high", "Security Testing",
+    ),
     # Requirement 12: Support Security
-    {"req": "12", "control_id": "12.1.1", "description": "An overall information security policy is established", "risk": "medium", "domain": "Security Policy"},
-    {"req": "12", "control_id": "12.3.1", "description": "Risk assessment process is defined and implemented", "risk": "high", "domain": "Security Policy"},
-    {"req": "12", "control_id": "12.6.1", "description": "Security awareness program is in place", "risk": "medium", "domain": "Security Policy"},
-]
+    _PCIRequirement(
+        "12", "12.1.1", "An overall information security policy is established",
+        "medium", "Security Policy",
+    ),
+    _PCIRequirement("12", "12.3.1", "Risk assessment process is defined and implemented", "high", "Security Policy"),
+    _PCIRequirement("12", "12.6.1", "Security awareness program is in place", "medium", "Security Policy"),
+)
+
+# Runs of digit groups joined by single space or dash separators; PAN candidates
+# are whole-group windows of each run (see _iter_pan_candidates)
+_DIGIT_RUN_PATTERN = re.compile(r"\b\d+(?:[ -]\d+)*\b", re.ASCII)
+_DIGIT_GROUP_SEPARATOR = re.compile(r"[ -]")
+
+# PAN length bounds in digits (ISO/IEC 7812)
+_PAN_MIN_DIGITS = 13
+_PAN_MAX_DIGITS = 19
+
+# Cardholder data indicator keywords, matched case-insensitively anywhere in sample text
+_CHD_KEYWORDS: tuple[str, ...] = ("cardholder", "PAN", "CVV", "CVC", "expiry", "card number", "track data", "SAD")
+
+# Single-pass keyword scanner; the lookahead reports overlapping occurrences so
+# results match an independent substring test per keyword
+_CHD_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in _CHD_KEYWORDS) + "))",
+    re.IGNORECASE | re.ASCII,
+)
+
+# Data flow description keywords indicating cardholder data handling
+_FLOW_RISK_KEYWORDS: tuple[str, ...] = ("pan", "card", "cvv", "track", "cardholder", "payment")
+
+# Remediation guidance attached to every in-scope cardholder data detection
+_CHD_RECOMMENDATIONS: tuple[str, ...] = (
+    "Perform formal data flow diagram update to document all CHD touchpoints",
+    "Apply tokenization or encryption to all identified PAN storage",
+    "Implement DLP controls on identified at-risk data flows",
+)
+
+# Control assessment statuses, interned so comparisons against interned inputs are identity checks
+_STATUS_COMPLIANT = sys.intern("compliant")
+_STATUS_NON_COMPLIANT = sys.intern("non_compliant")
+_STATUS_COMPENSATING = sys.intern("compensating_control")
+_STATUS_NOT_APPLICABLE = sys.intern("not_applicable")
+
+# Column order of the per-domain status counts in the compliance report
+_DOMAIN_SUMMARY_KEYS: tuple[str, str, str] = ("compliant", "non_compliant", "compensating")
+
+# Report skeleton for scans with no control results; per-call fields are filled
+# in by generate_pci_compliance_report so key order matches the full report
+_EMPTY_PCI_ASSESSMENT_SUMMARY: dict[str, Any] = {
+    "total_controls_assessed": 0,
+    "compliant_controls": 0,
+    "non_compliant_controls": 0,
+    "compensating_controls": 0,
+    "not_applicable_controls": 0,
+    "compliance_percentage": 100.0,
+    "qsa_ready": True,
+}
+_EMPTY_PCI_REPORT_TEMPLATE: dict[str, Any] = {
+    "report_id": None,
+    "tenant_id": None,
+    "scan_id": None,
+    "pci_dss_version": "4.0",
+    "scope_description": None,
+    "merchant_level": None,
+    "assessment_date": None,
+    "assessment_summary": None,
+    "domain_summary": None,
+    "non_compliant_findings": None,
+    "remediation_plan_required": False,
+    "next_assessment_required_days": None,
+    "attestation_of_compliance_required": None,
+    "report_version": "1.0",
+    "pci_ssc_reference": "PCI DSS v4.0, March 2022",
+    "generated_at": None,
+}
 
-# PAN detection pattern (luhn-valid card number patterns — masked for display)
-_PAN_PATTERN = re.compile(r"\b(?:\d[ -]?){13,19}\b")
+# Luhn doubling table: _LUHN_DOUBLED[d] is the digit sum of 2 * d
+_LUHN_DOUBLED: tuple[int, ...] = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
 # Approved TLS/SSL versions for PCI DSS v4.0
-_APPROVED_TLS_VERSIONS = {"TLSv1.2", "TLSv1.3"}
+_APPROVED_TLS_VERSIONS: frozenset[str] = frozenset({"TLSv1.2", "TLSv1.3"})
 
 # Approved encryption algorithms
-_APPROVED_ENCRYPTION_ALGORITHMS = {"AES-128", "AES-192", "AES-256", "RSA-2048", "RSA-4096", "ECDSA-P256", "ECDSA-P384"}
+_APPROVED_ENCRYPTION_ALGORITHMS: frozenset[str] = frozenset(
+    {"AES-128", "AES-192", "AES-256", "RSA-2048", "RSA-4096", "ECDSA-P256", "ECDSA-P384"}
+)
+
+# Sorted views of the approved sets, computed once for report output
+_APPROVED_TLS_VERSIONS_SORTED: tuple[str, ...] = tuple(sorted(_APPROVED_TLS_VERSIONS))
+_APPROVED_ENCRYPTION_ALGORITHMS_SORTED: tuple[str, ...] = tuple(sorted(_APPROVED_ENCRYPTION_ALGORITHMS))
 
 # Minimum key lengths by algorithm
 _MIN_KEY_LENGTHS: dict[str, int] = {
@@ -87,6 +227,165 @@ _MIN_KEY_LENGTHS: dict[str, int] = {
     "3DES": 168,
 }
 
+# Algorithm family ("RSA", "AES", ...) for each approved algorithm
+_ALG_FAMILY: dict[str, str] = {alg: alg.partition("-")[0] for alg in _APPROVED_ENCRYPTION_ALGORITHMS}
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with microseconds.
+
+    Formats directly from the epoch clock, avoiding a timezone-aware
+    datetime for call sites that only emit the string.
+
+    Returns:
+        Timestamp such as '2024-01-31T12:00:00.000000+00:00'.
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{nanos // 1000:06d}+00:00"
+    )
+
+
+def _luhn_valid(candidate: str) -> bool:
+    """Check whether a PAN candidate passes the Luhn (mod 10) checksum.
+
+    Args:
+        candidate: String of ASCII digits without separators.
+
+    Returns:
+        True if the digits form a Luhn-valid number.
+    """
+    digits = [int(c) for c in candidate]
+    total = sum(digits[-1::-2]) + sum(_LUHN_DOUBLED[d] for d in digits[-2::-2])
+    return total % 10 == 0
+
+
+def _iter_pan_candidates(sample_text: str) -> Iterator[str]:
+    """Yield the Luhn-valid PANs found in sample text.
+
+    Each run of separated digit groups is searched for windows of whole groups
+    holding 13-19 digits, so a PAN next to another number (a reference, a
+    quantity, a trailing check group) is still found. Windows never split a
+    group, and the longest valid window at each position wins; the search
+    resumes after it so one PAN is counted once.
+
+    Args:
+        sample_text: Text to scan.
+
+    Yields:
+        Digits of each Luhn-valid PAN candidate, separators removed.
+    """
+    for match in _DIGIT_RUN_PATTERN.finditer(sample_text):
+        groups = _DIGIT_GROUP_SEPARATOR.split(match.group())
+        start = 0
+        while start < len(groups):
+            found: tuple[str, int] | None = None
+            digits = ""
+            for end in range(start, len(groups)):
+                digits += groups[end]
+                if len(digits) > _PAN_MAX_DIGITS:
+                    break
+                if len(digits) >= _PAN_MIN_DIGITS and _luhn_valid(digits):
+                    found = (digits, end)
+            if found is None:
+                start += 1
+                continue
+            yield found[0]
+            start = found[1] + 1
+
+
+def _group_requirements(
+    requirements: Sequence[_PCIRequirement],
+) -> tuple[dict[str, list[dict[str, Any]]], int, int]:
+    """Group requirements by domain and count critical and high risk entries.
+
+    Args:
+        requirements: Requirement catalogue entries to group.
+
+    Returns:
+        Tuple of (requirements grouped by domain, critical count, high count).
+    """
+    critical_count = 0
+    high_count = 0
+    domain_groups: dict[str, list[dict[str, Any]]] = {}
+    for requirement in requirements:
+        risk = requirement.risk
+        if risk == "critical":
+            critical_count += 1
+        elif risk == "high":
+            high_count += 1
+        domain_groups.setdefault(requirement.domain, []).append({
+            "requirement_number": requirement.req,
+            "control_id": requirement.control_id,
+            "description": requirement.description,
+            "risk_level": risk,
+        })
+    return domain_groups, critical_count, high_count
+
+
+def _scan_cardholder_data(
+    sample_text: str,
+    environment_name: str,
+    data_flows: list[str],
+    scanned_at: str,
+) -> dict[str, Any]:
+    """Build a cardholder data detection report for one environment.
+
+    Args:
+        sample_text: Sample text or log data to scan for PANs.
+        environment_name: Name of the environment being scanned.
+        data_flows: List of data flow descriptions to analyze.
+        scanned_at: ISO 8601 timestamp recorded on the report.
+
+    Returns:
+        Cardholder data detection report dict.
+    """
+    pan_count = 0
+    masked_matches: list[str] = []
+    for candidate in _iter_pan_candidates(sample_text):
+        pan_count += 1
+        if len(masked_matches) < 5:
+            masked_matches.append(candidate[:6] + "****" + candidate[-4:])
+
+    found_keywords = {m.group(1).lower() for m in _CHD_KEYWORD_PATTERN.finditer(sample_text)}
+    keyword_hits = [kw for kw in _CHD_KEYWORDS if kw.lower() in found_keywords]
+
+    flow_risks: list[dict[str, Any]] = []
+    for flow in data_flows:
+        flow_lower = flow.lower()
+        risk_indicators = [kw for kw in _FLOW_RISK_KEYWORDS if kw in flow_lower]
+        if risk_indicators:
+            flow_risks.append({
+                "data_flow": flow,
+                "risk_indicators": risk_indicators,
+                "in_scope_pci": True,
+                "recommendation": "Include this data flow in PCI DSS scope and implement controls",
+            })
+
+    in_scope = pan_count > 0 or len(keyword_hits) > 0 or len(flow_risks) > 0
+
+    return {
+        "environment_name": environment_name,
+        "pci_dss_in_scope": in_scope,
+        "potential_pan_patterns_found": pan_count,
+        "masked_pan_samples": masked_matches,
+        "cardholder_data_keywords": keyword_hits,
+        "data_flows_analyzed": len(data_flows),
+        "at_risk_data_flows": flow_risks,
+        "at_risk_flow_count": len(flow_risks),
+        "immediate_actions_required": in_scope,
+        "recommendations": list(_CHD_RECOMMENDATIONS) if in_scope else [],
+        "scanned_at": scanned_at,
+    }
+
+
+# Full-catalogue mapping, serialized once at import for map_requirements_json
+_ALL_DOMAIN_GROUPS, _ALL_CRITICAL_COUNT, _ALL_HIGH_COUNT = _group_requirements(_PCI_REQUIREMENTS)
+_ALL_DOMAINS: tuple[str, ...] = tuple(_ALL_DOMAIN_GROUPS)
+_ALL_REQUIREMENT_BY_DOMAIN_JSON: bytes = orjson.dumps(_ALL_DOMAIN_GROUPS)
+
 
 class PCIDSSChecker:
     """Validates Payment Card Industry Data Security Standard v4.0 compliance.
@@ -120,24 +419,11 @@ class PCIDSSChecker:
         Returns:
             PCI DSS requirement mapping dict with control details and counts.
         """
-        requirements = _PCI_REQUIREMENTS
+        requirements: Sequence[_PCIRequirement] = _PCI_REQUIREMENTS
         if requirements_to_include:
-            requirements = [r for r in requirements if r["req"] in requirements_to_include]
-
-        domain_groups: dict[str, list[dict[str, Any]]] = {}
-        for requirement in requirements:
-            domain = requirement["domain"]
-            if domain not in domain_groups:
-                domain_groups[domain] = []
-            domain_groups[domain].append({
-                "requirement_number": requirement["req"],
-                "control_id": requirement["control_id"],
-                "description": requirement["description"],
-                "risk_level": requirement["risk"],
-            })
+            requirements = [r for r in requirements if r.req in requirements_to_include]
 
-        critical_count = sum(1 for r in requirements if r["risk"] == "critical")
-        high_count = sum(1 for r in requirements if r["risk"] == "high")
+        domain_groups, critical_count, high_count = _group_requirements(requirements)
 
         mapping = {
             "pci_dss_version": "4.0",
@@ -147,7 +433,7 @@ class PCIDSSChecker:
             "high_requirements": high_count,
             "domains": list(domain_groups.keys()),
             "requirement_by_domain": domain_groups,
-            "mapped_at": datetime.now(timezone.utc).isoformat(),
+            "mapped_at": _utcnow_iso(),
         }
 
         logger.info(
@@ -158,6 +444,49 @@ class PCIDSSChecker:
 
         return mapping
 
+    def map_requirements_json(
+        self,
+        scope_description: str,
+        requirements_to_include: list[str] | None = None,
+        exclude_not_applicable: bool = False,
+    ) -> bytes:
+        """Map applicable PCI DSS v4.0 requirements and return the mapping as JSON.
+
+        Produces the same document as map_requirements. For the full catalogue
+        the pre-serialized requirement_by_domain section is spliced in as raw
+        bytes rather than re-encoded on every call.
+
+        Args:
+            scope_description: Description of the cardholder data environment scope.
+            requirements_to_include: Optional list of requirement numbers to include.
+            exclude_not_applicable: Whether to exclude not-applicable requirements.
+
+        Returns:
+            UTF-8 JSON encoding of the PCI DSS requirement mapping.
+        """
+        if requirements_to_include:
+            return orjson.dumps(
+                self.map_requirements(scope_description, requirements_to_include, exclude_not_applicable)
+            )
+
+        head = orjson.dumps({
+            "pci_dss_version": "4.0",
+            "scope_description": scope_description,
+            "total_requirements": len(_PCI_REQUIREMENTS),
+            "critical_requirements": _ALL_CRITICAL_COUNT,
+            "high_requirements": _ALL_HIGH_COUNT,
+            "domains": _ALL_DOMAINS,
+        })
+        tail = orjson.dumps({"mapped_at": _utcnow_iso()})
+
+        logger.info(
+            "PCI DSS v4.0 requirements mapped",
+            total_requirements=len(_PCI_REQUIREMENTS),
+            critical_requirements=_ALL_CRITICAL_COUNT,
+        )
+
+        return b"".join((head[:-1], b',"requirement_by_domain":', _ALL_REQUIREMENT_BY_DOMAIN_JSON, b",", tail[1:]))
+
     def detect_cardholder_data(
         self,
         sample_text: str,
@@ -178,56 +507,48 @@ class PCIDSSChecker:
         Returns:
             Cardholder data detection report dict.
         """
-        pan_matches = _PAN_PATTERN.findall(sample_text)
-        masked_matches = [m[:6] + "****" + m[-4:] for m in pan_matches]
-
-        chd_keywords = ["cardholder", "PAN", "CVV", "CVC", "expiry", "card number", "track data", "SAD"]
-        keyword_hits = [kw for kw in chd_keywords if kw.lower() in sample_text.lower()]
-
-        flow_risks: list[dict[str, Any]] = []
-        for flow in data_flows:
-            flow_lower = flow.lower()
-            risk_indicators = [
-                kw for kw in ["pan", "card", "cvv", "track", "cardholder", "payment"]
-                if kw in flow_lower
-            ]
-            if risk_indicators:
-                flow_risks.append({
-                    "data_flow": flow,
-                    "risk_indicators": risk_indicators,
-                    "in_scope_pci": True,
-                    "recommendation": "Include this data flow in PCI DSS scope and implement controls",
-                })
-
-        in_scope = len(pan_matches) > 0 or len(keyword_hits) > 0 or len(flow_risks) > 0
-
-        result = {
-            "environment_name": environment_name,
-            "pci_dss_in_scope": in_scope,
-            "potential_pan_patterns_found": len(pan_matches),
-            "masked_pan_samples": masked_matches[:5],
-            "cardholder_data_keywords": keyword_hits,
-            "data_flows_analyzed": len(data_flows),
-            "at_risk_data_flows": flow_risks,
-            "at_risk_flow_count": len(flow_risks),
-            "immediate_actions_required": in_scope,
-            "recommendations": [
-                "Perform formal data flow diagram update to document all CHD touchpoints",
-                "Apply tokenization or encryption to all identified PAN storage",
-                "Implement DLP controls on identified at-risk data flows",
-            ] if in_scope else [],
-            "scanned_at": datetime.now(timezone.utc).isoformat(),
-        }
+        result = _scan_cardholder_data(sample_text, environment_name, data_flows, _utcnow_iso())
+        in_scope = result["pci_dss_in_scope"]
+        pan_count = result["potential_pan_patterns_found"]
 
         logger.info(
             "PCI DSS cardholder data detection complete",
             environment_name=environment_name,
             pci_dss_in_scope=in_scope,
-            pan_patterns_found=len(pan_matches),
+            pan_patterns_found=pan_count,
         )
 
         return result
 
+    def detect_cardholder_data_batch(
+        self,
+        items: list[tuple[str, str, list[str]]],
+    ) -> list[dict[str, Any]]:
+        """Detect potential cardholder data across many environments in one call.
+
+        Equivalent to calling detect_cardholder_data per item, but all reports
+        share one scan timestamp and a single summary log event is emitted.
+
+        Args:
+            items: List of (sample_text, environment_name, data_flows) tuples.
+
+        Returns:
+            Cardholder data detection report dicts, in input order.
+        """
+        scanned_at = _utcnow_iso()
+        results = [
+            _scan_cardholder_data(sample_text, environment_name, data_flows, scanned_at)
+            for sample_text, environment_name, data_flows in items
+        ]
+
+        logger.info(
+            "PCI DSS cardholder data batch detection complete",
+            environments_scanned=len(results),
+            environments_in_scope=sum(1 for r in results if r["pci_dss_in_scope"]),
+        )
+
+        return results
+
     def validate_encryption(
         self,
         encryption_configurations: list[dict[str, Any]],
@@ -272,7 +593,7 @@ class PCIDSSChecker:
                 compliant = False
 
             if algorithm and key_length:
-                alg_family = algorithm.split("-")[0]
+                alg_family = _ALG_FAMILY.get(algorithm) or algorithm.partition("-")[0]
                 min_length = _MIN_KEY_LENGTHS.get(alg_family)
                 if min_length and key_length < min_length:
                     component_findings.append(
@@ -307,9 +628,9 @@ class PCIDSSChecker:
             ),
             "component_findings": findings,
             "pci_requirements_covered": ["3.5.1", "4.2.1", "6.2.4"],
-            "approved_tls_versions": sorted(_APPROVED_TLS_VERSIONS),
-            "approved_algorithms": sorted(_APPROVED_ENCRYPTION_ALGORITHMS),
-            "validated_at": datetime.now(timezone.utc).isoformat(),
+            "approved_tls_versions": list(_APPROVED_TLS_VERSIONS_SORTED),
+            "approved_algorithms": list(_APPROVED_ENCRYPTION_ALGORITHMS_SORTED),
+            "validated_at": _utcnow_iso(),
         }
 
         logger.info(
@@ -344,17 +665,22 @@ class PCIDSSChecker:
         """
         non_compliant_findings: list[dict[str, Any]] = []
         compliant_findings: list[dict[str, Any]] = []
+        cde_systems_without_mfa: list[str] = []
+        mfa_systems = frozenset(mfa_enabled_systems)
 
         for finding in access_control_findings:
+            system = finding.get("system")
             if not finding.get("need_to_know_enforced", True):
                 non_compliant_findings.append({
-                    "system": finding.get("system"),
+                    "system": system,
                     "issue": "Need-to-know access not enforced",
                     "pci_requirement": "7.2.1",
                     "risk_level": "high",
                 })
             elif finding.get("compliant", True):
                 compliant_findings.append(finding)
+            if system not in mfa_systems:
+                cde_systems_without_mfa.append(f"System missing MFA: {system}")
 
         shared_account_violations = [
             {
@@ -367,12 +693,6 @@ class PCIDSSChecker:
         ]
         non_compliant_findings.extend(shared_account_violations)
 
-        cde_systems_without_mfa = [
-            f"System missing MFA: {system}"
-            for system in access_control_findings
-            if system.get("system") not in mfa_enabled_systems
-        ]
-
         if not privileged_access_reviewed:
             non_compliant_findings.append({
                 "issue": "Privileged access review not completed",
@@ -391,7 +711,7 @@ class PCIDSSChecker:
             "systems_potentially_missing_mfa": cde_systems_without_mfa,
             "pci_requirements_covered": ["7.1.1", "7.2.1", "7.3.1", "8.2.1", "8.3.1", "8.4.1"],
             "overall_compliant": len(non_compliant_findings) == 0,
-            "verified_at": datetime.now(timezone.utc).isoformat(),
+            "verified_at": _utcnow_iso(),
         }
 
         logger.info(
@@ -422,14 +742,17 @@ class PCIDSSChecker:
         Returns:
             Network segmentation compliance report dict.
         """
-        cde_segments = [s for s in network_segments if s.get("type") == "CDE"]
-        untrusted_adjacent = [
-            s for s in network_segments
-            if s.get("cde_adjacent") and s.get("type") == "untrusted"
-        ]
-        improperly_isolated = [
-            s for s in cde_segments if not s.get("isolated", True)
-        ]
+        cde_segment_count = 0
+        untrusted_adjacent_count = 0
+        improperly_isolated: list[Any] = []
+        for segment in network_segments:
+            segment_type = segment.get("type")
+            if segment_type == "CDE":
+                cde_segment_count += 1
+                if not segment.get("isolated", True):
+                    improperly_isolated.append(segment.get("name"))
+            elif segment_type == "untrusted" and segment.get("cde_adjacent"):
+                untrusted_adjacent_count += 1
 
         segmentation_valid = len(improperly_isolated) == 0
 
@@ -443,9 +766,9 @@ class PCIDSSChecker:
 
         result = {
             "total_segments_assessed": len(network_segments),
-            "cde_segments_identified": len(cde_segments),
-            "untrusted_cde_adjacent_segments": len(untrusted_adjacent),
-            "improperly_isolated_segments": [s.get("name") for s in improperly_isolated],
+            "cde_segments_identified": cde_segment_count,
+            "untrusted_cde_adjacent_segments": untrusted_adjacent_count,
+            "improperly_isolated_segments": improperly_isolated,
             "network_segmentation_valid": segmentation_valid,
             "firewall_rules_count": firewall_rules_count,
             "firewall_rules_adequate": not insufficient_firewall_rules,
@@ -453,7 +776,7 @@ class PCIDSSChecker:
             "segmentation_test_current": test_current,
             "pci_requirements_covered": ["1.1.1", "1.2.1", "1.3.1", "1.3.2", "1.4.1", "11.4.5"],
             "gaps": [],
-            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checked_at": _utcnow_iso(),
         }
 
         gaps: list[str] = []
@@ -463,15 +786,15 @@ class PCIDSSChecker:
             gaps.append("Network segmentation test is overdue — must be performed annually")
         if insufficient_firewall_rules:
             gaps.append("Firewall rule count appears insufficient for adequate CDE protection")
-        if untrusted_adjacent:
-            gaps.append(f"{len(untrusted_adjacent)} untrusted segment(s) are adjacent to the CDE")
+        if untrusted_adjacent_count:
+            gaps.append(f"{untrusted_adjacent_count} untrusted segment(s) are adjacent to the CDE")
 
         result["gaps"] = gaps
         result["overall_compliant"] = len(gaps) == 0
 
         logger.info(
             "PCI DSS network segmentation check complete",
-            cde_segments=len(cde_segments),
+            cde_segments=cde_segment_count,
             segmentation_valid=segmentation_valid,
             gaps=len(gaps),
         )
@@ -502,24 +825,77 @@ class PCIDSSChecker:
         Returns:
             QSA-ready compliance report dict.
         """
-        compliant = [r for r in control_results if r.get("status") == "compliant"]
-        non_compliant = [r for r in control_results if r.get("status") == "non_compliant"]
-        compensating = [r for r in control_results if r.get("status") == "compensating_control"]
-        not_applicable = [r for r in control_results if r.get("status") == "not_applicable"]
-
-        total_applicable = len(compliant) + len(non_compliant) + len(compensating)
-        compliance_pct = (len(compliant) / total_applicable * 100) if total_applicable > 0 else 100.0
-        qsa_ready = len(non_compliant) == 0
-
-        # Group findings by requirement domain
-        domain_summary: dict[str, dict[str, int]] = {}
+        if not control_results:
+            # Newly onboarded tenants have no assessments yet; fill the fixed template
+            now_iso = _utcnow_iso()
+            empty_report = _EMPTY_PCI_REPORT_TEMPLATE.copy()
+            empty_report.update(
+                report_id=str(uuid.uuid4()),
+                tenant_id=str(tenant_id),
+                scan_id=str(scan_id),
+                scope_description=scope_description,
+                merchant_level=merchant_level,
+                assessment_date=now_iso,
+                assessment_summary=_EMPTY_PCI_ASSESSMENT_SUMMARY.copy(),
+                domain_summary={},
+                non_compliant_findings=[],
+                next_assessment_required_days=90 if merchant_level == 1 else 365,
+                attestation_of_compliance_required=merchant_level == 1,
+                generated_at=now_iso,
+            )
+            logger.info(
+                "PCI DSS compliance report generated",
+                tenant_id=str(tenant_id),
+                scan_id=str(scan_id),
+                compliance_pct=100.0,
+                non_compliant=0,
+                qsa_ready=True,
+            )
+            return empty_report
+
+        compliant_count = 0
+        compensating_count = 0
+        not_applicable_count = 0
+        non_compliant: list[dict[str, Any]] = []
+
+        # Tally statuses and per-domain counts in one pass. Domains get a row index
+        # on first sight and counts accumulate in flat [compliant, non_compliant,
+        # compensating] rows that are projected back to dicts afterwards.
+        domain_index: dict[str, int] = {}
+        domain_counts: list[list[int]] = []
         for result in control_results:
-            domain = result.get("domain", "General")
-            if domain not in domain_summary:
-                domain_summary[domain] = {"compliant": 0, "non_compliant": 0, "compensating": 0}
             status = result.get("status", "")
-            if status in domain_summary[domain]:
-                domain_summary[domain][status] += 1
+            if status == _STATUS_COMPLIANT:
+                compliant_count += 1
+                column = 0
+            elif status == _STATUS_NON_COMPLIANT:
+                non_compliant.append(result)
+                column = 1
+            elif status == _STATUS_COMPENSATING:
+                compensating_count += 1
+                column = 2
+            else:
+                if status == _STATUS_NOT_APPLICABLE:
+                    not_applicable_count += 1
+                column = -1
+
+            domain = result.get("domain", "General")
+            row = domain_index.get(domain)
+            if row is None:
+                row = domain_index[domain] = len(domain_counts)
+                domain_counts.append([0, 0, 0])
+            if column >= 0:
+                domain_counts[row][column] += 1
+
+        domain_summary = {
+            domain: dict(zip(_DOMAIN_SUMMARY_KEYS, domain_counts[row], strict=True))
+            for domain, row in domain_index.items()
+        }
+
+        now_iso = _utcnow_iso()
+        total_applicable = compliant_count + len(non_compliant) + compensating_count
+        compliance_pct = (compliant_count / total_applicable * 100) if total_applicable > 0 else 100.0
+        qsa_ready = len(non_compliant) == 0
 
         report = {
             "report_id": str(uuid.uuid4()),
@@ -528,13 +904,13 @@ class PCIDSSChecker:
             "pci_dss_version": "4.0",
             "scope_description": scope_description,
             "merchant_level": merchant_level,
-            "assessment_date": datetime.now(timezone.utc).isoformat(),
+            "assessment_date": now_iso,
             "assessment_summary": {
                 "total_controls_assessed": len(control_results),
-                "compliant_controls": len(compliant),
+                "compliant_controls": compliant_count,
                 "non_compliant_controls": len(non_compliant),
-                "compensating_controls": len(compensating),
-                "not_applicable_controls": len(not_applicable),
+                "compensating_controls": compensating_count,
+                "not_applicable_controls": not_applicable_count,
                 "compliance_percentage": round(compliance_pct, 2),
                 "qsa_ready": qsa_ready,
             },
@@ -554,7 +930,7 @@ class PCIDSSChecker:
             "attestation_of_compliance_required": merchant_level == 1,
             "report_version": "1.0",
             "pci_ssc_reference": "PCI DSS v4.0, March 2022",
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": now_iso,
         }
 
         logger.info(
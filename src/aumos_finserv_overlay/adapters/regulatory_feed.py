@@ -4,9 +4,14 @@ GAP-293: Regulatory Change Tracking.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
-from datetime import datetime
-from typing import Iterator
+import sys
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from types import MappingProxyType
 
 import httpx
 from lxml import etree
@@ -15,22 +20,111 @@ from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
 
-REGULATOR_FEEDS: dict[str, str] = {
-    "SEC": "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&type=AI&dateb=&owner=include&count=40&search_text=&output=atom",
-    "FINRA": "https://www.finra.org/rules-guidance/notices/rss.xml",
-    "OCC": "https://www.occ.gov/news-issuances/bulletins/index-bulletin.xml",
-    "CFPB": "https://www.consumerfinance.gov/feed/",
-    "FRB": "https://www.federalreserve.gov/feeds/releases.xml",
-}
+# Read-only registries; keys are interned so lookups by regulator / domain
+# name from other interned strings hit the identity fast path
+REGULATOR_FEEDS: MappingProxyType[str, str] = MappingProxyType({
+    sys.intern(regulator): url
+    for regulator, url in {
+        "SEC": "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany&type=AI&dateb=&owner=include&count=40&search_text=&output=atom",
+        "FINRA": "https://www.finra.org/rules-guidance/notices/rss.xml",
+        "OCC": "https://www.occ.gov/news-issuances/bulletins/index-bulletin.xml",
+        "CFPB": "https://www.consumerfinance.gov/feed/",
+        "FRB": "https://www.federalreserve.gov/feeds/releases.xml",
+    }.items()
+})
 
-COMPLIANCE_DOMAIN_KEYWORDS: dict[str, list[str]] = {
-    "SOX": ["sarbanes", "sox", "internal control", "financial reporting", "material weakness"],
-    "SR_11_7": ["model risk", "sr 11-7", "model validation", "supervisory guidance"],
-    "PCI_DSS": ["payment card", "pci", "cardholder data", "data security standard"],
-    "DORA": ["digital operational resilience", "dora", "ict risk", "third-party ict"],
-    "SEC_AI": ["artificial intelligence", "machine learning", "predictive analytics", "robo-advisor"],
-    "AML": ["anti-money laundering", "bsa", "suspicious activity", "currency transaction"],
-}
+COMPLIANCE_DOMAIN_KEYWORDS: MappingProxyType[str, tuple[str, ...]] = MappingProxyType({
+    sys.intern(domain): keywords
+    for domain, keywords in {
+        "SOX": ("sarbanes", "sox", "internal control", "financial reporting", "material weakness"),
+        "SR_11_7": ("model risk", "sr 11-7", "model validation", "supervisory guidance"),
+        "PCI_DSS": ("payment card", "pci", "cardholder data", "data security standard"),
+        "DORA": ("digital operational resilience", "dora", "ict risk", "third-party ict"),
+        "SEC_AI": ("artificial intelligence", "machine learning", "predictive analytics", "robo-advisor"),
+        "AML": ("anti-money laundering", "bsa", "suspicious activity", "currency transaction"),
+    }.items()
+})
+
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+
+# Entry elements streamed out of RSS (<item>) and Atom (<entry>) feeds
+_ENTRY_TAGS: tuple[str, ...] = ("item", f"{{{_ATOM_NS}}}entry")
+
+# Compiled (title, link, published) field extractors per feed dialect. Atom
+# carries the link in the href attribute and EDGAR entries only set <updated>.
+_RSS_FIELD_XPATHS: tuple[etree.XPath, etree.XPath, etree.XPath] = (
+    etree.XPath("string(title)"),
+    etree.XPath("string(link)"),
+    etree.XPath("string(pubDate)"),
+)
+_ATOM_FIELD_XPATHS: tuple[etree.XPath, etree.XPath, etree.XPath] = (
+    etree.XPath("string(atom:title)", namespaces={"atom": _ATOM_NS}),
+    etree.XPath("string(atom:link/@href)", namespaces={"atom": _ATOM_NS}),
+    etree.XPath("string((atom:published|atom:updated)[1])", namespaces={"atom": _ATOM_NS}),
+)
+
+# (domain, UTF-8 keywords) pairs flattened once from COMPLIANCE_DOMAIN_KEYWORDS
+_DOMAIN_KEYWORD_TABLE: tuple[tuple[str, tuple[bytes, ...]], ...] = tuple(
+    (domain, tuple(kw.encode() for kw in keywords)) for domain, keywords in COMPLIANCE_DOMAIN_KEYWORDS.items()
+)
+
+
+def _classify_domains(content: bytes) -> list[str]:
+    """Return the compliance domains whose keywords occur in lowercased content.
+
+    Args:
+        content: ASCII-lowercased UTF-8 encoding of the entry title and URL.
+
+    Returns:
+        Matching domain keys in COMPLIANCE_DOMAIN_KEYWORDS order.
+    """
+    return [domain for domain, keywords in _DOMAIN_KEYWORD_TABLE if any(kw in content for kw in keywords)]
+
+
+def _parse_atom_datetime(value: str) -> datetime:
+    """Parse an Atom RFC 3339 timestamp, accepting the "Z" UTC designator.
+
+    Args:
+        value: Atom published/updated element text.
+
+    Returns:
+        Parsed datetime.
+
+    Raises:
+        ValueError: If value is not an ISO 8601 timestamp.
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+# (entry field extractors, published-date parser) per feed dialect. RSS
+# pubDate is RFC 822 ("Wed, 02 Oct 2002 13:00:00 GMT"), Atom is RFC 3339.
+_RSS_DIALECT: tuple[tuple[etree.XPath, etree.XPath, etree.XPath], Callable[[str], datetime]] = (
+    _RSS_FIELD_XPATHS,
+    parsedate_to_datetime,
+)
+_ATOM_DIALECT: tuple[tuple[etree.XPath, etree.XPath, etree.XPath], Callable[[str], datetime]] = (
+    _ATOM_FIELD_XPATHS,
+    _parse_atom_datetime,
+)
+
+
+def _feed_unchanged_since(last_modified: str, since: datetime) -> bool:
+    """Check whether a feed's Last-Modified header predates the poll window.
+
+    Args:
+        last_modified: HTTP Last-Modified header value.
+        since: Start of the poll window.
+
+    Returns:
+        True if the feed was last modified at or before since; False if it
+        is newer or the header cannot be parsed.
+    """
+    try:
+        return parsedate_to_datetime(last_modified) <= since
+    except (TypeError, ValueError):
+        return False
 
 
 class RegulatoryFeedAdapter:
@@ -42,13 +136,24 @@ class RegulatoryFeedAdapter:
 
     def __init__(self, http_client: httpx.AsyncClient) -> None:
         self._client = http_client
+        # (since, ETag, Last-Modified) of the last fully processed fetch per
+        # regulator, replayed as conditional request headers so unchanged
+        # feeds return 304
+        self._validators: dict[str, tuple[datetime, str | None, str | None]] = {}
 
     async def fetch_updates(self, regulator: str, since: datetime) -> list[dict]:
         """Fetch regulatory updates from a regulator's feed since a given date.
 
+        Requests are conditional on the ETag / Last-Modified validators of the
+        previous successfully parsed fetch for the same regulator, as long as
+        since is not earlier than that fetch's window; a wider window always
+        refetches. A feed the server reports as unchanged, or last modified
+        before since, yields no updates and is not parsed.
+
         Args:
             regulator: Regulator key (SEC, FINRA, OCC, CFPB, FRB).
-            since: Only return updates published after this datetime.
+            since: Only return updates published after this datetime; a naive
+                value is taken as UTC.
 
         Returns:
             List of normalized update dicts with title, url, published_at,
@@ -60,44 +165,116 @@ class RegulatoryFeedAdapter:
         feed_url = REGULATOR_FEEDS.get(regulator)
         if not feed_url:
             raise ValueError(f"Unknown regulator: {regulator}")
-        response = await self._client.get(feed_url, timeout=30.0)
+        # Feed timestamps are compared as UTC-aware, so a naive since is UTC too
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=UTC)
+        headers: dict[str, str] = {}
+        validators = self._validators.get(regulator)
+        # A 304 only means "nothing newer than the validated window", so it is
+        # safe to ask for only when this window does not start earlier
+        if validators is not None and since >= validators[0]:
+            _, etag, last_modified = validators
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = await self._client.get(feed_url, headers=headers, timeout=30.0)
+        if response.status_code == 304:
+            logger.debug("Regulatory feed unchanged", regulator=regulator)
+            return []
         response.raise_for_status()
-        return list(self._parse_feed(response.text, since))
 
-    def _parse_feed(self, xml_text: str, since: datetime) -> Iterator[dict]:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified and _feed_unchanged_since(last_modified, since):
+            updates: list[dict] = []
+        else:
+            updates = list(self._parse_feed(response.content, since))
+
+        # Remember validators only once the body has been fully processed, so a
+        # parse failure is retried in full on the next poll instead of a 304
+        if etag or last_modified:
+            self._validators[regulator] = (since, etag, last_modified)
+        return updates
+
+    async def fetch_all_updates(self, since: datetime) -> dict[str, list[dict]]:
+        """Fetch updates from every regulator feed concurrently.
+
+        All requests share the adapter's client connection pool. A failure
+        on one feed is logged and does not affect the others.
+
+        Args:
+            since: Only return updates published after this datetime.
+
+        Returns:
+            Mapping of regulator key to its new updates. Regulators whose
+            fetch failed are omitted.
+        """
+        regulators = list(REGULATOR_FEEDS)
+        results = await asyncio.gather(
+            *(self.fetch_updates(regulator, since) for regulator in regulators),
+            return_exceptions=True,
+        )
+
+        updates: dict[str, list[dict]] = {}
+        for regulator, result in zip(regulators, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Regulatory feed fetch failed", regulator=regulator, error=str(result))
+                continue
+            updates[regulator] = result
+        return updates
+
+    def _parse_feed(self, xml_bytes: bytes, since: datetime) -> Iterator[dict]:
         """Parse RSS/Atom XML and yield normalized entries.
 
+        Entries are streamed with iterparse and discarded once read, so the
+        full document tree is never held in memory.
+
         Args:
-            xml_text: Raw XML feed content.
+            xml_bytes: Raw XML feed content as received; lxml honours the
+                document's declared encoding.
             since: Filter entries published after this datetime.
 
         Yields:
             Normalized update dicts.
         """
-        root = etree.fromstring(xml_text.encode())
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-        entries = root.findall(".//item") or root.findall(".//atom:entry", ns)
+        context = etree.iterparse(BytesIO(xml_bytes), events=("end",), tag=_ENTRY_TAGS)
+        dialect: tuple[tuple[etree.XPath, etree.XPath, etree.XPath], Callable[[str], datetime]] | None = None
+
+        for _, entry in context:
+            if dialect is None:
+                # A feed is either RSS or Atom; pick the dialect from the first entry
+                dialect = _RSS_DIALECT if entry.tag == "item" else _ATOM_DIALECT
+            (title_xpath, link_xpath, published_xpath), parse_published = dialect
+            title = title_xpath(entry).strip()
+            url = link_xpath(entry).strip()
+            pub_str = published_xpath(entry).strip()
 
-        for entry in entries:
-            title = (entry.findtext("title") or entry.findtext("atom:title", namespaces=ns) or "").strip()
-            url = (entry.findtext("link") or entry.findtext("atom:link", namespaces=ns) or "").strip()
-            pub_str = entry.findtext("pubDate") or entry.findtext("atom:published", namespaces=ns) or ""
+            # Drop the processed entry and its already-seen siblings so memory
+            # stays bounded by a single entry regardless of feed size
+            entry.clear()
+            while entry.getprevious() is not None:
+                del entry.getparent()[0]
 
             try:
-                pub_dt = datetime.fromisoformat(pub_str.replace("Z", "+00:00"))
-            except ValueError:
+                pub_dt = parse_published(pub_str)
+            except (TypeError, ValueError):
                 continue
+            if pub_dt.tzinfo is None:
+                # RFC 822 "-0000" and offset-less ISO timestamps are UTC by convention
+                pub_dt = pub_dt.replace(tzinfo=UTC)
 
             if pub_dt <= since:
                 continue
 
-            content = f"{title} {url}".lower()
-            content_hash = hashlib.sha256(content.encode()).hexdigest()
-            affected_domains = [
-                domain
-                for domain, keywords in COMPLIANCE_DOMAIN_KEYWORDS.items()
-                if any(kw in content for kw in keywords)
-            ]
+            # Keywords are ASCII, so one bytes.lower() pass over the encoded text
+            # serves both fingerprinting and keyword search
+            content = f"{title} {url}".encode("utf-8", "ignore").lower()
+            # Dedup fingerprint only: 128-bit BLAKE2b is collision-safe for this
+            # purpose and cheaper than SHA-256 on short inputs
+            content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+            affected_domains = _classify_domains(content)
 
             yield {
                 "title": title,
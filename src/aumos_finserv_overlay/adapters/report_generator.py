@@ -5,12 +5,21 @@ for submission to SEC, CFPB, FINRA, OCC, FDIC, and FRB. Uses Jinja2
 for templating and ReportLab for PDF generation.
 """
 
-import json
+import asyncio
+import re
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
+from io import BytesIO
 from typing import Any
 
+import orjson
 from aumos_common.observability import get_logger
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from lxml import etree
+from reportlab.lib.pagesizes import LETTER
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Preformatted, SimpleDocTemplate
 
 from aumos_finserv_overlay.api.schemas import RegulatoryBody, RegulatoryReportRequest, ReportType
 from aumos_finserv_overlay.settings import Settings
@@ -40,6 +49,127 @@ _PAGE_COUNTS: dict[str, int] = {
     ReportType.SOX_ATTESTATION.value: 15,
 }
 
+# Model risk tiers counted as material AI risks in the SEC disclosure
+_HIGH_RISK_TIERS: frozenset[str] = frozenset({"high", "critical"})
+
+# Report payload JSON encoding: naive datetimes treated as UTC. Human-readable
+# formats (JSON, PDF) are indented; the XBRL-embedded copy is machine-read.
+_COMPACT_JSON_OPTIONS = orjson.OPT_NAIVE_UTC
+_JSON_OPTIONS = _COMPACT_JSON_OPTIONS | orjson.OPT_INDENT_2
+
+# Plain-text report body; a file of the same name in report_template_dir overrides it
+_TEXT_TEMPLATE_NAME = "regulatory_report.txt.j2"
+_DEFAULT_TEXT_TEMPLATE = """\
+REGULATORY REPORT — {{ regulator }}
+Report Type: {{ report_type }}
+Entity: {{ entity_name }}
+Reporting Period: {{ period_start }} to {{ period_end }}
+Generated: {{ generated_at }}
+
+{{ rule }}
+REPORT CONTENT
+{{ rule }}
+{{ payload }}
+"""
+_TEXT_RULE = "=" * 60
+
+# Monospaced body for PDF reports. Courier 8pt fits ~97 columns within the
+# default letter-size frame; longer lines are wrapped at _PDF_MAX_LINE_LENGTH.
+_PDF_TEXT_STYLE = ParagraphStyle("ReportText", fontName="Courier", fontSize=8, leading=10)
+_PDF_MAX_LINE_LENGTH: int = 96
+
+# Compiled templates retained per process; templates never change at runtime
+_TEMPLATE_CACHE_SIZE: int = 512
+
+_XBRL_NS = "http://www.xbrl.org/2003/instance"
+_XBRL_TAG = f"{{{_XBRL_NS}}}xbrl"
+_XBRL_METADATA_TAG = f"{{{_XBRL_NS}}}metadata"
+
+# XML comments may not contain "--" or end with "-"
+_COMMENT_DASHES = re.compile(r"-(?=-)")
+
+# Code points outside the XML 1.0 Char production, which lxml refuses to serialise
+_XML_ILLEGAL_CHARS = re.compile("[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]")
+
+
+def _xml_comment(text: str) -> etree._Comment:
+    """Build an XML comment node, neutralising sequences comments cannot hold.
+
+    Dash runs are split with spaces, and code points XML cannot represent
+    (e.g. control characters) are replaced with U+FFFD.
+
+    Args:
+        text: Comment text, possibly containing user-supplied values.
+
+    Returns:
+        lxml comment node padded with a space on each side.
+    """
+    text = _XML_ILLEGAL_CHARS.sub("\ufffd", text)
+    return etree.Comment(f" {_COMMENT_DASHES.sub('- ', text)} ")
+
+
+def _xml_safe_json(payload: bytes) -> str:
+    """Decode a JSON document into text lxml will accept as element content.
+
+    orjson already escapes control characters; the non-characters it emits
+    verbatim (U+FFFE, U+FFFF) are rewritten as equivalent JSON escapes.
+
+    Args:
+        payload: UTF-8 encoded JSON document.
+
+    Returns:
+        JSON text containing only XML-compatible code points.
+    """
+    return _XML_ILLEGAL_CHARS.sub(lambda match: f"\\u{ord(match[0]):04x}", payload.decode("utf-8"))
+
+
+def _render_pdf(text: str, title: str) -> bytes:
+    """Lay out pre-rendered report text as a paginated PDF.
+
+    Args:
+        text: Report body, drawn verbatim in a monospaced font.
+        title: PDF document title metadata.
+
+    Returns:
+        PDF document bytes.
+    """
+    buffer = BytesIO()
+    document = SimpleDocTemplate(buffer, pagesize=LETTER, title=title, author="AumOS Financial Services Overlay")
+    document.build([Preformatted(text, _PDF_TEXT_STYLE, maxLineLength=_PDF_MAX_LINE_LENGTH)])
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _create_template_environment(template_dir: str, bytecode_cache_dir: str | None) -> Environment:
+    """Build the Jinja2 environment used to render report templates.
+
+    The environment is built once per process for the configured
+    directories, and its templates are compiled once (auto_reload is off).
+    When bytecode_cache_dir is set, compiled bytecode also persists across
+    restarts.
+
+    Args:
+        template_dir: Directory whose templates override the built-in defaults.
+        bytecode_cache_dir: Optional directory for persisted template bytecode.
+
+    Returns:
+        Environment resolving templates from template_dir, falling back to
+        the built-in defaults.
+    """
+    bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir) if bytecode_cache_dir else None
+    return Environment(
+        loader=ChoiceLoader(
+            [
+                FileSystemLoader(template_dir),
+                DictLoader({_TEXT_TEMPLATE_NAME: _DEFAULT_TEXT_TEMPLATE}),
+            ]
+        ),
+        autoescape=False,  # plain-text output; XBRL escaping is handled by lxml
+        auto_reload=False,
+        cache_size=_TEMPLATE_CACHE_SIZE,
+        bytecode_cache=bytecode_cache,
+    )
+
 
 class ReportGenerator:
     """Generates regulatory report documents.
@@ -56,6 +186,9 @@ class ReportGenerator:
             settings: Service settings with template directory and regulator list.
         """
         self._settings = settings
+        self._text_template: Template = _create_template_environment(
+            settings.report_template_dir, settings.report_template_cache_dir
+        ).get_template(_TEXT_TEMPLATE_NAME)
 
     def _build_json_report(
         self,
@@ -63,7 +196,9 @@ class ReportGenerator:
         tenant_id: uuid.UUID,
         model_assessments: list[dict[str, Any]],
         sox_evidence_items: list[dict[str, Any]],
-        generated_at: datetime,
+        model_assessments_raw: bytes | None,
+        sox_evidence_items_raw: bytes | None,
+        generated_iso: str,
     ) -> dict[str, Any]:
         """Build structured JSON report payload.
 
@@ -72,19 +207,27 @@ class ReportGenerator:
             tenant_id: Tenant owning the report.
             model_assessments: SR 11-7 model assessment summaries.
             sox_evidence_items: SOX evidence item summaries.
-            generated_at: Report generation timestamp.
+            model_assessments_raw: Pre-encoded JSON array embedded verbatim in place of
+                model_assessments, which still supplies the summary counts.
+            sox_evidence_items_raw: Pre-encoded JSON array embedded verbatim in place of
+                sox_evidence_items, which still supplies the summary counts.
+            generated_iso: ISO 8601 report generation timestamp.
 
         Returns:
             Report payload as Python dict (will be JSON-serialised).
         """
+        period_start_iso = request.reporting_period_start.isoformat()
+        period_end_iso = request.reporting_period_end.isoformat()
+        period_end_ym = request.reporting_period_end.strftime("%Y-%m")
+
         report: dict[str, Any] = {
             "report_metadata": {
                 "regulator": request.regulator.value,
                 "report_type": request.report_type.value,
                 "entity_name": request.entity_name,
-                "reporting_period_start": request.reporting_period_start.isoformat(),
-                "reporting_period_end": request.reporting_period_end.isoformat(),
-                "generated_at": generated_at.isoformat(),
+                "reporting_period_start": period_start_iso,
+                "reporting_period_end": period_end_iso,
+                "generated_at": generated_iso,
                 "tenant_id": str(tenant_id),
                 "aumos_version": "0.1.0",
             },
@@ -96,33 +239,48 @@ class ReportGenerator:
 
         # SEC AI disclosure section
         if request.include_ai_disclosure:
+            high_risk_models = 0
+            models_in_validation = 0
+            for model in model_assessments:
+                if model.get("risk_tier") in _HIGH_RISK_TIERS:
+                    high_risk_models += 1
+                if model.get("validation_status") == "in_validation":
+                    models_in_validation += 1
+
             report["ai_governance_disclosure"] = {
                 "sec_guidance_version": self._settings.sec_ai_guidance_version,
-                "disclosure_date": generated_at.isoformat(),
+                "disclosure_date": generated_iso,
                 "model_inventory_summary": {
                     "total_models": len(model_assessments),
-                    "high_risk_models": sum(
-                        1 for m in model_assessments if m.get("risk_tier") in ("high", "critical")
+                    "high_risk_models": high_risk_models,
+                    "models_in_validation": models_in_validation,
+                    "models": (
+                        orjson.Fragment(model_assessments_raw)
+                        if model_assessments_raw is not None
+                        else model_assessments
                     ),
-                    "models_in_validation": sum(
-                        1 for m in model_assessments if m.get("validation_status") == "in_validation"
-                    ),
-                    "models": model_assessments,
                 },
-                "material_ai_risks_identified": any(
-                    m.get("risk_tier") in ("high", "critical") for m in model_assessments
-                ),
+                "material_ai_risks_identified": high_risk_models > 0,
                 "risk_management_framework": "SR 11-7 (Federal Reserve / OCC)",
             }
 
         # SOX attestation section
         if sox_evidence_items:
+            approved_controls = 0
+            for item in sox_evidence_items:
+                if item.get("status") == "approved":
+                    approved_controls += 1
+
             report["sox_attestation"] = {
                 "total_controls": len(sox_evidence_items),
-                "approved_controls": sum(1 for e in sox_evidence_items if e.get("status") == "approved"),
-                "evidence_items": sox_evidence_items,
-                "attestation_period_start": request.reporting_period_start.isoformat(),
-                "attestation_period_end": request.reporting_period_end.isoformat(),
+                "approved_controls": approved_controls,
+                "evidence_items": (
+                    orjson.Fragment(sox_evidence_items_raw)
+                    if sox_evidence_items_raw is not None
+                    else sox_evidence_items
+                ),
+                "attestation_period_start": period_start_iso,
+                "attestation_period_end": period_end_iso,
                 "control_framework": self._settings.sox_control_framework,
             }
 
@@ -130,13 +288,13 @@ class ReportGenerator:
         if request.regulator == RegulatoryBody.FINRA:
             report["finra_focus"] = {
                 "crd_number": request.entity_crd_number,
-                "report_period": request.reporting_period_end.strftime("%Y-%m"),
+                "report_period": period_end_ym,
                 "filing_type": "Annual" if request.report_type == ReportType.FORM_10K else "Quarterly",
             }
         elif request.regulator == RegulatoryBody.CFPB:
             report["cfpb_section"] = {
                 "consumer_protection_attestation": True,
-                "reporting_period": request.reporting_period_end.strftime("%Y-%m"),
+                "reporting_period": period_end_ym,
             }
 
         # Additional custom sections
@@ -151,6 +309,8 @@ class ReportGenerator:
         tenant_id: uuid.UUID,
         model_assessments: list[dict[str, Any]],
         sox_evidence_items: list[dict[str, Any]],
+        model_assessments_raw: bytes | None = None,
+        sox_evidence_items_raw: bytes | None = None,
     ) -> tuple[bytes, str, int]:
         """Render a regulatory report document.
 
@@ -162,11 +322,16 @@ class ReportGenerator:
             tenant_id: Tenant owning the report.
             model_assessments: SR 11-7 model summaries for AI disclosure section.
             sox_evidence_items: SOX evidence summaries for attestation section.
+            model_assessments_raw: Pre-encoded JSON array embedded verbatim in place of
+                model_assessments, which still supplies the summary counts.
+            sox_evidence_items_raw: Pre-encoded JSON array embedded verbatim in place of
+                sox_evidence_items, which still supplies the summary counts.
 
         Returns:
             Tuple of (document bytes, format string, estimated page count).
         """
-        generated_at = datetime.now(timezone.utc)
+        # Captured and formatted once; every section and envelope reuses the string
+        generated_iso = datetime.now(timezone.utc).isoformat()
         report_format = _REGULATOR_FORMAT.get(request.regulator.value, "PDF")
         page_count = _PAGE_COUNTS.get(request.report_type.value, 20)
 
@@ -182,44 +347,41 @@ class ReportGenerator:
             tenant_id=tenant_id,
             model_assessments=model_assessments,
             sox_evidence_items=sox_evidence_items,
-            generated_at=generated_at,
+            model_assessments_raw=model_assessments_raw,
+            sox_evidence_items_raw=sox_evidence_items_raw,
+            generated_iso=generated_iso,
         )
 
-        # Serialise to requested format
         if report_format == "JSON":
-            document_bytes = json.dumps(report_payload, indent=2, default=str).encode("utf-8")
+            document_bytes = orjson.dumps(report_payload, default=str, option=_JSON_OPTIONS)
         elif report_format == "XBRL":
-            # XBRL wraps the JSON payload in an XML envelope
-            json_str = json.dumps(report_payload, indent=2, default=str)
-            xbrl_content = (
-                '<?xml version="1.0" encoding="UTF-8"?>\n'
-                '<xbrl xmlns="http://www.xbrl.org/2003/instance">\n'
-                "  <!-- AumOS Financial Services Overlay — XBRL Report -->\n"
-                f"  <!-- Generated: {generated_at.isoformat()} -->\n"
-                f"  <!-- Regulator: {request.regulator.value} -->\n"
-                f"  <!-- Entity: {request.entity_name} -->\n"
-                "  <metadata>\n"
-                f"    {json_str}\n"
-                "  </metadata>\n"
-                "</xbrl>\n"
-            )
-            document_bytes = xbrl_content.encode("utf-8")
+            # XBRL wraps the JSON payload in an XML envelope. lxml escapes the
+            # payload and user-supplied values while serialising in C.
+            root = etree.Element(_XBRL_TAG, nsmap={None: _XBRL_NS})
+            root.append(_xml_comment("AumOS Financial Services Overlay — XBRL Report"))
+            root.append(_xml_comment(f"Generated: {generated_iso}"))
+            root.append(_xml_comment(f"Regulator: {request.regulator.value}"))
+            root.append(_xml_comment(f"Entity: {request.entity_name}"))
+            metadata = etree.SubElement(root, _XBRL_METADATA_TAG)
+            metadata.text = _xml_safe_json(orjson.dumps(report_payload, default=str, option=_COMPACT_JSON_OPTIONS))
+            document_bytes = etree.tostring(root, xml_declaration=True, encoding="UTF-8", pretty_print=True)
         else:
-            # PDF: generate a structured text representation as bytes
-            # In production, this would use ReportLab or WeasyPrint
-            lines = [
-                f"REGULATORY REPORT — {request.regulator.value}",
-                f"Report Type: {request.report_type.value}",
-                f"Entity: {request.entity_name}",
-                f"Reporting Period: {request.reporting_period_start.date()} to {request.reporting_period_end.date()}",
-                f"Generated: {generated_at.isoformat()}",
-                "",
-                "=" * 60,
-                "REPORT CONTENT",
-                "=" * 60,
-                json.dumps(report_payload, indent=2, default=str),
-            ]
-            document_bytes = "\n".join(lines).encode("utf-8")
+            payload_json = orjson.dumps(report_payload, default=str, option=_JSON_OPTIONS)
+            # PDF: render the text body once, then let ReportLab paginate it
+            report_text = self._text_template.render(
+                regulator=request.regulator.value,
+                report_type=request.report_type.value,
+                entity_name=request.entity_name,
+                period_start=request.reporting_period_start.date(),
+                period_end=request.reporting_period_end.date(),
+                generated_at=generated_iso,
+                rule=_TEXT_RULE,
+                payload=payload_json.decode("utf-8"),
+            )
+            # ReportLab layout is synchronous and CPU-bound; keep it off the event loop
+            document_bytes = await asyncio.to_thread(
+                _render_pdf, report_text, title=f"{request.regulator.value} {request.report_type.value}"
+            )
 
         logger.info(
             "Report document generated",
@@ -2,14 +2,22 @@
 
 Each repository provides tenant-isolated CRUD operations for a single
 aggregate root model, using asyncpg-backed async sessions.
+
+Fixed-shape lookups and updates are wrapped in lambda_stmt so the statement
+tree is built once per call site and later calls only rebind parameters.
 """
 
+import base64
 import uuid
-from typing import Any
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
 
-from sqlalchemy import select, update
+from sqlalchemy import ColumnElement, Insert, bindparam, func, insert, inspect, lambda_stmt, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from aumos_common.database import AumOSModel
 from aumos_common.observability import get_logger
 
 from aumos_finserv_overlay.core.models import (
@@ -23,6 +31,200 @@ from aumos_finserv_overlay.core.models import (
 
 logger = get_logger(__name__)
 
+# Rows fetched per server-side cursor round trip when streaming listings
+_STREAM_YIELD_PER: int = 200
+
+# Mapped model type handled by the shared query helpers
+_M = TypeVar("_M", bound=AumOSModel)
+
+
+def _column_values(instance: AumOSModel) -> dict[str, Any]:
+    """Collect the column attributes set on a transient ORM instance.
+
+    Unset attributes are omitted so column defaults apply on INSERT.
+
+    Args:
+        instance: Mapped instance that has not been added to a session.
+
+    Returns:
+        Mapping of mapped attribute key to value, suitable for insert().
+    """
+    state = inspect(instance)
+    return {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+
+
+async def _insert_returning(session: AsyncSession, instance: _M) -> _M:
+    """Insert a transient ORM instance and load the stored row in one round trip.
+
+    Replaces add/flush/refresh, which issues the INSERT and then a SELECT to
+    read back server-generated columns.
+
+    Args:
+        session: Async session to execute on.
+        instance: Mapped instance that has not been added to a session.
+
+    Returns:
+        Persisted instance of the same class with all columns populated.
+    """
+    model = type(instance)
+    stmt = insert(model).values(**_column_values(instance)).returning(model)
+    return (await session.execute(stmt)).scalar_one()
+
+
+def _unnest_insert(model: type[AumOSModel], rows: Sequence[Mapping[str, Any]]) -> Insert:
+    """Build INSERT ... SELECT unnest(...) RETURNING for a batch of rows.
+
+    Each column travels as one array parameter, so the statement text and
+    its prepared plan are identical for every batch size, and the bind
+    parameter count is the column count rather than rows x columns.
+    Columns the rows leave unset take their Python-side default per row;
+    columns with only a server default (e.g. created_at) are left to the
+    database.
+
+    Args:
+        model: Mapped class to insert into.
+        rows: Attribute values per row, keyed by mapped attribute name.
+
+    Returns:
+        ORM-enabled insert returning the persisted model instances.
+    """
+    column_names: list[str] = []
+    arrays: list[Any] = []
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        default = column.default
+        if default is None and column.server_default is not None and not any(attr.key in row for row in rows):
+            continue
+        if default is None or default.is_clause_element or default.is_sequence:
+            values = [row.get(attr.key) for row in rows]
+        elif default.is_callable:
+            values = [row[attr.key] if attr.key in row else default.arg(None) for row in rows]
+        else:
+            values = [row.get(attr.key, default.arg) for row in rows]
+        column_names.append(column.name)
+        arrays.append(func.unnest(bindparam(None, values, type_=ARRAY(column.type))))
+
+    return insert(model).from_select(column_names, select(*arrays), include_defaults=False).returning(model)
+
+
+def encode_page_cursor(created_at: datetime, record_id: uuid.UUID) -> str:
+    """Encode a keyset pagination position as an opaque URL-safe token.
+
+    Args:
+        created_at: created_at of the last record on the current page.
+        record_id: id of the last record on the current page.
+
+    Returns:
+        Base64url token to hand back to API clients.
+    """
+    raw = f"{created_at.isoformat()}|{record_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_page_cursor(token: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a token produced by encode_page_cursor.
+
+    Args:
+        token: Opaque cursor token from an API client.
+
+    Returns:
+        The (created_at, id) position to pass as a list_by_tenant cursor.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        created_at, _, record_id = base64.urlsafe_b64decode(token.encode("ascii")).decode().partition("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(record_id)
+    except (UnicodeError, ValueError) as exc:
+        raise ValueError(f"Invalid page cursor: {token!r}") from exc
+
+
+async def _fetch_page(
+    session: AsyncSession,
+    model: type[_M],
+    filters: Sequence[ColumnElement[bool]],
+    page: int,
+    page_size: int,
+    cursor: tuple[datetime, uuid.UUID] | None = None,
+) -> tuple[list[_M], int, tuple[datetime, uuid.UUID] | None]:
+    """Fetch one page of ORM rows together with the total filtered row count.
+
+    Rows are ordered newest first on (created_at, id). Without a cursor the
+    page is selected with OFFSET and the total comes from a count(*) OVER ()
+    window. With a cursor the query seeks directly past that position, which
+    costs the same at any depth, and the total comes from an uncorrelated
+    scalar subquery because the window would only see rows after the cursor.
+    Either way page and total share a single round trip. Counts apply the
+    filters straight to the table rather than wrapping the data query in a
+    derived table, so the planner can answer them from an index alone.
+
+    Args:
+        session: Async session to execute on.
+        model: Mapped class to select.
+        filters: Tenant and filter criteria, applied to the data and count queries alike.
+        page: 1-based page number; ignored when cursor is given.
+        page_size: Records per page.
+        cursor: (created_at, id) of the last record of the previous page.
+
+    Returns:
+        Tuple of (records list, total count, next cursor). The next cursor is
+        the last record's (created_at, id) when the page is full, else None.
+    """
+    ordered_stmt = select(model).where(*filters).order_by(model.created_at.desc(), model.id.desc()).limit(page_size)
+    count_stmt = select(func.count()).select_from(model).where(*filters)
+    if cursor is None:
+        data_stmt = ordered_stmt.add_columns(func.count().over().label("total")).offset((page - 1) * page_size)
+    else:
+        total_stmt = count_stmt.correlate(None).scalar_subquery()
+        data_stmt = ordered_stmt.add_columns(total_stmt.label("total")).where(
+            tuple_(model.created_at, model.id) < tuple_(*cursor)
+        )
+
+    rows = (await session.execute(data_stmt)).all()
+    if rows:
+        records = [row[0] for row in rows]
+        last = records[-1]
+        next_cursor = (last.created_at, last.id) if len(records) == page_size else None
+        return records, rows[0].total, next_cursor
+    if page == 1 and cursor is None:
+        return [], 0, None
+
+    # A page past the end has no row to read the total from
+    total = (await session.execute(count_stmt)).scalar_one()
+    return [], total, None
+
+
+async def _stream_records(
+    session: AsyncSession,
+    model: type[_M],
+    filters: Sequence[ColumnElement[bool]],
+    cursor: tuple[datetime, uuid.UUID] | None = None,
+) -> AsyncIterator[_M]:
+    """Stream ORM rows newest first without materialising the result set.
+
+    Rows are pulled from a server-side cursor _STREAM_YIELD_PER at a time, so
+    memory stays bounded and the first rows are available immediately.
+
+    Args:
+        session: Async session to execute on.
+        model: Mapped class to select.
+        filters: Tenant and filter criteria to apply.
+        cursor: Optional keyset position (created_at, id) to resume after.
+
+    Yields:
+        Mapped instances ordered by (created_at, id) descending.
+    """
+    stmt = select(model).where(*filters).order_by(model.created_at.desc(), model.id.desc()).execution_options(
+        yield_per=_STREAM_YIELD_PER
+    )
+    if cursor is not None:
+        stmt = stmt.where(tuple_(model.created_at, model.id) < tuple_(*cursor))
+
+    result = await session.stream_scalars(stmt)
+    async for record in result:
+        yield record
+
 
 class SOXEvidenceRepository:
     """Repository for fsv_sox_evidence table operations."""
@@ -44,9 +246,7 @@ class SOXEvidenceRepository:
         Returns:
             Persisted SOXEvidence with id and timestamps populated.
         """
-        self._session.add(evidence)
-        await self._session.flush()
-        await self._session.refresh(evidence)
+        evidence = await _insert_returning(self._session, evidence)
         logger.debug("Created SOX evidence", evidence_id=str(evidence.id))
         return evidence
 
@@ -64,9 +264,11 @@ class SOXEvidenceRepository:
         Returns:
             SOXEvidence instance or None if not found / wrong tenant.
         """
-        stmt = select(SOXEvidence).where(
-            SOXEvidence.id == evidence_id,
-            SOXEvidence.tenant_id == tenant_id,
+        stmt = lambda_stmt(
+            lambda: select(SOXEvidence).where(
+                SOXEvidence.id == evidence_id,
+                SOXEvidence.tenant_id == tenant_id,
+            )
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
@@ -77,36 +279,51 @@ class SOXEvidenceRepository:
         control_area: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[SOXEvidence], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[SOXEvidence], int, tuple[datetime, uuid.UUID] | None]:
         """List SOX evidence records for a tenant with optional area filter.
 
         Args:
             tenant_id: Tenant identifier.
             control_area: Optional COSO control area filter.
-            page: 1-based page number.
+            page: 1-based page number; ignored when cursor is given.
             page_size: Records per page.
+            cursor: Keyset position (created_at, id) of the previous page's
+                last record; see decode_page_cursor.
 
         Returns:
-            Tuple of (records list, total count).
+            Tuple of (records list, total count, next cursor); pass the next
+            cursor back to fetch the following page, None on the last page.
         """
-        from sqlalchemy import func
-
-        base_stmt = select(SOXEvidence).where(SOXEvidence.tenant_id == tenant_id)
+        filters = [SOXEvidence.tenant_id == tenant_id]
         if control_area is not None:
-            base_stmt = base_stmt.where(SOXEvidence.control_area == control_area)
+            filters.append(SOXEvidence.control_area == control_area)
 
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total_result = await self._session.execute(count_stmt)
-        total = total_result.scalar_one()
+        return await _fetch_page(self._session, SOXEvidence, filters, page, page_size, cursor)
 
-        data_stmt = (
-            base_stmt.order_by(SOXEvidence.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
-        data_result = await self._session.execute(data_stmt)
-        records = list(data_result.scalars().all())
-        return records, total
+    def stream_by_tenant(
+        self,
+        tenant_id: uuid.UUID,
+        control_area: str | None = None,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> AsyncIterator[SOXEvidence]:
+        """Stream all matching records for a tenant, newest first.
+
+        Unpaginated counterpart of list_by_tenant for callers that walk every
+        row (e.g. SOXComplianceService.get_status) and need no page total.
+
+        Args:
+            tenant_id: Tenant identifier.
+            control_area: Optional COSO control area filter.
+            cursor: Optional keyset position (created_at, id) to resume after.
+
+        Returns:
+            Async iterator over matching records.
+        """
+        filters = [SOXEvidence.tenant_id == tenant_id]
+        if control_area is not None:
+            filters.append(SOXEvidence.control_area == control_area)
+        return _stream_records(self._session, SOXEvidence, filters, cursor)
 
     async def update_status(self, evidence_id: uuid.UUID, status: str) -> None:
         """Update the review status of a SOX evidence record.
@@ -115,13 +332,29 @@ class SOXEvidenceRepository:
             evidence_id: Evidence record UUID.
             status: New status value.
         """
-        stmt = (
-            update(SOXEvidence)
-            .where(SOXEvidence.id == evidence_id)
-            .values(status=status)
+        stmt = lambda_stmt(
+            lambda: (
+                update(SOXEvidence)
+                .where(SOXEvidence.id == evidence_id)
+                .values(status=status)
+            )
         )
         await self._session.execute(stmt)
 
+    async def update_status_many(self, statuses: Mapping[uuid.UUID, str]) -> None:
+        """Update the review status of many SOX evidence records in one statement.
+
+        Args:
+            statuses: New status value keyed by evidence record UUID.
+        """
+        if not statuses:
+            return
+        # ORM bulk UPDATE by primary key: one executemany round trip
+        await self._session.execute(
+            update(SOXEvidence),
+            [{"id": evidence_id, "status": status} for evidence_id, status in statuses.items()],
+        )
+
 
 class ModelRiskRepository:
     """Repository for fsv_model_risk_assessments table operations."""
@@ -138,9 +371,7 @@ class ModelRiskRepository:
         Returns:
             Persisted instance with id and timestamps.
         """
-        self._session.add(assessment)
-        await self._session.flush()
-        await self._session.refresh(assessment)
+        assessment = await _insert_returning(self._session, assessment)
         logger.debug("Created model risk assessment", assessment_id=str(assessment.id))
         return assessment
 
@@ -158,9 +389,11 @@ class ModelRiskRepository:
         Returns:
             ModelRiskAssessment or None.
         """
-        stmt = select(ModelRiskAssessment).where(
-            ModelRiskAssessment.id == assessment_id,
-            ModelRiskAssessment.tenant_id == tenant_id,
+        stmt = lambda_stmt(
+            lambda: select(ModelRiskAssessment).where(
+                ModelRiskAssessment.id == assessment_id,
+                ModelRiskAssessment.tenant_id == tenant_id,
+            )
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
@@ -171,36 +404,27 @@ class ModelRiskRepository:
         risk_tier: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[ModelRiskAssessment], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[ModelRiskAssessment], int, tuple[datetime, uuid.UUID] | None]:
         """List model risk assessments for a tenant.
 
         Args:
             tenant_id: Tenant identifier.
             risk_tier: Optional tier filter.
-            page: 1-based page number.
+            page: 1-based page number; ignored when cursor is given.
             page_size: Records per page.
+            cursor: Keyset position (created_at, id) of the previous page's
+                last record; see decode_page_cursor.
 
         Returns:
-            Tuple of (records list, total count).
+            Tuple of (records list, total count, next cursor); pass the next
+            cursor back to fetch the following page, None on the last page.
         """
-        from sqlalchemy import func
-
-        base_stmt = select(ModelRiskAssessment).where(
-            ModelRiskAssessment.tenant_id == tenant_id
-        )
+        filters = [ModelRiskAssessment.tenant_id == tenant_id]
         if risk_tier is not None:
-            base_stmt = base_stmt.where(ModelRiskAssessment.risk_tier == risk_tier)
+            filters.append(ModelRiskAssessment.risk_tier == risk_tier)
 
-        count_stmt = select(func.count()).select_from(base_stmt.subquery())
-        total = (await self._session.execute(count_stmt)).scalar_one()
-
-        data_stmt = (
-            base_stmt.order_by(ModelRiskAssessment.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
-        records = list((await self._session.execute(data_stmt)).scalars().all())
-        return records, total
+        return await _fetch_page(self._session, ModelRiskAssessment, filters, page, page_size, cursor)
 
     async def update_validation_status(
         self,
@@ -213,13 +437,31 @@ class ModelRiskRepository:
             assessment_id: Assessment UUID.
             status: New validation status.
         """
-        stmt = (
-            update(ModelRiskAssessment)
-            .where(ModelRiskAssessment.id == assessment_id)
-            .values(validation_status=status)
+        stmt = lambda_stmt(
+            lambda: (
+                update(ModelRiskAssessment)
+                .where(ModelRiskAssessment.id == assessment_id)
+                .values(validation_status=status)
+            )
         )
         await self._session.execute(stmt)
 
+    async def update_validation_status_many(self, statuses: Mapping[uuid.UUID, str]) -> None:
+        """Update validation status of many model risk assessments in one statement.
+
+        Args:
+            statuses: New validation status keyed by assessment UUID.
+        """
+        if not statuses:
+            return
+        await self._session.execute(
+            update(ModelRiskAssessment),
+            [
+                {"id": assessment_id, "validation_status": status}
+                for assessment_id, status in statuses.items()
+            ],
+        )
+
 
 class PCIDSSRepository:
     """Repository for fsv_pci_controls table operations."""
@@ -241,23 +483,23 @@ class PCIDSSRepository:
             controls: PCIDSSControl ORM instances to persist.
 
         Returns:
-            List of persisted instances.
+            List of persisted instances with server-generated columns populated.
         """
-        for control in controls:
-            control.scan_id = scan_id
-            control.tenant_id = tenant_id
-            self._session.add(control)
+        if not controls:
+            return []
 
-        await self._session.flush()
-        for control in controls:
-            await self._session.refresh(control)
+        # One INSERT ... SELECT unnest(...) RETURNING populates ids and
+        # timestamps for the whole batch with a plan shared by every batch size
+        rows = [{**_column_values(control), "scan_id": scan_id, "tenant_id": tenant_id} for control in controls]
+        result = await self._session.scalars(_unnest_insert(PCIDSSControl, rows))
+        persisted = list(result.all())
 
         logger.debug(
             "Created PCI DSS control batch",
             scan_id=str(scan_id),
-            count=len(controls),
+            count=len(persisted),
         )
-        return controls
+        return persisted
 
     async def get_by_scan_id(
         self,
@@ -273,9 +515,11 @@ class PCIDSSRepository:
         Returns:
             List of PCIDSSControl instances.
         """
-        stmt = select(PCIDSSControl).where(
-            PCIDSSControl.scan_id == scan_id,
-            PCIDSSControl.tenant_id == tenant_id,
+        stmt = lambda_stmt(
+            lambda: select(PCIDSSControl).where(
+                PCIDSSControl.scan_id == scan_id,
+                PCIDSSControl.tenant_id == tenant_id,
+            )
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
@@ -296,9 +540,7 @@ class DORARepository:
         Returns:
             Persisted instance.
         """
-        self._session.add(assessment)
-        await self._session.flush()
-        await self._session.refresh(assessment)
+        assessment = await _insert_returning(self._session, assessment)
         logger.debug("Created DORA assessment", assessment_id=str(assessment.id))
         return assessment
 
@@ -311,11 +553,13 @@ class DORARepository:
         Returns:
             Most recent DORAAssessment or None.
         """
-        stmt = (
-            select(DORAAssessment)
-            .where(DORAAssessment.tenant_id == tenant_id)
-            .order_by(DORAAssessment.created_at.desc())
-            .limit(1)
+        stmt = lambda_stmt(
+            lambda: (
+                select(DORAAssessment)
+                .where(DORAAssessment.tenant_id == tenant_id)
+                .order_by(DORAAssessment.created_at.desc())
+                .limit(1)
+            )
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
@@ -325,31 +569,23 @@ class DORARepository:
         tenant_id: uuid.UUID,
         page: int,
         page_size: int,
-    ) -> tuple[list[DORAAssessment], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[DORAAssessment], int, tuple[datetime, uuid.UUID] | None]:
         """List DORA assessments for a tenant.
 
         Args:
             tenant_id: Tenant identifier.
-            page: 1-based page number.
+            page: 1-based page number; ignored when cursor is given.
             page_size: Records per page.
+            cursor: Keyset position (created_at, id) of the previous page's
+                last record; see decode_page_cursor.
 
         Returns:
-            Tuple of (records list, total count).
+            Tuple of (records list, total count, next cursor); pass the next
+            cursor back to fetch the following page, None on the last page.
         """
-        from sqlalchemy import func
-
-        base_stmt = select(DORAAssessment).where(DORAAssessment.tenant_id == tenant_id)
-        total = (
-            await self._session.execute(select(func.count()).select_from(base_stmt.subquery()))
-        ).scalar_one()
-
-        data_stmt = (
-            base_stmt.order_by(DORAAssessment.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
-        records = list((await self._session.execute(data_stmt)).scalars().all())
-        return records, total
+        filters = [DORAAssessment.tenant_id == tenant_id]
+        return await _fetch_page(self._session, DORAAssessment, filters, page, page_size, cursor)
 
 
 class SyntheticTransactionRepository:
@@ -367,9 +603,7 @@ class SyntheticTransactionRepository:
         Returns:
             Persisted instance.
         """
-        self._session.add(job)
-        await self._session.flush()
-        await self._session.refresh(job)
+        job = await _insert_returning(self._session, job)
         logger.debug("Created synthetic transaction job", job_id=str(job.id))
         return job
 
@@ -387,9 +621,11 @@ class SyntheticTransactionRepository:
         Returns:
             SyntheticTransaction or None.
         """
-        stmt = select(SyntheticTransaction).where(
-            SyntheticTransaction.id == job_id,
-            SyntheticTransaction.tenant_id == tenant_id,
+        stmt = lambda_stmt(
+            lambda: select(SyntheticTransaction).where(
+                SyntheticTransaction.id == job_id,
+                SyntheticTransaction.tenant_id == tenant_id,
+            )
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
@@ -409,14 +645,16 @@ class SyntheticTransactionRepository:
             fraud_count: Number of fraudulent transactions generated.
             legitimate_count: Number of legitimate transactions generated.
         """
-        stmt = (
-            update(SyntheticTransaction)
-            .where(SyntheticTransaction.id == job_id)
-            .values(
-                status="completed",
-                output_uri=output_uri,
-                fraud_count=fraud_count,
-                legitimate_count=legitimate_count,
+        stmt = lambda_stmt(
+            lambda: (
+                update(SyntheticTransaction)
+                .where(SyntheticTransaction.id == job_id)
+                .values(
+                    status="completed",
+                    output_uri=output_uri,
+                    fraud_count=fraud_count,
+                    legitimate_count=legitimate_count,
+                )
             )
         )
         await self._session.execute(stmt)
@@ -428,13 +666,51 @@ class SyntheticTransactionRepository:
             job_id: Job UUID.
             error_message: Error description.
         """
-        stmt = (
-            update(SyntheticTransaction)
-            .where(SyntheticTransaction.id == job_id)
-            .values(status="failed", error_message=error_message)
+        stmt = lambda_stmt(
+            lambda: (
+                update(SyntheticTransaction)
+                .where(SyntheticTransaction.id == job_id)
+                .values(status="failed", error_message=error_message)
+            )
         )
         await self._session.execute(stmt)
 
+    async def update_completion_many(self, completions: Sequence[Mapping[str, Any]]) -> None:
+        """Mark many synthetic transaction jobs as completed in one statement.
+
+        Args:
+            completions: One mapping per job with job_id, output_uri,
+                fraud_count and legitimate_count keys.
+        """
+        if not completions:
+            return
+        await self._session.execute(
+            update(SyntheticTransaction),
+            [
+                {
+                    "id": completion["job_id"],
+                    "status": "completed",
+                    "output_uri": completion["output_uri"],
+                    "fraud_count": completion["fraud_count"],
+                    "legitimate_count": completion["legitimate_count"],
+                }
+                for completion in completions
+            ],
+        )
+
+    async def update_failure_many(self, errors: Mapping[uuid.UUID, str]) -> None:
+        """Mark many synthetic transaction jobs as failed in one statement.
+
+        Args:
+            errors: Error description keyed by job UUID.
+        """
+        if not errors:
+            return
+        await self._session.execute(
+            update(SyntheticTransaction),
+            [{"id": job_id, "status": "failed", "error_message": message} for job_id, message in errors.items()],
+        )
+
 
 class RegulatoryReportRepository:
     """Repository for fsv_regulatory_reports table operations."""
@@ -451,9 +727,7 @@ class RegulatoryReportRepository:
         Returns:
             Persisted instance.
         """
-        self._session.add(report)
-        await self._session.flush()
-        await self._session.refresh(report)
+        report = await _insert_returning(self._session, report)
         logger.debug(
             "Created regulatory report",
             report_id=str(report.id),
@@ -475,9 +749,11 @@ class RegulatoryReportRepository:
         Returns:
             RegulatoryReport or None.
         """
-        stmt = select(RegulatoryReport).where(
-            RegulatoryReport.id == report_id,
-            RegulatoryReport.tenant_id == tenant_id,
+        stmt = lambda_stmt(
+            lambda: select(RegulatoryReport).where(
+                RegulatoryReport.id == report_id,
+                RegulatoryReport.tenant_id == tenant_id,
+            )
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
@@ -488,35 +764,27 @@ class RegulatoryReportRepository:
         regulator: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[RegulatoryReport], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[RegulatoryReport], int, tuple[datetime, uuid.UUID] | None]:
         """List regulatory reports for a tenant.
 
         Args:
             tenant_id: Tenant identifier.
             regulator: Optional regulator filter.
-            page: 1-based page number.
+            page: 1-based page number; ignored when cursor is given.
             page_size: Records per page.
+            cursor: Keyset position (created_at, id) of the previous page's
+                last record; see decode_page_cursor.
 
         Returns:
-            Tuple of (records list, total count).
+            Tuple of (records list, total count, next cursor); pass the next
+            cursor back to fetch the following page, None on the last page.
         """
-        from sqlalchemy import func
-
-        base_stmt = select(RegulatoryReport).where(RegulatoryReport.tenant_id == tenant_id)
+        filters = [RegulatoryReport.tenant_id == tenant_id]
         if regulator is not None:
-            base_stmt = base_stmt.where(RegulatoryReport.regulator == regulator)
-
-        total = (
-            await self._session.execute(select(func.count()).select_from(base_stmt.subquery()))
-        ).scalar_one()
+            filters.append(RegulatoryReport.regulator == regulator)
 
-        data_stmt = (
-            base_stmt.order_by(RegulatoryReport.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-        )
-        records = list((await self._session.execute(data_stmt)).scalars().all())
-        return records, total
+        return await _fetch_page(self._session, RegulatoryReport, filters, page, page_size, cursor)
 
     async def update_completion(
         self,
@@ -533,14 +801,39 @@ class RegulatoryReportRepository:
             page_count: Number of pages in the generated report.
             report_format: Output format (PDF | XBRL | JSON).
         """
-        stmt = (
-            update(RegulatoryReport)
-            .where(RegulatoryReport.id == report_id)
-            .values(
-                status="completed",
-                output_uri=output_uri,
-                page_count=page_count,
-                report_format=report_format,
+        stmt = lambda_stmt(
+            lambda: (
+                update(RegulatoryReport)
+                .where(RegulatoryReport.id == report_id)
+                .values(
+                    status="completed",
+                    output_uri=output_uri,
+                    page_count=page_count,
+                    report_format=report_format,
+                )
             )
         )
         await self._session.execute(stmt)
+
+    async def update_completion_many(self, completions: Sequence[Mapping[str, Any]]) -> None:
+        """Mark many regulatory reports as completed in one statement.
+
+        Args:
+            completions: One mapping per report with report_id, output_uri,
+                page_count and report_format keys.
+        """
+        if not completions:
+            return
+        await self._session.execute(
+            update(RegulatoryReport),
+            [
+                {
+                    "id": completion["report_id"],
+                    "status": "completed",
+                    "output_uri": completion["output_uri"],
+                    "page_count": completion["page_count"],
+                    "report_format": completion["report_format"],
+                }
+                for completion in completions
+            ],
+        )
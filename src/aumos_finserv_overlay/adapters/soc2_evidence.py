@@ -5,6 +5,7 @@ GAP-297: SOC2 Type II Audit Evidence.
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, timezone
 from typing import Any
 
@@ -35,6 +36,33 @@ TSC_CATEGORY_NAMES: dict[str, str] = {
 }
 
 
+def _invert_control_map(control_map: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+    """Build an activity category -> TSC control IDs index from a control map."""
+    index: dict[str, list[str]] = {}
+    for control_id, activities in control_map.items():
+        for activity in activities:
+            index.setdefault(activity, []).append(control_id)
+    return {activity: tuple(control_ids) for activity, control_ids in index.items()}
+
+
+def _derive_tsc_category(control_id: str) -> str:
+    """Derive a TSC category name from a control ID prefix (e.g. 'CC6.1' -> 'CC')."""
+    prefix = control_id.split(".")[0].rstrip("0123456789") if "." in control_id else control_id[:2]
+    return TSC_CATEGORY_NAMES.get(prefix, "Unknown")
+
+
+# Category name per known TSC control ID, derived once at import
+_CONTROL_ID_TO_CATEGORY: dict[str, str] = {
+    control_id: _derive_tsc_category(control_id) for control_id in TSC_CONTROL_MAP
+}
+
+# Reverse index of TSC_CONTROL_MAP, built once so lookups are O(1) per item
+_ACTIVITY_TO_TSC: dict[str, tuple[str, ...]] = _invert_control_map(TSC_CONTROL_MAP)
+
+# TSC control IDs in package output order
+_CONTROL_IDS: tuple[str, ...] = tuple(TSC_CONTROL_MAP)
+
+
 class SOC2EvidenceService:
     """Maps AumOS platform activities to AICPA Trust Services Criteria controls.
 
@@ -43,20 +71,16 @@ class SOC2EvidenceService:
     Big Four audit firms accept the JSON output format used here.
     """
 
-    def map_activity_to_tsc(self, activity_type: str) -> list[str]:
+    def map_activity_to_tsc(self, activity_type: str) -> tuple[str, ...]:
         """Map an AumOS activity type to applicable TSC control IDs.
 
         Args:
             activity_type: Activity category (e.g. 'logical_access', 'mfa').
 
         Returns:
-            List of TSC control IDs that cover this activity.
+            TSC control IDs that cover this activity, in TSC_CONTROL_MAP order.
         """
-        return [
-            control_id
-            for control_id, activities in TSC_CONTROL_MAP.items()
-            if activity_type in activities
-        ]
+        return _ACTIVITY_TO_TSC.get(activity_type, ())
 
     def generate_evidence_package(
         self,
@@ -79,30 +103,30 @@ class SOC2EvidenceService:
         Returns:
             Structured SOC2 evidence package dict with AICPA schema.
         """
-        tsc_buckets: dict[str, list[dict]] = {ctrl: [] for ctrl in TSC_CONTROL_MAP}
-
-        for item in evidence_items:
-            activity_type = item.get("evidence_type", "")
-            matched_controls = self.map_activity_to_tsc(activity_type)
-            for control_id in matched_controls:
-                tsc_buckets[control_id].append(
-                    {
-                        "evidence_id": str(item.get("id", uuid.uuid4())),
-                        "evidence_type": activity_type,
-                        "evidence_payload": item.get("evidence_payload", {}),
-                        "collected_at": item.get("created_at", datetime.now(timezone.utc).isoformat()),
-                        "tsc_control_id": control_id,
-                        "sox_evidence_id": item.get("sox_evidence_id"),
-                    }
-                )
-                logger.debug(
-                    "soc2_evidence_mapped",
-                    control_id=control_id,
-                    activity_type=activity_type,
-                )
-
-        controls_with_evidence = [ctrl for ctrl, items in tsc_buckets.items() if items]
-        coverage_pct = len(controls_with_evidence) / len(TSC_CONTROL_MAP) if TSC_CONTROL_MAP else 0.0
+        # Single timestamp for the package and for items without created_at
+        now_iso = datetime.now(timezone.utc).isoformat()
+
+        # Evidence lists are only allocated for controls that receive a match
+        tsc_buckets: dict[str, list[dict[str, Any]]] = {}
+        for control_id, evidence in self._iter_mapped_evidence(evidence_items, now_iso):
+            tsc_buckets.setdefault(control_id, []).append(evidence)
+
+        controls_out: dict[str, dict[str, Any]] = {}
+        for control_id in _CONTROL_IDS:
+            evidence_list = tsc_buckets.get(control_id)
+            controls_out[control_id] = {
+                "tsc_category": _CONTROL_ID_TO_CATEGORY[control_id],
+                "evidence_count": len(evidence_list) if evidence_list else 0,
+                "evidence": evidence_list if evidence_list is not None else [],
+            }
+
+        controls_with_evidence = len(tsc_buckets)
+        logger.debug(
+            "soc2_evidence_mapped",
+            item_count=len(evidence_items),
+            controls_with_evidence=controls_with_evidence,
+        )
+        coverage_pct = controls_with_evidence / len(_CONTROL_IDS) if _CONTROL_IDS else 0.0
 
         return {
             "schema_version": "AICPA-TSC-2017",
@@ -112,24 +136,68 @@ class SOC2EvidenceService:
                 "start": audit_period_start.isoformat(),
                 "end": audit_period_end.isoformat(),
             },
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": now_iso,
             "tsc_coverage": {
-                "total_controls": len(TSC_CONTROL_MAP),
-                "controls_with_evidence": len(controls_with_evidence),
+                "total_controls": len(_CONTROL_IDS),
+                "controls_with_evidence": controls_with_evidence,
                 "coverage_pct": round(coverage_pct * 100, 1),
             },
-            "controls": {
-                control_id: {
-                    "tsc_category": self._get_tsc_category(control_id),
-                    "evidence_count": len(items),
-                    "evidence": items,
-                }
-                for control_id, items in tsc_buckets.items()
-            },
+            "controls": controls_out,
         }
 
+    def stream_evidence_package(
+        self,
+        evidence_items: Iterable[dict[str, Any]],
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Map evidence items to TSC controls one at a time.
+
+        Streaming counterpart of generate_evidence_package for audit periods
+        too large to hold as one package: each mapped record is yielded as
+        soon as it is produced, e.g. for writing NDJSON to object storage.
+
+        Args:
+            evidence_items: Evidence records with type and payload; may be a
+                lazily evaluated iterable such as a database result stream.
+
+        Yields:
+            (TSC control ID, evidence record) pairs in input order.
+        """
+        yield from self._iter_mapped_evidence(evidence_items, datetime.now(timezone.utc).isoformat())
+
+    def _iter_mapped_evidence(
+        self,
+        evidence_items: Iterable[dict[str, Any]],
+        now_iso: str,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Yield the package evidence record for each (item, TSC control) match.
+
+        Args:
+            evidence_items: Evidence records with type and payload.
+            now_iso: collected_at fallback for items without created_at.
+
+        Yields:
+            (TSC control ID, evidence record) pairs.
+        """
+        for item in evidence_items:
+            activity_type = item.get("evidence_type", "")
+            matched_controls = self.map_activity_to_tsc(activity_type)
+            if not matched_controls:
+                continue
+            item_id = item.get("id")
+            evidence_id = str(item_id if item_id is not None else uuid.uuid4())
+            collected_at = item.get("created_at", now_iso)
+            for control_id in matched_controls:
+                yield control_id, {
+                    "evidence_id": evidence_id,
+                    "evidence_type": activity_type,
+                    "evidence_payload": item.get("evidence_payload", {}),
+                    "collected_at": collected_at,
+                    "tsc_control_id": control_id,
+                    "sox_evidence_id": item.get("sox_evidence_id"),
+                }
+
     @staticmethod
     def _get_tsc_category(control_id: str) -> str:
         """Map a TSC control ID to its category name."""
-        prefix = control_id.split(".")[0].rstrip("0123456789") if "." in control_id else control_id[:2]
-        return TSC_CATEGORY_NAMES.get(prefix, "Unknown")
+        category = _CONTROL_ID_TO_CATEGORY.get(control_id)
+        return category if category is not None else _derive_tsc_category(control_id)
@@ -5,16 +5,33 @@ testing, deficiency classification, and audit trail generation aligned with
 PCAOB / COSO Internal Control framework requirements.
 """
 
+import dataclasses
 import hashlib
-import json
+import sys
 import uuid
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Any, ClassVar
 
+import numpy as np
 from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
 
+
+class ControlArea(IntEnum):
+    """SOX control areas, used as indexes into the per-area lookup tables."""
+
+    ITGC = 0
+    FINANCIAL_REPORTING = 1
+    DISCLOSURE_CONTROLS = 2
+    ENTITY_LEVEL = 3
+    OPERATIONS = 4
+
+
 # SOX control area to COSO component mapping
 _COSO_COMPONENT_MAP: dict[str, str] = {
     "ITGC": "Control Environment",
@@ -25,33 +42,400 @@ _COSO_COMPONENT_MAP: dict[str, str] = {
 }
 
 # SOX 302/404 article mapping by control area
-_SOX_ARTICLE_MAP: dict[str, list[str]] = {
-    "ITGC": ["SOX-302", "SOX-404(a)", "SOX-404(b)"],
-    "FINANCIAL_REPORTING": ["SOX-302", "SOX-404(a)", "SOX-404(b)"],
-    "DISCLOSURE_CONTROLS": ["SOX-302", "SOX-409"],
-    "ENTITY_LEVEL": ["SOX-404(a)", "SOX-404(b)"],
-    "OPERATIONS": ["SOX-404(a)"],
+_SOX_ARTICLE_MAP: dict[str, tuple[str, ...]] = {
+    "ITGC": ("SOX-302", "SOX-404(a)", "SOX-404(b)"),
+    "FINANCIAL_REPORTING": ("SOX-302", "SOX-404(a)", "SOX-404(b)"),
+    "DISCLOSURE_CONTROLS": ("SOX-302", "SOX-409"),
+    "ENTITY_LEVEL": ("SOX-404(a)", "SOX-404(b)"),
+    "OPERATIONS": ("SOX-404(a)",),
 }
 
-# Control effectiveness rating thresholds (percentage of passing test steps)
-_EFFECTIVENESS_THRESHOLDS = {
-    "EFFECTIVE": 0.90,
-    "DEFICIENCY": 0.70,
-    "SIGNIFICANT_DEFICIENCY": 0.50,
-    "MATERIAL_WEAKNESS": 0.0,
-}
+# SOX articles for control areas missing from _SOX_ARTICLE_MAP
+_DEFAULT_SOX_ARTICLES: tuple[str, ...] = ("SOX-404(a)",)
+
+# Lookup table index per control area name; unknown areas use the fallback
+# entry stored after the ControlArea members
+_AREA_INDEX: dict[str, int] = {area.name: area.value for area in ControlArea}
+_DEFAULT_AREA_INDEX = len(ControlArea)
+
+# COSO component per ControlArea index, plus the fallback entry
+_COSO_BY_AREA: tuple[str, ...] = (
+    *(_COSO_COMPONENT_MAP[area.name] for area in ControlArea),
+    "Control Activities",
+)
+
+# SOX articles per ControlArea index, plus the fallback entry; tuples so one
+# instance can be shared across every returned dict
+_ARTICLES_BY_AREA: tuple[tuple[str, ...], ...] = (
+    *(_SOX_ARTICLE_MAP[area.name] for area in ControlArea),
+    _DEFAULT_SOX_ARTICLES,
+)
+
+# Every SOX article in report order; bit i of an article mask stands for entry i
+_SOX_ARTICLE_ORDER: tuple[str, ...] = ("SOX-302", "SOX-404(a)", "SOX-404(b)", "SOX-409")
+
+# Article bitmask per ControlArea index, parallel to _ARTICLES_BY_AREA
+_ARTICLE_MASK_BY_AREA: tuple[int, ...] = tuple(
+    sum(1 << _SOX_ARTICLE_ORDER.index(article) for article in articles) for articles in _ARTICLES_BY_AREA
+)
+
+# Control effectiveness rating thresholds (minimum passing test step rate,
+# rating, deficiency type), highest threshold first
+_EFFECTIVENESS_THRESHOLDS: tuple[tuple[float, str, str | None], ...] = (
+    (0.90, "EFFECTIVE", None),
+    (0.70, "DEFICIENCY", "Control Deficiency"),
+    (0.50, "SIGNIFICANT_DEFICIENCY", "Significant Deficiency"),
+    (0.0, "MATERIAL_WEAKNESS", "Material Weakness"),
+)
+
+# Ascending passing-rate bin edges for np.digitize and the rating of each
+# resulting bin, derived from _EFFECTIVENESS_THRESHOLDS
+_EFFECTIVENESS_BIN_EDGES: np.ndarray = np.array([threshold for threshold, _, _ in _EFFECTIVENESS_THRESHOLDS[-2::-1]])
+_RATING_BY_BIN: tuple[str, ...] = tuple(rating for _, rating, _ in reversed(_EFFECTIVENESS_THRESHOLDS))
 
 # Evidence types that satisfy PCAOB audit requirements
-_PCAOB_ACCEPTED_EVIDENCE_TYPES = {
-    "system_report",
-    "screen_capture",
-    "policy_document",
-    "approval_log",
-    "configuration_export",
-    "reconciliation_report",
-    "management_attestation",
-    "third_party_confirmation",
-}
+_PCAOB_ACCEPTED_EVIDENCE_TYPES: frozenset[str] = frozenset(
+    sys.intern(evidence_type)
+    for evidence_type in (
+        "system_report",
+        "screen_capture",
+        "policy_document",
+        "approval_log",
+        "configuration_export",
+        "reconciliation_report",
+        "management_attestation",
+        "third_party_confirmation",
+    )
+)
+
+# Width of the big-endian length prefix written before each encoded field or list item
+_FIELD_LENGTH_BYTES = 4
+
+# Seed hashed in place of a previous digest for the first chain link
+_CHAIN_GENESIS = "GENESIS"
+
+
+def _coverage_assessment(review_days: int) -> str:
+    """Assess whether a review period is long enough for SOX 404 testing.
+
+    Args:
+        review_days: Length of the review period in days.
+
+    Returns:
+        Coverage assessment text.
+    """
+    if review_days < 90:
+        return "Insufficient — minimum 90-day review period required"
+    if review_days < 180:
+        return "Partial — consider extending to semi-annual period"
+    return "Adequate"
+
+
+def _area_index(control_area: str) -> int:
+    """Return the per-area lookup table index for a control area.
+
+    Args:
+        control_area: Control area name; unknown areas get the fallback entry.
+
+    Returns:
+        Index into _COSO_BY_AREA, _ARTICLES_BY_AREA and _ARTICLE_MASK_BY_AREA.
+    """
+    return _AREA_INDEX.get(control_area, _DEFAULT_AREA_INDEX)
+
+
+def _basis_points(part: int, whole: int) -> int:
+    """Return part / whole in basis points, rounded half up; 0 when whole is 0.
+
+    Args:
+        part: Numerator count.
+        whole: Denominator count.
+
+    Returns:
+        Ratio in basis points (10000 = 100%).
+    """
+    if whole <= 0:
+        return 0
+    return (part * 10000 + whole // 2) // whole
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _length_prefixed(fields: Iterable[bytes]) -> bytes:
+    """Concatenate fields, each preceded by its length, so the encoding is injective.
+
+    Args:
+        fields: Encoded field values; may contain any bytes.
+
+    Returns:
+        Each field as a _FIELD_LENGTH_BYTES big-endian length followed by its bytes.
+    """
+    return b"".join(len(field).to_bytes(_FIELD_LENGTH_BYTES, "big") + field for field in fields)
+
+
+def _evidence_fingerprint(
+    control_id: str,
+    control_area: str,
+    evidence_description: str,
+    evidence_artifacts: Sequence[str],
+    evidence_type: str,
+    artifact_count: int,
+    pcaob_accepted: bool,
+    sox_articles: tuple[str, ...],
+    review_period_start: str,
+    review_period_end: str,
+    control_owner: str,
+    is_key_control: bool,
+    collected_at: str,
+    pcaob_warning: str | None,
+    artifact_warning: str | None,
+) -> bytes:
+    """Encode the integrity-protected fields of an evidence package.
+
+    Specialised to the evidence package schema: fields arrive positionally
+    in hashing order, so no dict is built or walked. List-valued fields are
+    themselves length-prefixed item by item, and absent warnings encode as
+    empty strings.
+
+    Returns:
+        Length-prefixed UTF-8 field values.
+    """
+    return _length_prefixed(
+        (
+            control_id.encode(),
+            control_area.encode(),
+            evidence_description.encode(),
+            _length_prefixed(artifact.encode() for artifact in evidence_artifacts),
+            evidence_type.encode(),
+            str(artifact_count).encode(),
+            str(pcaob_accepted).encode(),
+            _length_prefixed(article.encode() for article in sox_articles),
+            review_period_start.encode(),
+            review_period_end.encode(),
+            control_owner.encode(),
+            str(is_key_control).encode(),
+            collected_at.encode(),
+            (pcaob_warning or "").encode(),
+            (artifact_warning or "").encode(),
+        )
+    )
+
+
+def _encode_chain_record(index: int, record: dict[str, Any]) -> bytes:
+    """Encode an evidence record as the bytes hashed into its chain link.
+
+    Fields are length-prefixed rather than delimited, so caller-controlled
+    values cannot shift bytes from one field into the next.
+
+    Args:
+        index: Position of the record in the audit chain.
+        record: Evidence record dict.
+
+    Returns:
+        Length-prefixed UTF-8 fields.
+    """
+    return _length_prefixed(
+        (
+            str(index).encode(),
+            str(record.get("control_id", "")).encode(),
+            str(record.get("evidence_type", "")).encode(),
+            str(record.get("collected_at", "")).encode(),
+            str(record.get("integrity_hash", "")).encode(),
+        )
+    )
+
+
+def _chain_digests(chain_prefix: bytes, encoded_records: list[bytes]) -> list[bytes]:
+    """Compute the serial SHA-256 hash chain over pre-encoded records.
+
+    Each link hashes the chain prefix, the previous link's raw digest and
+    the record bytes; the first link uses the genesis seed as its previous
+    digest. The prefix is absorbed once and its hash state copied per link.
+
+    Args:
+        chain_prefix: Context bytes shared by every link (tenant, fiscal year).
+        encoded_records: Output of _encode_chain_record, in chain order.
+
+    Returns:
+        Raw 32-byte digest of each link, in chain order.
+    """
+    prefix_hash = hashlib.sha256(chain_prefix)
+    digests: list[bytes] = []
+    previous_digest = _CHAIN_GENESIS.encode()
+    for record_bytes in encoded_records:
+        link_hash = prefix_hash.copy()
+        link_hash.update(previous_digest)
+        link_hash.update(record_bytes)
+        previous_digest = link_hash.digest()
+        digests.append(previous_digest)
+    return digests
+
+
+class _SlottedResult:
+    """Base for slotted SOX result records, providing dict conversion."""
+
+    __slots__ = ()
+    __dataclass_fields__: ClassVar[dict[str, dataclasses.Field[Any]]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the record to a plain dict for JSON consumers.
+
+        Returns:
+            Field name to value mapping, in field declaration order.
+        """
+        return {field.name: getattr(self, field.name) for field in dataclasses.fields(self)}
+
+
+@dataclass(frozen=True, slots=True)
+class ControlDefinition(_SlottedResult):
+    """SOX internal control definition with COSO and SOX article mappings."""
+
+    control_id: str
+    control_area: str
+    control_description: str
+    control_owner: str
+    is_key_control: bool
+    frequency: str
+    automated: bool
+    control_type: str
+    coso_component: str
+    sox_articles: tuple[str, ...]
+    review_period_start: str
+    review_period_end: str
+    review_period_days: int
+    coverage_assessment: str
+    testing_required: bool
+    pcaob_documentation_required: bool
+    defined_at: str
+    metadata: Mapping[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the definition to a plain dict, with metadata as a dict.
+
+        Returns:
+            Field name to value mapping, in field declaration order.
+        """
+        as_dict = _SlottedResult.to_dict(self)
+        as_dict["metadata"] = dict(self.metadata)
+        return as_dict
+
+
+@dataclass(frozen=True, slots=True)
+class EvidencePackage(_SlottedResult):
+    """SOX evidence collection package with integrity hash."""
+
+    control_id: str
+    control_area: str
+    evidence_description: str
+    evidence_artifacts: tuple[str, ...]
+    evidence_type: str
+    artifact_count: int
+    pcaob_accepted: bool
+    sox_articles: tuple[str, ...]
+    review_period_start: str
+    review_period_end: str
+    control_owner: str
+    is_key_control: bool
+    collected_at: str
+    integrity_hash: str
+    pcaob_warning: str | None = None
+    artifact_warning: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the package to a plain dict, omitting warnings that were not raised.
+
+        Returns:
+            Field name to value mapping, in field declaration order.
+        """
+        return {name: value for name in self.__slots__ if (value := getattr(self, name)) is not None}
+
+
+@dataclass(frozen=True, slots=True)
+class EffectivenessResult(_SlottedResult):
+    """SOX control effectiveness test outcome."""
+
+    control_id: str
+    control_area: str
+    is_key_control: bool
+    automated_control: bool
+    test_steps_total: int
+    test_steps_passed: int
+    test_steps_failed: int
+    passing_rate: float
+    population_size: int
+    sample_size: int
+    sampling_adequacy: str
+    effectiveness_rating: str
+    deficiency_type: str | None
+    remediation_required: bool
+    management_disclosure_required: bool
+    failed_test_steps: list[str]
+    tested_at: str
+    sox_articles: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DeficiencyClassification(_SlottedResult):
+    """SOX control deficiency classification per PCAOB AS 2201."""
+
+    control_id: str
+    deficiency_description: str
+    financial_statement_impact: str
+    is_key_control: bool
+    compensating_controls: tuple[str, ...]
+    has_compensating_controls: bool
+    management_override_risk: bool
+    severity: str
+    disclosure_required: bool
+    disclosure_target: str | None
+    auditor_communication_required: bool
+    remediation_timeline_days: int
+    pcaob_standard: str
+    classified_at: str
+
+
+@dataclass(frozen=True, slots=True)
+class ManagementAssertion(_SlottedResult):
+    """SOX 302/404 management assertion document."""
+
+    assertion_id: str
+    tenant_id: str
+    entity_name: str
+    fiscal_year_end: str
+    coso_framework: str
+    sox_302_assertion: dict[str, Any]
+    sox_404_assertion: dict[str, Any]
+    generated_at: str
+    attestation_period_start: str | None
+    attestation_period_end: str
+    document_version: str
+
+
+@dataclass(frozen=True, slots=True)
+class AuditTrail(_SlottedResult):
+    """Hash-chained SOX audit trail with a columnar chain."""
+
+    audit_trail_id: str
+    tenant_id: str
+    fiscal_year: int
+    chain_length: int
+    genesis_hash: str
+    terminal_hash: str
+    chain: dict[str, Any]
+    retention_requirement_years: int
+    retention_expiry_year: int
+    pcaob_compliant: bool
+    generated_at: str
+
+    def as_rows(self) -> list[dict[str, Any]]:
+        """Expand the columnar chain into one dict per link.
+
+        Returns:
+            Link dicts as produced by SOXComplianceAdapter.chain_as_rows.
+        """
+        return SOXComplianceAdapter.chain_as_rows(self.chain)
 
 
 class SOXComplianceAdapter:
@@ -78,7 +462,8 @@ class SOXComplianceAdapter:
         review_period_start: datetime,
         review_period_end: datetime,
         metadata: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
+        now: str | None = None,
+    ) -> ControlDefinition:
         """Define a SOX internal control with COSO framework alignment.
 
         Generates a structured control definition including SOX article mapping,
@@ -95,42 +480,42 @@ class SOXComplianceAdapter:
             review_period_start: Beginning of the review period.
             review_period_end: End of the review period.
             metadata: Optional additional metadata.
+            now: Optional ISO 8601 timestamp to stamp the result with, e.g. one
+                shared across a batch; defaults to the current UTC time.
 
         Returns:
-            Structured control definition dict with COSO and SOX mappings.
+            ControlDefinition with COSO and SOX mappings; use to_dict() for JSON.
         """
-        coso_component = _COSO_COMPONENT_MAP.get(control_area, "Control Activities")
-        sox_articles = _SOX_ARTICLE_MAP.get(control_area, ["SOX-404(a)"])
+        control_area = sys.intern(control_area)
+        area_index = _area_index(control_area)
+        coso_component = _COSO_BY_AREA[area_index]
+        sox_articles = _ARTICLES_BY_AREA[area_index]
         control_type = "Preventive" if automated else "Detective"
 
         review_days = (review_period_end - review_period_start).days
-        if review_days < 90:
-            coverage_assessment = "Insufficient — minimum 90-day review period required"
-        elif review_days < 180:
-            coverage_assessment = "Partial — consider extending to semi-annual period"
-        else:
-            coverage_assessment = "Adequate"
-
-        control_definition = {
-            "control_id": control_id,
-            "control_area": control_area,
-            "control_description": control_description,
-            "control_owner": control_owner,
-            "is_key_control": is_key_control,
-            "frequency": frequency,
-            "automated": automated,
-            "control_type": control_type,
-            "coso_component": coso_component,
-            "sox_articles": sox_articles,
-            "review_period_start": review_period_start.isoformat(),
-            "review_period_end": review_period_end.isoformat(),
-            "review_period_days": review_days,
-            "coverage_assessment": coverage_assessment,
-            "testing_required": is_key_control,
-            "pcaob_documentation_required": is_key_control and not automated,
-            "defined_at": datetime.now(timezone.utc).isoformat(),
-            "metadata": metadata or {},
-        }
+        coverage_assessment = _coverage_assessment(review_days)
+
+        control_definition = ControlDefinition(
+            control_id=control_id,
+            control_area=control_area,
+            control_description=control_description,
+            control_owner=control_owner,
+            is_key_control=is_key_control,
+            frequency=frequency,
+            automated=automated,
+            control_type=control_type,
+            coso_component=coso_component,
+            sox_articles=sox_articles,
+            review_period_start=review_period_start.isoformat(),
+            review_period_end=review_period_end.isoformat(),
+            review_period_days=review_days,
+            coverage_assessment=coverage_assessment,
+            testing_required=is_key_control,
+            pcaob_documentation_required=is_key_control and not automated,
+            defined_at=now or _utcnow_iso(),
+            # Copied so later changes to the caller's dict cannot alter the frozen record
+            metadata=MappingProxyType(dict(metadata or {})),
+        )
 
         logger.info(
             "SOX control defined",
@@ -153,7 +538,8 @@ class SOXComplianceAdapter:
         review_period_end: datetime,
         control_owner: str,
         is_key_control: bool,
-    ) -> dict[str, Any]:
+        now: str | None = None,
+    ) -> EvidencePackage:
         """Automate evidence collection for a SOX control.
 
         Validates evidence against PCAOB acceptance criteria, generates
@@ -170,50 +556,76 @@ class SOXComplianceAdapter:
             review_period_end: End of the review period covered.
             control_owner: Owner responsible for the control.
             is_key_control: Whether this is a key control.
+            now: Optional ISO 8601 timestamp to stamp the result with, e.g. one
+                shared across a batch; defaults to the current UTC time.
 
         Returns:
-            Evidence collection package dict with integrity hash.
+            EvidencePackage with integrity hash; use to_dict() for JSON.
         """
+        control_area = sys.intern(control_area)
+        # Copied so later changes to the caller's list cannot diverge from the integrity hash
+        artifacts = tuple(evidence_artifacts)
+        artifact_count = len(artifacts)
         pcaob_accepted = evidence_type in _PCAOB_ACCEPTED_EVIDENCE_TYPES
-        sox_articles = _SOX_ARTICLE_MAP.get(control_area, ["SOX-404(a)"])
-
-        evidence_package = {
-            "control_id": control_id,
-            "control_area": control_area,
-            "evidence_description": evidence_description,
-            "evidence_artifacts": evidence_artifacts,
-            "evidence_type": evidence_type,
-            "artifact_count": len(evidence_artifacts),
-            "pcaob_accepted": pcaob_accepted,
-            "sox_articles": sox_articles,
-            "review_period_start": review_period_start.isoformat(),
-            "review_period_end": review_period_end.isoformat(),
-            "control_owner": control_owner,
-            "is_key_control": is_key_control,
-            "collected_at": datetime.now(timezone.utc).isoformat(),
-        }
+        sox_articles = _ARTICLES_BY_AREA[_area_index(control_area)]
+
+        review_start_iso = review_period_start.isoformat()
+        review_end_iso = review_period_end.isoformat()
+        collected_at = now or _utcnow_iso()
 
+        pcaob_warning = None
         if not pcaob_accepted:
-            evidence_package["pcaob_warning"] = (
+            pcaob_warning = (
                 f"Evidence type '{evidence_type}' is not in PCAOB-accepted types. "
                 "Supplementary evidence may be required for external audit."
             )
 
-        if len(evidence_artifacts) == 0:
-            evidence_package["artifact_warning"] = (
-                "No evidence artifacts provided. At least one artifact URI is required."
-            )
+        artifact_warning = None
+        if artifact_count == 0:
+            artifact_warning = "No evidence artifacts provided. At least one artifact URI is required."
 
         # Generate integrity hash for tamper detection
-        evidence_str = json.dumps(evidence_package, sort_keys=True)
-        evidence_hash = hashlib.sha256(evidence_str.encode()).hexdigest()
-        evidence_package["integrity_hash"] = evidence_hash
+        fingerprint = _evidence_fingerprint(
+            control_id,
+            control_area,
+            evidence_description,
+            artifacts,
+            evidence_type,
+            artifact_count,
+            pcaob_accepted,
+            sox_articles,
+            review_start_iso,
+            review_end_iso,
+            control_owner,
+            is_key_control,
+            collected_at,
+            pcaob_warning,
+            artifact_warning,
+        )
+        evidence_package = EvidencePackage(
+            control_id=control_id,
+            control_area=control_area,
+            evidence_description=evidence_description,
+            evidence_artifacts=artifacts,
+            evidence_type=evidence_type,
+            artifact_count=artifact_count,
+            pcaob_accepted=pcaob_accepted,
+            sox_articles=sox_articles,
+            review_period_start=review_start_iso,
+            review_period_end=review_end_iso,
+            control_owner=control_owner,
+            is_key_control=is_key_control,
+            collected_at=collected_at,
+            integrity_hash=hashlib.sha256(fingerprint).hexdigest(),
+            pcaob_warning=pcaob_warning,
+            artifact_warning=artifact_warning,
+        )
 
         logger.info(
             "SOX evidence collected",
             control_id=control_id,
             evidence_type=evidence_type,
-            artifact_count=len(evidence_artifacts),
+            artifact_count=artifact_count,
             pcaob_accepted=pcaob_accepted,
         )
 
@@ -228,7 +640,8 @@ class SOXComplianceAdapter:
         population_size: int,
         sample_size: int,
         automated_control: bool,
-    ) -> dict[str, Any]:
+        now: str | None = None,
+    ) -> EffectivenessResult:
         """Test the effectiveness of a SOX internal control.
 
         Evaluates test step results against PCAOB effectiveness thresholds
@@ -243,29 +656,36 @@ class SOXComplianceAdapter:
             population_size: Total population size for sampling.
             sample_size: Number of items sampled for testing.
             automated_control: Whether this is an automated control.
+            now: Optional ISO 8601 timestamp to stamp the result with, e.g. one
+                shared across a batch; defaults to the current UTC time.
 
         Returns:
-            Control effectiveness assessment dict with rating and findings.
+            EffectivenessResult with rating and findings; use to_dict() for JSON.
         """
-        if not test_steps:
-            passing_rate = 0.0
-        else:
-            passing_steps = sum(1 for step in test_steps if step.get("passed", False))
-            passing_rate = passing_steps / len(test_steps)
-
-        # Determine effectiveness rating
-        if passing_rate >= _EFFECTIVENESS_THRESHOLDS["EFFECTIVE"]:
-            effectiveness_rating = "EFFECTIVE"
-            deficiency_type = None
-        elif passing_rate >= _EFFECTIVENESS_THRESHOLDS["DEFICIENCY"]:
-            effectiveness_rating = "DEFICIENCY"
-            deficiency_type = "Control Deficiency"
-        elif passing_rate >= _EFFECTIVENESS_THRESHOLDS["SIGNIFICANT_DEFICIENCY"]:
-            effectiveness_rating = "SIGNIFICANT_DEFICIENCY"
-            deficiency_type = "Significant Deficiency" if not is_key_control else "Material Weakness (Key Control)"
-        else:
-            effectiveness_rating = "MATERIAL_WEAKNESS"
-            deficiency_type = "Material Weakness"
+        control_area = sys.intern(control_area)
+        # Single pass: count passes and collect failed step descriptions
+        total_steps = len(test_steps)
+        passing_steps = 0
+        failed_descriptions: list[str] = []
+        for step in test_steps:
+            if step.get("passed", False):
+                passing_steps += 1
+            else:
+                failed_descriptions.append(step.get("description", ""))
+        passing_rate = passing_steps / total_steps if total_steps else 0.0
+
+        # Determine effectiveness rating from the first threshold met; anything
+        # below every threshold falls into the lowest tier
+        effectiveness_rating, deficiency_type = next(
+            (
+                (rating, deficiency)
+                for threshold, rating, deficiency in _EFFECTIVENESS_THRESHOLDS
+                if passing_rate >= threshold
+            ),
+            _EFFECTIVENESS_THRESHOLDS[-1][1:],
+        )
+        if effectiveness_rating == "SIGNIFICANT_DEFICIENCY" and is_key_control:
+            deficiency_type = "Material Weakness (Key Control)"
 
         # PCAOB sampling adequacy check
         if population_size > 0:
@@ -277,35 +697,31 @@ class SOXComplianceAdapter:
         else:
             sampling_adequacy = "Not applicable — no population defined"
 
-        failed_steps = [
-            step for step in test_steps if not step.get("passed", False)
-        ]
-
         remediation_required = effectiveness_rating in ("DEFICIENCY", "SIGNIFICANT_DEFICIENCY", "MATERIAL_WEAKNESS")
         management_disclosure_required = effectiveness_rating == "MATERIAL_WEAKNESS" or (
             effectiveness_rating == "SIGNIFICANT_DEFICIENCY" and is_key_control
         )
 
-        result = {
-            "control_id": control_id,
-            "control_area": control_area,
-            "is_key_control": is_key_control,
-            "automated_control": automated_control,
-            "test_steps_total": len(test_steps),
-            "test_steps_passed": sum(1 for s in test_steps if s.get("passed", False)),
-            "test_steps_failed": len(failed_steps),
-            "passing_rate": round(passing_rate, 4),
-            "population_size": population_size,
-            "sample_size": sample_size,
-            "sampling_adequacy": sampling_adequacy,
-            "effectiveness_rating": effectiveness_rating,
-            "deficiency_type": deficiency_type,
-            "remediation_required": remediation_required,
-            "management_disclosure_required": management_disclosure_required,
-            "failed_test_steps": [s.get("description", "") for s in failed_steps],
-            "tested_at": datetime.now(timezone.utc).isoformat(),
-            "sox_articles": _SOX_ARTICLE_MAP.get(control_area, ["SOX-404(a)"]),
-        }
+        result = EffectivenessResult(
+            control_id=control_id,
+            control_area=control_area,
+            is_key_control=is_key_control,
+            automated_control=automated_control,
+            test_steps_total=total_steps,
+            test_steps_passed=passing_steps,
+            test_steps_failed=len(failed_descriptions),
+            passing_rate=round(passing_rate, 4),
+            population_size=population_size,
+            sample_size=sample_size,
+            sampling_adequacy=sampling_adequacy,
+            effectiveness_rating=effectiveness_rating,
+            deficiency_type=deficiency_type,
+            remediation_required=remediation_required,
+            management_disclosure_required=management_disclosure_required,
+            failed_test_steps=failed_descriptions,
+            tested_at=now or _utcnow_iso(),
+            sox_articles=_ARTICLES_BY_AREA[_area_index(control_area)],
+        )
 
         logger.info(
             "SOX control effectiveness tested",
@@ -317,6 +733,49 @@ class SOXComplianceAdapter:
 
         return result
 
+    def test_control_effectiveness_batch(
+        self,
+        test_steps_passed: np.ndarray,
+        control_offsets: np.ndarray,
+    ) -> tuple[np.ndarray, list[str]]:
+        """Rate the effectiveness of many controls in one vectorised pass.
+
+        Batch counterpart of test_control_effectiveness for tenant-wide test
+        runs. Test step outcomes for all controls are passed as one flat
+        boolean array in CSR layout: control i owns the steps from
+        control_offsets[i] up to control_offsets[i + 1] (or the end).
+
+        Args:
+            test_steps_passed: Flat boolean array of test step outcomes.
+            control_offsets: Ascending int array of each control's first step index.
+
+        Returns:
+            Tuple of (passing rate per control, effectiveness rating per control).
+            Controls without test steps get a passing rate of 0.0.
+        """
+        passed = np.asarray(test_steps_passed, dtype=bool)
+        starts = np.asarray(control_offsets, dtype=np.int64)
+        ends = np.append(starts[1:], passed.size)
+
+        # Prefix sums handle controls with no steps, which np.add.reduceat does not
+        cumulative_passed = np.concatenate(([0], np.cumsum(passed, dtype=np.int64)))
+        passing_counts = cumulative_passed[ends] - cumulative_passed[starts]
+        step_counts = ends - starts
+        passing_rates = np.divide(
+            passing_counts, step_counts, out=np.zeros(starts.size, dtype=np.float64), where=step_counts > 0
+        )
+
+        rating_bins = np.digitize(passing_rates, _EFFECTIVENESS_BIN_EDGES)
+        ratings = [_RATING_BY_BIN[rating_bin] for rating_bin in rating_bins.tolist()]
+
+        logger.info(
+            "SOX control effectiveness batch tested",
+            control_count=int(starts.size),
+            step_count=int(passed.size),
+        )
+
+        return passing_rates, ratings
+
     def classify_deficiency(
         self,
         control_id: str,
@@ -325,7 +784,8 @@ class SOXComplianceAdapter:
         is_key_control: bool,
         compensating_controls: list[str],
         management_override_risk: bool,
-    ) -> dict[str, Any]:
+        now: str | None = None,
+    ) -> DeficiencyClassification:
         """Classify a SOX control deficiency per PCAOB AS 2201 standards.
 
         Evaluates deficiency severity based on financial statement impact,
@@ -339,9 +799,12 @@ class SOXComplianceAdapter:
             is_key_control: Whether this is a key control for SOX 404.
             compensating_controls: List of compensating control identifiers.
             management_override_risk: Whether management override risk exists.
+            now: Optional ISO 8601 timestamp to stamp the result with, e.g. one
+                shared across a batch; defaults to the current UTC time.
 
         Returns:
-            Deficiency classification dict with severity and disclosure requirements.
+            DeficiencyClassification with severity and disclosure requirements;
+            use to_dict() for JSON.
         """
         has_compensating_controls = len(compensating_controls) > 0
 
@@ -368,22 +831,22 @@ class SOXComplianceAdapter:
             "CONTROL_DEFICIENCY": 365,
         }.get(severity, 365)
 
-        classification = {
-            "control_id": control_id,
-            "deficiency_description": deficiency_description,
-            "financial_statement_impact": financial_statement_impact,
-            "is_key_control": is_key_control,
-            "compensating_controls": compensating_controls,
-            "has_compensating_controls": has_compensating_controls,
-            "management_override_risk": management_override_risk,
-            "severity": severity,
-            "disclosure_required": disclosure_required,
-            "disclosure_target": disclosure_target,
-            "auditor_communication_required": auditor_communication_required,
-            "remediation_timeline_days": remediation_timeline_days,
-            "pcaob_standard": "AS 2201 — An Audit of Internal Control Over Financial Reporting",
-            "classified_at": datetime.now(timezone.utc).isoformat(),
-        }
+        classification = DeficiencyClassification(
+            control_id=control_id,
+            deficiency_description=deficiency_description,
+            financial_statement_impact=financial_statement_impact,
+            is_key_control=is_key_control,
+            compensating_controls=tuple(compensating_controls),
+            has_compensating_controls=has_compensating_controls,
+            management_override_risk=management_override_risk,
+            severity=severity,
+            disclosure_required=disclosure_required,
+            disclosure_target=disclosure_target,
+            auditor_communication_required=auditor_communication_required,
+            remediation_timeline_days=remediation_timeline_days,
+            pcaob_standard="AS 2201 — An Audit of Internal Control Over Financial Reporting",
+            classified_at=now or _utcnow_iso(),
+        )
 
         logger.info(
             "SOX deficiency classified",
@@ -404,7 +867,9 @@ class SOXComplianceAdapter:
         controls_deficient: int,
         controls_material_weakness: int,
         coso_framework_version: str = "2013",
-    ) -> dict[str, Any]:
+        attestation_period_start: datetime | None = None,
+        now: str | None = None,
+    ) -> ManagementAssertion:
         """Generate a SOX 302/404 management assertion document.
 
         Produces a structured management assertion suitable for inclusion
@@ -418,12 +883,17 @@ class SOXComplianceAdapter:
             controls_deficient: Count of deficient controls.
             controls_material_weakness: Count of material weaknesses.
             coso_framework_version: COSO Internal Control framework version.
+            attestation_period_start: Optional start of the assessed period.
+            now: Optional ISO 8601 timestamp to stamp the result with, e.g. one
+                shared across a batch; defaults to the current UTC time.
 
         Returns:
-            Management assertion dict with SOX 302 and 404 sections.
+            ManagementAssertion with SOX 302 and 404 sections; use to_dict()
+            for JSON.
         """
         total_controls = controls_effective + controls_deficient + controls_material_weakness
-        effectiveness_rate = (controls_effective / total_controls * 100) if total_controls > 0 else 0.0
+        # Integer arithmetic keeps the reported percentage identical across platforms
+        effectiveness_rate_bp = _basis_points(controls_effective, total_controls)
 
         # Determine overall assertion
         if controls_material_weakness > 0:
@@ -440,20 +910,20 @@ class SOXComplianceAdapter:
             icfr_effective = True
             caveat = None
 
-        assertion = {
-            "assertion_id": str(uuid.uuid4()),
-            "tenant_id": str(tenant_id),
-            "entity_name": entity_name,
-            "fiscal_year_end": fiscal_year_end.isoformat(),
-            "coso_framework": f"COSO Internal Control — Integrated Framework ({coso_framework_version})",
-            "sox_302_assertion": {
+        assertion = ManagementAssertion(
+            assertion_id=str(uuid.uuid4()),
+            tenant_id=str(tenant_id),
+            entity_name=entity_name,
+            fiscal_year_end=fiscal_year_end.isoformat(),
+            coso_framework=f"COSO Internal Control — Integrated Framework ({coso_framework_version})",
+            sox_302_assertion={
                 "section": "SOX Section 302 — Corporate Responsibility for Financial Reports",
                 "ceo_cfo_certification": "Management has evaluated the effectiveness of disclosure controls and procedures",
                 "material_changes_disclosed": True,
                 "significant_deficiencies_disclosed": controls_deficient > 0,
                 "fraud_disclosure": False,
             },
-            "sox_404_assertion": {
+            sox_404_assertion={
                 "section": "SOX Section 404 — Management Assessment of Internal Controls",
                 "management_report_included": True,
                 "icfr_framework": f"COSO {coso_framework_version}",
@@ -464,12 +934,13 @@ class SOXComplianceAdapter:
                 "effective_controls": controls_effective,
                 "deficient_controls": controls_deficient,
                 "material_weaknesses": controls_material_weakness,
-                "effectiveness_rate_pct": round(effectiveness_rate, 2),
+                "effectiveness_rate_pct": effectiveness_rate_bp / 100,
             },
-            "generated_at": datetime.now(timezone.utc).isoformat(),
-            "attestation_period_end": fiscal_year_end.isoformat(),
-            "document_version": "1.0",
-        }
+            generated_at=now or _utcnow_iso(),
+            attestation_period_start=attestation_period_start.isoformat() if attestation_period_start else None,
+            attestation_period_end=fiscal_year_end.isoformat(),
+            document_version="1.0",
+        )
 
         logger.info(
             "SOX management assertion generated",
@@ -487,7 +958,8 @@ class SOXComplianceAdapter:
         tenant_id: uuid.UUID,
         evidence_records: list[dict[str, Any]],
         fiscal_year: int,
-    ) -> dict[str, Any]:
+        now: str | None = None,
+    ) -> AuditTrail:
         """Generate an immutable hash-chained SOX audit trail.
 
         Creates a cryptographically linked chain of evidence records
@@ -498,63 +970,90 @@ class SOXComplianceAdapter:
             tenant_id: Tenant UUID for scoping.
             evidence_records: List of evidence record dicts to chain.
             fiscal_year: Fiscal year the audit trail covers.
+            now: Optional ISO 8601 timestamp to stamp the result with, e.g. one
+                shared across a batch; defaults to the current UTC time.
 
         Returns:
-            Audit trail dict with hash chain and metadata.
+            AuditTrail with hash chain and metadata; use to_dict() for JSON.
+            The chain is columnar: one list per link field plus a single
+            chained_at timestamp; use as_rows() for per-link dicts.
         """
-        chain: list[dict[str, Any]] = []
-        previous_hash = "GENESIS"
-
-        for index, record in enumerate(evidence_records):
-            record_data = json.dumps(
-                {
-                    "index": index,
-                    "previous_hash": previous_hash,
-                    "control_id": record.get("control_id", ""),
-                    "evidence_type": record.get("evidence_type", ""),
-                    "collected_at": record.get("collected_at", ""),
-                    "integrity_hash": record.get("integrity_hash", ""),
-                },
-                sort_keys=True,
-            )
-            current_hash = hashlib.sha256(record_data.encode()).hexdigest()
-
-            chain.append(
-                {
-                    "chain_index": index,
-                    "control_id": record.get("control_id", ""),
-                    "evidence_type": record.get("evidence_type", ""),
-                    "previous_hash": previous_hash,
-                    "current_hash": current_hash,
-                    "chained_at": datetime.now(timezone.utc).isoformat(),
-                }
-            )
-            previous_hash = current_hash
-
-        audit_trail = {
-            "audit_trail_id": str(uuid.uuid4()),
-            "tenant_id": str(tenant_id),
-            "fiscal_year": fiscal_year,
-            "chain_length": len(chain),
-            "genesis_hash": "GENESIS",
-            "terminal_hash": previous_hash,
-            "chain": chain,
-            "retention_requirement_years": 7,
-            "retention_expiry_year": fiscal_year + 7,
-            "pcaob_compliant": True,
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+        # Encode every record first so the serial hash loop does no dict work
+        encoded_records = [_encode_chain_record(index, record) for index, record in enumerate(evidence_records)]
+        # Binds every link to the tenant and fiscal year of the trail
+        chain_prefix = _length_prefixed((str(tenant_id).encode(), str(fiscal_year).encode()))
+        digests = _chain_digests(chain_prefix, encoded_records)
+
+        current_hashes = [digest.hex() for digest in digests]
+        chain_length = len(current_hashes)
+        terminal_hash = current_hashes[-1] if current_hashes else _CHAIN_GENESIS
+        # One trail is one chaining event, so every link shares a timestamp
+        chained_at = now or _utcnow_iso()
+
+        chain: dict[str, Any] = {
+            "chain_index": list(range(chain_length)),
+            "control_id": [record.get("control_id", "") for record in evidence_records],
+            "evidence_type": [record.get("evidence_type", "") for record in evidence_records],
+            "previous_hash": [_CHAIN_GENESIS, *current_hashes[:-1]] if current_hashes else [],
+            "current_hash": current_hashes,
+            "chained_at": chained_at,
         }
 
+        audit_trail = AuditTrail(
+            audit_trail_id=str(uuid.uuid4()),
+            tenant_id=str(tenant_id),
+            fiscal_year=fiscal_year,
+            chain_length=chain_length,
+            genesis_hash=_CHAIN_GENESIS,
+            terminal_hash=terminal_hash,
+            chain=chain,
+            retention_requirement_years=7,
+            retention_expiry_year=fiscal_year + 7,
+            pcaob_compliant=True,
+            generated_at=chained_at,
+        )
+
         logger.info(
             "SOX audit trail generated",
             tenant_id=str(tenant_id),
             fiscal_year=fiscal_year,
-            chain_length=len(chain),
-            terminal_hash=previous_hash[:16] + "...",
+            chain_length=chain_length,
+            terminal_hash=terminal_hash[:16] + "...",
         )
 
         return audit_trail
 
+    @staticmethod
+    def chain_as_rows(chain: dict[str, Any]) -> list[dict[str, Any]]:
+        """Expand a columnar audit chain into one dict per link.
+
+        Args:
+            chain: The chain of a generate_audit_trail result.
+
+        Returns:
+            Link dicts with chain_index, control_id, evidence_type,
+            previous_hash, current_hash and chained_at keys.
+        """
+        chained_at = chain["chained_at"]
+        return [
+            {
+                "chain_index": chain_index,
+                "control_id": control_id,
+                "evidence_type": evidence_type,
+                "previous_hash": previous_hash,
+                "current_hash": current_hash,
+                "chained_at": chained_at,
+            }
+            for chain_index, control_id, evidence_type, previous_hash, current_hash in zip(
+                chain["chain_index"],
+                chain["control_id"],
+                chain["evidence_type"],
+                chain["previous_hash"],
+                chain["current_hash"],
+                strict=True,
+            )
+        ]
+
     def map_sox_articles(
         self,
         control_areas: list[str],
@@ -582,17 +1081,19 @@ class SOXComplianceAdapter:
             "control_area_mapping": {},
         }
 
-        all_articles: set[str] = set()
+        article_mask = 0
         for area in control_areas:
-            articles = _SOX_ARTICLE_MAP.get(area, ["SOX-404(a)"])
+            area_index = _area_index(area)
+            articles = _ARTICLES_BY_AREA[area_index]
             article_mapping["control_area_mapping"][area] = {
                 "applicable_articles": articles,
-                "coso_component": _COSO_COMPONENT_MAP.get(area, "Control Activities"),
+                "coso_component": _COSO_BY_AREA[area_index],
                 "key_control_required": area in ("ITGC", "FINANCIAL_REPORTING"),
             }
-            all_articles.update(articles)
+            article_mask |= _ARTICLE_MASK_BY_AREA[area_index]
 
-        article_mapping["all_applicable_articles"] = sorted(all_articles)
+        all_articles = [article for bit, article in enumerate(_SOX_ARTICLE_ORDER) if article_mask & (1 << bit)]
+        article_mapping["all_applicable_articles"] = all_articles
         article_mapping["compliance_scope"] = {
             "total_control_areas": len(control_areas),
             "sox_302_scope": include_management_assertion,
@@ -611,4 +1112,13 @@ class SOXComplianceAdapter:
         return article_mapping
 
 
-__all__ = ["SOXComplianceAdapter"]
+__all__ = [
+    "AuditTrail",
+    "ControlArea",
+    "ControlDefinition",
+    "DeficiencyClassification",
+    "EffectivenessResult",
+    "EvidencePackage",
+    "ManagementAssertion",
+    "SOXComplianceAdapter",
+]
@@ -6,12 +6,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
 from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
 
+# Prefix of every finding's remediation text, followed by the failed assertions
+_REMEDIATION_PREFIX: str = "Implement: "
+
 
 class CSPControlType(str, Enum):
     """SWIFT CSP CSCF v2025 control type classification."""
@@ -29,6 +34,15 @@ class CSPControl:
     control_type: CSPControlType
     description: str
     config_assertions: list[str]
+    # Per-control parts of a finding, fixed at definition time so scan() only adds the dynamic fields
+    finding_template: MappingProxyType[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.finding_template = MappingProxyType({
+            "control_id": self.control_id,
+            "title": self.title,
+            "type": self.control_type.value,
+        })
 
 
 # SWIFT CSCF v2025 mandatory controls (27 controls)
@@ -116,6 +130,22 @@ MANDATORY_CONTROLS: list[CSPControl] = [
                ["third_party_inventory", "annual_vendor_assessments"]),
 ]
 
+# Number of mandatory controls, the denominator of the mandatory score
+_N_MANDATORY: int = len(MANDATORY_CONTROLS)
+
+# Parallel per-control columns for the scan loop; MANDATORY_CONTROLS[i] is only read for findings
+_CONTROL_IDS: tuple[str, ...] = tuple(control.control_id for control in MANDATORY_CONTROLS)
+_CONTROL_ASSERTIONS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(control.config_assertions) for control in MANDATORY_CONTROLS
+)
+
+# Config assertions of all mandatory controls flattened in control order,
+# with each control's start offset and assertion count into the flat tuple
+_ALL_ASSERTIONS: tuple[str, ...] = tuple(assertion for assertions in _CONTROL_ASSERTIONS for assertion in assertions)
+_ASSERTION_COUNTS: np.ndarray = np.array([len(assertions) for assertions in _CONTROL_ASSERTIONS])
+_CONTROL_OFFSETS: np.ndarray = np.concatenate(([0], np.cumsum(_ASSERTION_COUNTS)[:-1]))
+_CONTROL_OFFSET_LIST: tuple[int, ...] = tuple(_CONTROL_OFFSETS.tolist())
+
 
 @dataclass
 class CSPScanResult:
@@ -149,31 +179,33 @@ class SWIFTCSPChecker:
         """
         result = CSPScanResult()
 
-        for control in MANDATORY_CONTROLS:
-            assertion_results = [
-                bool(environment_config.get(assertion, False))
-                for assertion in control.config_assertions
-            ]
-            passed = all(assertion_results)
+        # Evaluate every assertion in one gather, then AND each control's span
+        assertion_values = np.fromiter(
+            (bool(environment_config.get(assertion, False)) for assertion in _ALL_ASSERTIONS),
+            dtype=np.bool_,
+            count=len(_ALL_ASSERTIONS),
+        )
+        passed_mask = np.logical_and.reduceat(assertion_values, _CONTROL_OFFSETS).tolist()
+        assertion_results = assertion_values.tolist()
 
+        for i, passed in enumerate(passed_mask):
             if passed:
-                result.passed_controls.append(control.control_id)
+                result.passed_controls.append(_CONTROL_IDS[i])
             else:
-                result.failed_controls.append(control.control_id)
-                failed_assertions = [
-                    a for a, r in zip(control.config_assertions, assertion_results) if not r
-                ]
+                result.failed_controls.append(_CONTROL_IDS[i])
+                assertions = _CONTROL_ASSERTIONS[i]
+                offset = _CONTROL_OFFSET_LIST[i]
+                span = assertion_results[offset:offset + len(assertions)]
+                failed_assertions = [assertion for assertion, ok in zip(assertions, span, strict=True) if not ok]
+                control = MANDATORY_CONTROLS[i]
                 result.findings.append({
-                    "control_id": control.control_id,
-                    "title": control.title,
-                    "type": control.control_type.value,
+                    **control.finding_template,
                     "failed_assertions": failed_assertions,
-                    "remediation": f"Implement: {', '.join(failed_assertions)}",
+                    "remediation": _REMEDIATION_PREFIX + ", ".join(failed_assertions),
                 })
 
-        mandatory_passed = len([c for c in result.passed_controls if c in
-                                 {ctrl.control_id for ctrl in MANDATORY_CONTROLS}])
-        result.mandatory_score = mandatory_passed / len(MANDATORY_CONTROLS) if MANDATORY_CONTROLS else 0.0
+        # Every scanned control is mandatory, so each passed control counts
+        result.mandatory_score = len(result.passed_controls) / _N_MANDATORY if _N_MANDATORY else 0.0
         result.overall_compliant = len(result.failed_controls) == 0
 
         logger.info(
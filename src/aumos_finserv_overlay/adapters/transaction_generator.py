@@ -7,11 +7,15 @@ Uses Faker for realistic synthetic identifiers with all PII masked by default.
 
 import csv
 import io
+import itertools
+import math
+import os
 import random
-import uuid
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
+import numpy as np
 from aumos_common.observability import get_logger
 
 from aumos_finserv_overlay.api.schemas import SyntheticTransactionRequest, TransactionType
@@ -32,6 +36,17 @@ _MCC_CODES = [
     ("5999", "Miscellaneous and Specialty Retail Stores"),
 ]
 
+# Merchant name parts; prefixes rotate by merchant index, suffixes keyed by MCC
+_MERCHANT_PREFIXES: tuple[str, ...] = ("Metro", "City", "Quick", "Prime", "Central", "North", "South", "East", "West")
+_MERCHANT_SUFFIXES: dict[str, str] = {
+    "5411": "Grocers", "5812": "Restaurant", "5912": "Pharmacy", "5311": "Department Store",
+    "5734": "Electronics", "4814": "Telecom", "5541": "Gas Station", "7011": "Hotel",
+    "4511": "Airways", "5999": "Retail",
+}
+
+# Transactions formatted per streamed CSV chunk
+_CHUNK_ROWS: int = 10_000
+
 # Transaction channel distribution
 _CHANNELS = ["online", "in_store", "mobile_app", "atm", "wire", "ach"]
 
@@ -73,31 +88,27 @@ class TransactionGenerator:
         Returns:
             Synthetic merchant name string.
         """
-        prefixes = ["Metro", "City", "Quick", "Prime", "Central", "North", "South", "East", "West"]
-        suffixes = {
-            "5411": "Grocers", "5812": "Restaurant", "5912": "Pharmacy", "5311": "Department Store",
-            "5734": "Electronics", "4814": "Telecom", "5541": "Gas Station", "7011": "Hotel",
-            "4511": "Airways", "5999": "Retail",
-        }
-        suffix = suffixes.get(mcc_code, "Merchant")
-        prefix = prefixes[merchant_index % len(prefixes)]
+        suffix = _MERCHANT_SUFFIXES.get(mcc_code, "Merchant")
+        prefix = _MERCHANT_PREFIXES[merchant_index % len(_MERCHANT_PREFIXES)]
         return f"{prefix} {suffix} #{merchant_index:03d}"
 
     async def generate(
         self,
         request: SyntheticTransactionRequest,
-    ) -> tuple[bytes, int, int]:
-        """Generate synthetic transactions as CSV bytes.
+    ) -> AsyncIterator[tuple[bytes, int, int]]:
+        """Generate synthetic transactions as a stream of CSV chunks.
 
         Produces a CSV file with columns: transaction_id, timestamp,
         account_from, account_to, amount, currency, transaction_type,
         channel, merchant_name, merchant_mcc, is_fraud, fraud_reason.
+        The header is yielded first, then one chunk per _CHUNK_ROWS
+        transactions, so the full dataset is never held in memory.
 
         Args:
             request: Transaction generation parameters.
 
-        Returns:
-            Tuple of (CSV bytes, fraud_count, legitimate_count).
+        Yields:
+            Tuples of (CSV bytes, fraud_count, legitimate_count) for each chunk.
         """
         logger.info(
             "Starting synthetic transaction generation",
@@ -105,8 +116,6 @@ class TransactionGenerator:
             fraud_rate=request.fraud_rate,
         )
 
-        rng = random.Random(request.seed)
-
         # Pre-generate account pool
         accounts = [
             self._generate_account_id(i, request.pii_masked)
@@ -116,8 +125,9 @@ class TransactionGenerator:
         # Pre-generate merchant pool
         merchants = [
             (mcc, name, self._generate_merchant_name(mcc, idx))
-            for idx, (mcc, name) in enumerate(_MCC_CODES * ((request.num_accounts // len(_MCC_CODES)) + 1))
-            if idx < max(50, request.num_accounts // 10)
+            for idx, (mcc, name) in enumerate(
+                itertools.islice(itertools.cycle(_MCC_CODES), max(50, request.num_accounts // 10))
+            )
         ]
 
         # Date range setup
@@ -127,8 +137,11 @@ class TransactionGenerator:
         # Amount distribution
         amount_min = float(request.amount_min)
         amount_max = float(request.amount_max)
+        log_min = math.log(max(amount_min, 0.01))
+        log_max = math.log(max(amount_max, 1.0))
+        fraud_amount_min = amount_max * 0.5
 
-        # Build CSV in memory
+        # Reusable CSV buffer, drained after every chunk
         output = io.StringIO()
         fieldnames = [
             "transaction_id",
@@ -147,79 +160,105 @@ class TransactionGenerator:
         if request.include_device_data:
             fieldnames.extend(["device_id", "ip_address"])
 
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
-
-        fraud_count = 0
-        legitimate_count = 0
+        writer = csv.writer(output)
+        writer.writerow(fieldnames)
 
         transaction_types = request.transaction_types or [TransactionType.PAYMENT]
 
-        for _ in range(request.num_transactions):
-            is_fraud = rng.random() < request.fraud_rate
-            if is_fraud:
-                fraud_count += 1
-            else:
-                legitimate_count += 1
-
-            # Timestamp within date range
-            offset_seconds = rng.uniform(0, request.date_range_days * 86400)
-            timestamp = start_date + timedelta(seconds=offset_seconds)
-
-            # Accounts
-            account_from = rng.choice(accounts)
-            account_to = rng.choice([a for a in accounts if a != account_from])
-
-            # Amount — fraud transactions biased toward higher amounts
-            if is_fraud:
-                amount = rng.uniform(amount_max * 0.5, amount_max)
-            else:
-                # Log-normal distribution for realistic transaction amounts
-                import math
-                log_min = math.log(max(amount_min, 0.01))
-                log_max = math.log(max(amount_max, 1.0))
-                amount = math.exp(rng.uniform(log_min, log_max))
-
-            amount = max(amount_min, min(amount, amount_max))
-
-            tx_type = rng.choice(transaction_types).value
-            channel = rng.choice(_CHANNELS)
-
-            row: dict[str, str | float] = {
-                "transaction_id": str(uuid.uuid4()),
-                "timestamp": timestamp.isoformat(),
-                "account_from": account_from,
-                "account_to": account_to,
-                "amount": round(amount, 2),
-                "currency": request.currency,
-                "transaction_type": tx_type,
-                "channel": channel,
-                "is_fraud": "1" if is_fraud else "0",
-                "fraud_reason": "velocity_anomaly" if is_fraud else "",
-            }
-
-            if request.include_merchant_data and merchants:
-                mcc, mcc_name, merchant_name = rng.choice(merchants)
-                row["merchant_name"] = merchant_name
-                row["merchant_mcc"] = mcc
+        yield output.getvalue().encode("utf-8"), 0, 0
+        output.seek(0)
+        output.truncate(0)
 
-            if request.include_device_data:
-                row["device_id"] = f"DEV-{rng.randint(100000, 999999)}"
-                row["ip_address"] = (
-                    f"{rng.randint(10, 200)}.{rng.randint(0, 255)}"
-                    f".{rng.randint(0, 255)}.{rng.randint(1, 254)}"
-                )
+        # Timestamps are formatted in NumPy from a naive-UTC microsecond base
+        start_us = np.datetime64(start_date.replace(tzinfo=None), "us")
+
+        # Lookup pools indexed by the drawn column indices
+        num_accounts = len(accounts)
+        account_pool = np.asarray(accounts, dtype=object)
+        type_values = np.asarray([tx_type.value for tx_type in transaction_types], dtype=object)
+        channel_values = np.asarray(_CHANNELS, dtype=object)
+        merchant_names = np.asarray([merchant[2] for merchant in merchants], dtype=object)
+        merchant_mccs = np.asarray([merchant[0] for merchant in merchants], dtype=object)
 
-            writer.writerow(row)
+        np_rng = np.random.default_rng(request.seed)
+        fraud_count = 0
+        legitimate_count = 0
+        bytes_generated = 0
+
+        # Draw each chunk's columns in one vectorised pass; memory stays bounded by the chunk size
+        for chunk_start in range(0, request.num_transactions, _CHUNK_ROWS):
+            num_rows = min(_CHUNK_ROWS, request.num_transactions - chunk_start)
+
+            fraud_mask = np_rng.random(num_rows) < request.fraud_rate
+            chunk_fraud = int(np.count_nonzero(fraud_mask))
+
+            # Timestamps within the date range
+            offsets = np_rng.uniform(0, request.date_range_days * 86400, num_rows)
+
+            # Counterparty is offset by 1..n-1 so it never equals the sender
+            from_idx = np_rng.integers(0, num_accounts, num_rows)
+            to_idx = (from_idx + np_rng.integers(1, num_accounts, num_rows)) % num_accounts
+
+            # Log-normal amounts for legitimate rows; fraud rows biased toward higher amounts
+            amounts = np.exp(np_rng.uniform(log_min, log_max, num_rows))
+            amounts[fraud_mask] = np_rng.uniform(fraud_amount_min, amount_max, chunk_fraud)
+            np.clip(amounts, amount_min, amount_max, out=amounts)
+
+            type_idx = np_rng.integers(0, len(transaction_types), num_rows)
+            channel_idx = np_rng.integers(0, len(_CHANNELS), num_rows)
+
+            # One urandom read for every id, stamped with the UUIDv4 version/variant bits
+            id_bytes = np.frombuffer(os.urandom(16 * num_rows), dtype=np.uint8).reshape(num_rows, 16).copy()
+            id_bytes[:, 6] = (id_bytes[:, 6] & 0x0F) | 0x40
+            id_bytes[:, 8] = (id_bytes[:, 8] & 0x3F) | 0x80
+            raw_ids = id_bytes.tobytes()
+
+            columns: list[Iterable[object]] = [
+                [raw_ids[start:start + 16].hex() for start in range(0, 16 * num_rows, 16)],
+                np.char.add(
+                    np.datetime_as_string(start_us + np.rint(offsets * 1e6).astype("timedelta64[us]"), unit="us"),
+                    "+00:00",
+                ).tolist(),
+                account_pool[from_idx].tolist(),
+                account_pool[to_idx].tolist(),
+                np.round(amounts, 2).tolist(),
+                itertools.repeat(request.currency, num_rows),
+                type_values[type_idx].tolist(),
+                channel_values[channel_idx].tolist(),
+                np.where(fraud_mask, "1", "0").tolist(),
+                np.where(fraud_mask, "velocity_anomaly", "").tolist(),
+            ]
+
+            if request.include_merchant_data:
+                merchant_idx = np_rng.integers(0, len(merchants), num_rows)
+                columns.append(merchant_names[merchant_idx].tolist())
+                columns.append(merchant_mccs[merchant_idx].tolist())
 
-        csv_bytes = output.getvalue().encode("utf-8")
+            if request.include_device_data:
+                device_numbers = np_rng.integers(100000, 1000000, num_rows)
+                octets = np.column_stack((
+                    np_rng.integers(10, 201, num_rows),
+                    np_rng.integers(0, 256, num_rows),
+                    np_rng.integers(0, 256, num_rows),
+                    np_rng.integers(1, 255, num_rows),
+                ))
+                columns.append([f"DEV-{number}" for number in device_numbers.tolist()])
+                columns.append([".".join(map(str, row)) for row in octets.tolist()])
+
+            writer.writerows(zip(*columns, strict=True))
+            chunk = output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
+
+            fraud_count += chunk_fraud
+            legitimate_count += num_rows - chunk_fraud
+            bytes_generated += len(chunk)
+            yield chunk, chunk_fraud, num_rows - chunk_fraud
 
         logger.info(
             "Synthetic transaction generation complete",
             total=request.num_transactions,
             fraud_count=fraud_count,
             legitimate_count=legitimate_count,
-            bytes_generated=len(csv_bytes),
+            bytes_generated=bytes_generated,
         )
-
-        return csv_bytes, fraud_count, legitimate_count
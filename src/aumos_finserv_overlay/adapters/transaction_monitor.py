@@ -4,8 +4,12 @@ GAP-292: Real-Time Transaction Monitoring.
 """
 from __future__ import annotations
 
-import asyncio
+import re
+import sys
+import time
+from collections import OrderedDict
 from decimal import Decimal
+from typing import Generic, TypeVar
 from uuid import UUID
 
 from aumos_common.events import EventConsumer, EventPublisher
@@ -19,6 +23,59 @@ FATF_REPORTING_THRESHOLD_USD: Decimal = Decimal("1000.00")
 CTR_THRESHOLD_USD: Decimal = Decimal("10000.00")
 # Structuring detection window (seconds)
 STRUCTURING_WINDOW_SECONDS: int = 86_400  # 24 hours
+# Risk scores are integer points out of _SCORE_SCALE (0-100 == 0.0-1.0) so layer sums stay exact
+_SCORE_SCALE: int = 100
+# Score at which a transaction is CRITICAL; remaining layers cannot lower it, so scoring stops
+_CRITICAL_POINTS: int = 80
+# How long a per-account window aggregate is reused before re-querying the repository
+_WINDOW_CACHE_TTL_SECONDS: float = 5.0
+# Upper bound on accounts held in each window cache (oldest evicted first)
+_WINDOW_CACHE_MAX_ENTRIES: int = 100_000
+
+# Word tokens of a casefolded party name; punctuation and initials' dots are dropped
+_NAME_TOKEN_RE: re.Pattern[str] = re.compile(r"\w+")
+
+_V = TypeVar("_V")
+
+
+class _TTLCache(Generic[_V]):
+    """Bounded LRU cache whose entries expire a fixed time after insertion."""
+
+    __slots__ = ("_entries", "_maxsize", "_ttl")
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._entries: OrderedDict[str, tuple[float, _V]] = OrderedDict()
+        self._maxsize = maxsize
+        self._ttl = ttl
+
+    def get(self, key: str) -> _V | None:
+        """Return the live value for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: _V) -> None:
+        """Store value for key, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def replace(self, key: str, value: _V) -> None:
+        """Swap the value of a live entry for key, keeping its original expiry; no-op otherwise."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries[key] = (entry[0], value)
+
+    def pop(self, key: str) -> None:
+        """Drop key if present."""
+        self._entries.pop(key, None)
 
 
 class IAMLAlertRepository:
@@ -67,6 +124,16 @@ class AMLAlert:
         self.risk_score = risk_score
 
 
+def _normalise_name(name: str) -> str:
+    """Normalise a party name for sanctions comparison."""
+    return name.casefold().strip()
+
+
+def _name_tokens(name: str) -> frozenset[str]:
+    """Split a party name into its casefolded word tokens."""
+    return frozenset(_NAME_TOKEN_RE.findall(name.casefold()))
+
+
 class TransactionMonitor:
     """Kafka Streams consumer for real-time AML transaction screening.
 
@@ -87,7 +154,19 @@ class TransactionMonitor:
         self._alert_repo = alert_repository
         self._publisher = event_publisher
         self._consumer = event_consumer
-        self._sanctions_list = sanctions_list
+        # Names are casefolded and stripped once here so screening is case-insensitive
+        self._sanctions_list: frozenset[str] = frozenset(
+            sys.intern(_normalise_name(name)) for name in sanctions_list
+        )
+        # Alias matching: each entry's token set, indexed under its longest (most selective) token
+        self._sanctions_by_token: dict[str, list[frozenset[str]]] = {}
+        for name in self._sanctions_list:
+            tokens = _name_tokens(name)
+            if tokens:
+                self._sanctions_by_token.setdefault(max(tokens, key=len), []).append(tokens)
+        # Bursts from one sender reuse the same window aggregates for a few seconds
+        self._24h_totals: _TTLCache[Decimal] = _TTLCache(_WINDOW_CACHE_MAX_ENTRIES, _WINDOW_CACHE_TTL_SECONDS)
+        self._1h_counts: _TTLCache[int] = _TTLCache(_WINDOW_CACHE_MAX_ENTRIES, _WINDOW_CACHE_TTL_SECONDS)
 
     async def start(self) -> None:
         """Start consuming fsv.transactions.created topic."""
@@ -99,17 +178,23 @@ class TransactionMonitor:
 
     async def _process_transaction(self, payload: dict) -> None:
         """Score a single transaction for AML risk."""
-        score, reasons = await self._compute_risk_score(payload)
-        severity = self._score_to_severity(score)
+        amount = Decimal(str(payload.get("amount_usd", "0")))
+        points, reasons = await self._compute_risk_score(payload, amount)
+        self._record_scored_transaction(payload["sender_account"], amount)
+        severity = self._score_to_severity(points)
 
         if severity != AMLSeverity.NONE:
+            score = points / _SCORE_SCALE
             alert = await self._alert_repo.create(
                 tenant_id=UUID(payload["tenant_id"]),
                 transaction_id=UUID(payload["transaction_id"]),
-                risk_score=score,
+                risk_score=Decimal(points) / _SCORE_SCALE,
                 severity=severity,
                 reasons=reasons,
             )
+            # The new alert may change the repository aggregates for this sender
+            self._24h_totals.pop(payload["sender_account"])
+            self._1h_counts.pop(payload["sender_account"])
             await self._publisher.publish(
                 topic="fsv.aml.alert.raised",
                 key=str(alert.id),
@@ -117,7 +202,7 @@ class TransactionMonitor:
                     "alert_id": str(alert.id),
                     "transaction_id": payload["transaction_id"],
                     "severity": severity.value,
-                    "risk_score": float(score),
+                    "risk_score": score,
                     "reasons": reasons,
                 },
             )
@@ -125,69 +210,112 @@ class TransactionMonitor:
                 "aml_alert_raised",
                 alert_id=str(alert.id),
                 severity=severity.value,
-                score=float(score),
+                score=score,
             )
 
-    async def _compute_risk_score(self, payload: dict) -> tuple[Decimal, list[str]]:
-        """Multi-layer risk scoring returning (0.0-1.0, reason_list)."""
-        score = Decimal("0.0")
+    def _record_scored_transaction(self, account: str, amount: Decimal) -> None:
+        """Fold a scored transaction into the sender's cached window aggregates.
+
+        Keeps a burst from one sender visible to structuring and velocity
+        checks while the cached repository values are still live.
+        """
+        window_total = self._24h_totals.get(account)
+        if window_total is not None:
+            self._24h_totals.replace(account, window_total + amount)
+        count_1h = self._1h_counts.get(account)
+        if count_1h is not None:
+            self._1h_counts.replace(account, count_1h + 1)
+
+    async def _compute_risk_score(self, payload: dict, amount: Decimal) -> tuple[int, list[str]]:
+        """Multi-layer risk scoring returning (0-100 points, reason_list).
+
+        Layers run cheapest-first; once the score reaches CRITICAL the
+        repository-backed layers are skipped.
+        """
+        points = 0
         reasons: list[str] = []
-        amount = Decimal(str(payload.get("amount_usd", "0")))
 
         # Layer 1: threshold checks (FATF, BSA)
         if amount > CTR_THRESHOLD_USD:
-            score += Decimal("0.3")
+            points += 30
             reasons.append(f"Amount {amount} exceeds CTR threshold")
 
-        # Layer 2: structuring detection
-        structuring_score = await self._detect_structuring(payload["sender_account"], amount)
-        score += structuring_score
-        if structuring_score > Decimal("0.1"):
-            reasons.append("Potential structuring pattern detected in 24h window")
-
-        # Layer 3: sanctions screening
-        if payload.get("sender_name") in self._sanctions_list:
-            score += Decimal("0.5")
+        # Layer 2: sanctions screening
+        sender_name = payload.get("sender_name")
+        if sender_name and self._is_sanctioned(sender_name):
+            points += 50
             reasons.append("Sender name matches OFAC/HMT sanctions list")
+            if points >= _CRITICAL_POINTS:
+                return min(points, _SCORE_SCALE), reasons
+
+        # Layer 3: structuring detection
+        structuring_points = await self._detect_structuring(payload["sender_account"], amount)
+        points += structuring_points
+        if structuring_points > 10:
+            reasons.append("Potential structuring pattern detected in 24h window")
+        if points >= _CRITICAL_POINTS:
+            return min(points, _SCORE_SCALE), reasons
 
         # Layer 4: velocity check
-        velocity_score = await self._check_velocity(payload["sender_account"])
-        score += velocity_score
-        if velocity_score > Decimal("0.1"):
+        velocity_points = await self._check_velocity(payload["sender_account"])
+        points += velocity_points
+        if velocity_points > 10:
             reasons.append("Abnormal transaction velocity in rolling window")
 
-        return min(score, Decimal("1.0")), reasons
+        return min(points, _SCORE_SCALE), reasons
 
-    async def _detect_structuring(self, account: str, amount: Decimal) -> Decimal:
+    def _is_sanctioned(self, name: str) -> bool:
+        """Check a party name against the sanctions list.
+
+        Exact (normalised) matches hit the frozenset directly. Otherwise the
+        name matches when it contains every token of a sanctioned entry, so
+        "JOHN A. DOE" and "Doe, John" both match "John Doe".
+        """
+        if _normalise_name(name) in self._sanctions_list:
+            return True
+        tokens = _name_tokens(name)
+        for token in tokens:
+            for entry_tokens in self._sanctions_by_token.get(token, ()):
+                if entry_tokens <= tokens:
+                    return True
+        return False
+
+    async def _detect_structuring(self, account: str, amount: Decimal) -> int:
         """Detect sub-threshold structuring (smurfing) within 24h window.
 
         Structuring occurs when multiple transactions just below the CTR
         threshold accumulate to exceed it — a FATF red-flag typology.
         """
-        window_total = await self._alert_repo.get_24h_total(account)
+        window_total = self._24h_totals.get(account)
+        if window_total is None:
+            window_total = await self._alert_repo.get_24h_total(account)
+            self._24h_totals.set(account, window_total)
         combined = window_total + amount
         if combined > CTR_THRESHOLD_USD and amount < CTR_THRESHOLD_USD:
-            return Decimal("0.35")
-        return Decimal("0.0")
+            return 35
+        return 0
 
-    async def _check_velocity(self, account: str) -> Decimal:
+    async def _check_velocity(self, account: str) -> int:
         """Score transaction frequency anomaly against historical baseline."""
-        count_1h = await self._alert_repo.get_1h_count(account)
+        count_1h = self._1h_counts.get(account)
+        if count_1h is None:
+            count_1h = await self._alert_repo.get_1h_count(account)
+            self._1h_counts.set(account, count_1h)
         if count_1h > 20:
-            return Decimal("0.25")
+            return 25
         if count_1h > 10:
-            return Decimal("0.1")
-        return Decimal("0.0")
+            return 10
+        return 0
 
     @staticmethod
-    def _score_to_severity(score: Decimal) -> AMLSeverity:
-        """Map numeric risk score to severity tier."""
-        if score >= Decimal("0.8"):
+    def _score_to_severity(points: int) -> AMLSeverity:
+        """Map risk score points (0-100) to severity tier."""
+        if points >= _CRITICAL_POINTS:
             return AMLSeverity.CRITICAL
-        if score >= Decimal("0.6"):
+        if points >= 60:
             return AMLSeverity.HIGH
-        if score >= Decimal("0.4"):
+        if points >= 40:
             return AMLSeverity.MEDIUM
-        if score >= Decimal("0.2"):
+        if points >= 20:
             return AMLSeverity.LOW
         return AMLSeverity.NONE
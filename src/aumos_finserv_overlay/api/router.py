@@ -4,7 +4,9 @@ All routes are thin — they validate inputs, extract auth context,
 delegate to services, and return typed responses.
 """
 
+import inspect
 import uuid
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
@@ -53,7 +55,15 @@ from aumos_finserv_overlay.core.services import (
 from aumos_finserv_overlay.settings import Settings
 
 logger = get_logger(__name__)
-settings = Settings()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance."""
+    return Settings()
+
+
+settings = get_settings()
 
 router = APIRouter(tags=["finserv"])
 
@@ -63,72 +73,149 @@ router = APIRouter(tags=["finserv"])
 # ============================================================================
 
 
-def get_sox_service(
+@lru_cache(maxsize=1)
+def get_event_publisher() -> FinServEventPublisher:
+    """Return the process-wide event publisher, created on first use.
+
+    The underlying Kafka producer holds broker connections, so it is shared
+    across requests instead of being constructed per request.
+    """
+    return FinServEventPublisher()
+
+
+async def close_event_publisher() -> None:
+    """Close the shared event publisher if one was created.
+
+    The base EventPublisher does not guarantee a close() method, so it is
+    only called when the publisher provides one, and its result awaited
+    only when close() is a coroutine; the cached instance is dropped
+    either way.
+    """
+    if not get_event_publisher.cache_info().currsize:
+        return
+    close = getattr(get_event_publisher(), "close", None)
+    get_event_publisher.cache_clear()
+    if callable(close):
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+
+
+def get_sox_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> SOXEvidenceRepository:
+    """Build the request-scoped SOXEvidenceRepository."""
+    return SOXEvidenceRepository(session)
+
+
+def get_model_risk_repository(
     session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> ModelRiskRepository:
+    """Build the request-scoped ModelRiskRepository."""
+    return ModelRiskRepository(session)
+
+
+def get_pci_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> PCIDSSRepository:
+    """Build the request-scoped PCIDSSRepository."""
+    return PCIDSSRepository(session)
+
+
+def get_dora_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> DORARepository:
+    """Build the request-scoped DORARepository."""
+    return DORARepository(session)
+
+
+def get_transaction_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> SyntheticTransactionRepository:
+    """Build the request-scoped SyntheticTransactionRepository."""
+    return SyntheticTransactionRepository(session)
+
+
+def get_report_repository(
+    session: Annotated[AsyncSession, Depends(get_db_session)],
+) -> RegulatoryReportRepository:
+    """Build the request-scoped RegulatoryReportRepository."""
+    return RegulatoryReportRepository(session)
+
+
+def get_sox_service(
+    sox_repository: Annotated[SOXEvidenceRepository, Depends(get_sox_repository)],
 ) -> SOXComplianceService:
     """Build SOXComplianceService with injected dependencies."""
     return SOXComplianceService(
-        sox_repository=SOXEvidenceRepository(session),
-        event_publisher=FinServEventPublisher(),
+        sox_repository=sox_repository,
+        event_publisher=get_event_publisher(),
         settings=settings,
     )
 
 
 def get_model_risk_service(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    model_risk_repository: Annotated[ModelRiskRepository, Depends(get_model_risk_repository)],
 ) -> ModelRiskService:
     """Build ModelRiskService with injected dependencies."""
     return ModelRiskService(
-        model_risk_repository=ModelRiskRepository(session),
-        event_publisher=FinServEventPublisher(),
+        model_risk_repository=model_risk_repository,
+        event_publisher=get_event_publisher(),
         settings=settings,
     )
 
 
 def get_pci_service(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    pci_repository: Annotated[PCIDSSRepository, Depends(get_pci_repository)],
 ) -> PCIDSSService:
     """Build PCIDSSService with injected dependencies."""
     return PCIDSSService(
-        pci_repository=PCIDSSRepository(session),
-        event_publisher=FinServEventPublisher(),
+        pci_repository=pci_repository,
+        event_publisher=get_event_publisher(),
         settings=settings,
     )
 
 
 def get_dora_service(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    dora_repository: Annotated[DORARepository, Depends(get_dora_repository)],
 ) -> DORAService:
     """Build DORAService with injected dependencies."""
     return DORAService(
-        dora_repository=DORARepository(session),
-        event_publisher=FinServEventPublisher(),
+        dora_repository=dora_repository,
+        event_publisher=get_event_publisher(),
         settings=settings,
     )
 
 
 def get_synth_service(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    transaction_repository: Annotated[SyntheticTransactionRepository, Depends(get_transaction_repository)],
 ) -> SyntheticTransactionService:
     """Build SyntheticTransactionService with injected dependencies."""
     return SyntheticTransactionService(
-        transaction_repository=SyntheticTransactionRepository(session),
+        transaction_repository=transaction_repository,
         transaction_generator=TransactionGenerator(),
-        event_publisher=FinServEventPublisher(),
+        event_publisher=get_event_publisher(),
         settings=settings,
     )
 
 
 def get_report_service(
-    session: Annotated[AsyncSession, Depends(get_db_session)],
+    report_repository: Annotated[RegulatoryReportRepository, Depends(get_report_repository)],
+    model_risk_repository: Annotated[ModelRiskRepository, Depends(get_model_risk_repository)],
+    sox_repository: Annotated[SOXEvidenceRepository, Depends(get_sox_repository)],
 ) -> RegulatoryReportService:
-    """Build RegulatoryReportService with injected dependencies."""
+    """Build RegulatoryReportService with injected dependencies.
+
+    The model-risk and SOX repositories come from the same per-request
+    providers as their own services, so FastAPI's dependency cache hands
+    every consumer in a request the same instances.
+    """
     return RegulatoryReportService(
-        report_repository=RegulatoryReportRepository(session),
-        model_risk_repository=ModelRiskRepository(session),
-        sox_repository=SOXEvidenceRepository(session),
+        report_repository=report_repository,
+        model_risk_repository=model_risk_repository,
+        sox_repository=sox_repository,
         report_generator=ReportGenerator(settings),
-        event_publisher=FinServEventPublisher(),
+        event_publisher=get_event_publisher(),
         settings=settings,
     )
 
@@ -294,7 +381,8 @@ async def generate_synthetic_transactions(
     summary="List regulatory reports",
     description=(
         "List all regulatory reports generated for the tenant, optionally filtered "
-        "by regulator (SEC, CFPB, FINRA, OCC, FDIC, FRB). Results are paginated."
+        "by regulator (SEC, CFPB, FINRA, OCC, FDIC, FRB). Results are paginated; pass the "
+        "returned next_cursor as cursor to fetch the following page without OFFSET."
     ),
 )
 async def list_regulatory_reports(
@@ -303,6 +391,7 @@ async def list_regulatory_reports(
     regulator: str | None = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str | None = None,
 ) -> RegulatoryReportListResponse:
     """List regulatory reports for a tenant."""
     page_request = PageRequest(page=page, page_size=page_size)
@@ -310,6 +399,7 @@ async def list_regulatory_reports(
         tenant_id=tenant,
         regulator=regulator,
         page_request=page_request,
+        cursor=cursor,
     )
 
 
@@ -490,3 +490,7 @@ class RegulatoryReportListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor for the following page; pass as ?cursor= to continue, null on the last page",
+    )
@@ -6,9 +6,19 @@ and test substitution without inheritance.
 """
 
 import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime
 from decimal import Decimal
 from typing import Any, Protocol, runtime_checkable
 
+from aumos_finserv_overlay.adapters.sox_compliance import (
+    AuditTrail,
+    ControlDefinition,
+    DeficiencyClassification,
+    EffectivenessResult,
+    EvidencePackage,
+    ManagementAssertion,
+)
 from aumos_finserv_overlay.api.schemas import (
     DORAStatusResponse,
     ModelRiskAssessmentRequest,
@@ -56,14 +66,24 @@ class SOXEvidenceRepositoryProtocol(Protocol):
         control_area: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[Any], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[Any], int, tuple[datetime, uuid.UUID] | None]:
         """List SOX evidence records for a tenant with optional area filter.
 
         Returns:
-            Tuple of (records list, total count).
+            Tuple of (records list, total count, next cursor).
         """
         ...
 
+    def stream_by_tenant(
+        self,
+        tenant_id: uuid.UUID,
+        control_area: str | None = None,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Stream all SOX evidence records for a tenant, newest first."""
+        ...
+
     async def update_status(
         self,
         evidence_id: uuid.UUID,
@@ -100,7 +120,8 @@ class ModelRiskRepositoryProtocol(Protocol):
         risk_tier: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[Any], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[Any], int, tuple[datetime, uuid.UUID] | None]:
         """List model risk assessments for a tenant with optional tier filter."""
         ...
 
@@ -161,7 +182,8 @@ class DORARepositoryProtocol(Protocol):
         tenant_id: uuid.UUID,
         page: int,
         page_size: int,
-    ) -> tuple[list[Any], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[Any], int, tuple[datetime, uuid.UUID] | None]:
         """List DORA assessments for a tenant."""
         ...
 
@@ -219,7 +241,8 @@ class RegulatoryReportRepositoryProtocol(Protocol):
         regulator: str | None,
         page: int,
         page_size: int,
-    ) -> tuple[list[Any], int]:
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[Any], int, tuple[datetime, uuid.UUID] | None]:
         """List regulatory reports for a tenant."""
         ...
 
@@ -243,17 +266,17 @@ class TransactionGeneratorProtocol(Protocol):
     and demographic distributions.
     """
 
-    async def generate(
+    def generate(
         self,
         request: SyntheticTransactionRequest,
-    ) -> tuple[bytes, int, int]:
-        """Generate synthetic transactions and return serialised output.
+    ) -> AsyncIterator[tuple[bytes, int, int]]:
+        """Generate synthetic transactions as a stream of serialised chunks.
 
         Args:
             request: Transaction generation parameters.
 
-        Returns:
-            Tuple of (CSV/JSON bytes, fraud_count, legitimate_count).
+        Yields:
+            Tuples of (CSV/JSON bytes, fraud_count, legitimate_count) per chunk.
         """
         ...
 
@@ -272,6 +295,8 @@ class ReportGeneratorProtocol(Protocol):
         tenant_id: uuid.UUID,
         model_assessments: list[dict[str, Any]],
         sox_evidence_items: list[dict[str, Any]],
+        model_assessments_raw: bytes | None = None,
+        sox_evidence_items_raw: bytes | None = None,
     ) -> tuple[bytes, str, int]:
         """Render a regulatory report document.
 
@@ -280,6 +305,10 @@ class ReportGeneratorProtocol(Protocol):
             tenant_id: Tenant owning the report.
             model_assessments: SR 11-7 assessment data to include.
             sox_evidence_items: SOX evidence items to reference.
+            model_assessments_raw: Optional pre-encoded JSON array embedded in
+                place of model_assessments without re-serialisation.
+            sox_evidence_items_raw: Optional pre-encoded JSON array embedded in
+                place of sox_evidence_items without re-serialisation.
 
         Returns:
             Tuple of (document bytes, format string, page count).
@@ -335,42 +364,81 @@ class SOXComplianceAdapterProtocol(Protocol):
         self,
         control_id: str,
         control_area: str,
-        description: str,
+        control_description: str,
+        control_owner: str,
         is_key_control: bool,
-    ) -> dict: ...
+        frequency: str,
+        automated: bool,
+        review_period_start: datetime,
+        review_period_end: datetime,
+        metadata: dict[str, Any] | None = None,
+        now: str | None = None,
+    ) -> ControlDefinition: ...
 
     def collect_evidence(
         self,
         control_id: str,
-        evidence_type: str,
+        control_area: str,
         evidence_description: str,
-        artifacts: list[str],
-    ) -> dict: ...
+        evidence_artifacts: list[str],
+        evidence_type: str,
+        review_period_start: datetime,
+        review_period_end: datetime,
+        control_owner: str,
+        is_key_control: bool,
+        now: str | None = None,
+    ) -> EvidencePackage: ...
 
     def test_control_effectiveness(
         self,
         control_id: str,
-        test_results: list[dict],
+        control_area: str,
+        is_key_control: bool,
+        test_steps: list[dict[str, Any]],
+        population_size: int,
         sample_size: int,
-    ) -> dict: ...
+        automated_control: bool,
+        now: str | None = None,
+    ) -> EffectivenessResult: ...
 
     def classify_deficiency(
         self,
-        test_result: dict,
+        control_id: str,
+        deficiency_description: str,
+        financial_statement_impact: str,
         is_key_control: bool,
-    ) -> dict: ...
+        compensating_controls: list[str],
+        management_override_risk: bool,
+        now: str | None = None,
+    ) -> DeficiencyClassification: ...
 
     def generate_management_assertion(
         self,
-        control_results: list[dict],
-        reporting_period_start: str,
-        reporting_period_end: str,
+        tenant_id: uuid.UUID,
         entity_name: str,
-    ) -> dict: ...
+        fiscal_year_end: datetime,
+        controls_effective: int,
+        controls_deficient: int,
+        controls_material_weakness: int,
+        coso_framework_version: str = "2013",
+        attestation_period_start: datetime | None = None,
+        now: str | None = None,
+    ) -> ManagementAssertion: ...
 
-    def generate_audit_trail(self, evidence_chain: list[dict]) -> dict: ...
+    def generate_audit_trail(
+        self,
+        tenant_id: uuid.UUID,
+        evidence_records: list[dict[str, Any]],
+        fiscal_year: int,
+        now: str | None = None,
+    ) -> AuditTrail: ...
 
-    def map_sox_articles(self) -> dict: ...
+    def map_sox_articles(
+        self,
+        control_areas: list[str],
+        include_management_assertion: bool,
+        include_auditor_attestation: bool,
+    ) -> dict[str, Any]: ...
 
 
 @runtime_checkable
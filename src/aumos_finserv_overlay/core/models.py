@@ -9,7 +9,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import Enum as SAEnum
@@ -17,6 +17,26 @@ from sqlalchemy import Enum as SAEnum
 from aumos_common.database import AumOSModel
 
 
+def _keyset_pagination_index(model: type[AumOSModel]) -> Index:
+    """Index a model for list_by_tenant keyset pagination.
+
+    Covers the tenant filter and the newest-first (created_at, id) order,
+    with id as tiebreaker, so pages seek instead of scanning.
+
+    Args:
+        model: Mapped class whose table receives the index.
+
+    Returns:
+        The index, attached to the model's table.
+    """
+    return Index(
+        f"ix_{model.__tablename__}_tenant_created_id",
+        model.tenant_id,
+        model.created_at.desc(),
+        model.id.desc(),
+    )
+
+
 class SOXEvidence(AumOSModel):
     """SOX compliance evidence record.
 
@@ -97,6 +117,9 @@ class SOXEvidence(AumOSModel):
     )
 
 
+_keyset_pagination_index(SOXEvidence)
+
+
 class ModelRiskAssessment(AumOSModel):
     """SR 11-7 model risk assessment record.
 
@@ -229,6 +252,9 @@ class ModelRiskAssessment(AumOSModel):
     )
 
 
+_keyset_pagination_index(ModelRiskAssessment)
+
+
 class PCIDSSControl(AumOSModel):
     """PCI DSS control compliance record.
 
@@ -365,6 +391,9 @@ class DORAAssessment(AumOSModel):
     )
 
 
+_keyset_pagination_index(DORAAssessment)
+
+
 class SyntheticTransaction(AumOSModel):
     """Synthetic financial transaction record.
 
@@ -491,6 +520,9 @@ class RegulatoryReport(AumOSModel):
     )
 
 
+_keyset_pagination_index(RegulatoryReport)
+
+
 # ---------------------------------------------------------------------------
 # GAP-292: AML Alerts (Real-time transaction monitoring)
 # ---------------------------------------------------------------------------
@@ -28,6 +28,8 @@ from aumos_finserv_overlay.adapters.repositories import (
     RegulatoryReportRepository,
     SOXEvidenceRepository,
     SyntheticTransactionRepository,
+    decode_page_cursor,
+    encode_page_cursor,
 )
 from aumos_finserv_overlay.adapters.report_generator import ReportGenerator
 from aumos_finserv_overlay.adapters.sox_compliance import SOXComplianceAdapter
@@ -63,6 +65,9 @@ from aumos_finserv_overlay.settings import Settings
 
 logger = get_logger(__name__)
 
+# Effectiveness ratings produced by SOXComplianceAdapter.test_control_effectiveness
+_SOX_EFFECTIVENESS_RATINGS: tuple[str, ...] = ("EFFECTIVE", "DEFICIENCY", "SIGNIFICANT_DEFICIENCY", "MATERIAL_WEAKNESS")
+
 
 class SOXComplianceService:
     """Manages SOX compliance evidence collection and status reporting.
@@ -159,22 +164,27 @@ class SOXComplianceService:
         Returns:
             SOXStatusResponse with aggregated compliance metrics.
         """
-        all_evidence, total = await self._repo.list_by_tenant(
-            tenant_id=tenant_id,
-            control_area=None,
-            page=1,
-            page_size=10_000,
-        )
-
-        approved = sum(1 for e in all_evidence if e.status == "approved")
-        pending_review = sum(1 for e in all_evidence if e.status == "pending_review")
-        deficiencies = sum(1 for e in all_evidence if e.status == "deficiency")
-        remediation_required = sum(1 for e in all_evidence if e.status == "remediation_required")
-
+        # Streamed from a server-side cursor and tallied in one pass, so no
+        # evidence list is materialised and no page-size cap truncates it
+        total = 0
+        approved = 0
+        pending_review = 0
+        deficiencies = 0
+        remediation_required = 0
         # Material weakness threshold: any deficiency on a key control
-        material_weaknesses = sum(
-            1 for e in all_evidence if e.status == "deficiency" and e.is_key_control
-        )
+        material_weaknesses = 0
+        async for evidence in self._repo.stream_by_tenant(tenant_id=tenant_id):
+            total += 1
+            if evidence.status == "approved":
+                approved += 1
+            elif evidence.status == "pending_review":
+                pending_review += 1
+            elif evidence.status == "deficiency":
+                deficiencies += 1
+                if evidence.is_key_control:
+                    material_weaknesses += 1
+            elif evidence.status == "remediation_required":
+                remediation_required += 1
 
         compliance_pct = (approved / total * 100) if total > 0 else 0.0
         attestation_ready = deficiencies == 0 and material_weaknesses == 0 and pending_review == 0
@@ -878,7 +888,11 @@ class SyntheticTransactionService:
         created_job = await self._repo.create(job)
 
         try:
-            output_bytes, fraud_count, legitimate_count = await self._generator.generate(request)
+            fraud_count = 0
+            legitimate_count = 0
+            async for _chunk, chunk_fraud, chunk_legitimate in self._generator.generate(request):
+                fraud_count += chunk_fraud
+                legitimate_count += chunk_legitimate
 
             output_key = f"tenants/{tenant_id}/synth-transactions/{created_job.id}.csv"
             output_uri = f"s3://{self._settings.synth_output_bucket}/{output_key}"
@@ -972,6 +986,7 @@ class RegulatoryReportService:
         tenant_id: uuid.UUID,
         regulator: str | None,
         page_request: PageRequest,
+        cursor: str | None = None,
     ) -> RegulatoryReportListResponse:
         """List regulatory reports for a tenant.
 
@@ -979,21 +994,35 @@ class RegulatoryReportService:
             tenant_id: Tenant requesting the list.
             regulator: Optional regulator filter.
             page_request: Pagination parameters.
+            cursor: Optional next_cursor token from a previous page. When
+                given, the page seeks past that position instead of using
+                OFFSET, and page_request.page is ignored.
 
         Returns:
-            RegulatoryReportListResponse with paginated report list.
+            RegulatoryReportListResponse with paginated report list and the
+            cursor for the following page.
+
+        Raises:
+            ValidationError: If cursor is not a valid page cursor token.
         """
-        reports, total = await self._report_repo.list_by_tenant(
+        try:
+            position = decode_page_cursor(cursor) if cursor is not None else None
+        except ValueError as exc:
+            raise ValidationError(message=str(exc)) from exc
+
+        reports, total, next_position = await self._report_repo.list_by_tenant(
             tenant_id=tenant_id,
             regulator=regulator,
             page=page_request.page,
             page_size=page_request.page_size,
+            cursor=position,
         )
         return RegulatoryReportListResponse(
             items=[RegulatoryReportResponse.model_validate(r) for r in reports],
             total=total,
             page=page_request.page,
             page_size=page_request.page_size,
+            next_cursor=encode_page_cursor(*next_position) if next_position is not None else None,
         )
 
     async def generate_report(
@@ -1193,23 +1222,51 @@ class FinServComplianceToolsService:
             tenant_id: Tenant requesting the assertion.
 
         Returns:
-            Dictionary with management assertion text, deficiency summary,
-            and attestation readiness indicator.
+            Management assertion dict with SOX 302 and 404 sections, control
+            counts by rating, and the attestation period.
+
+        Raises:
+            ValidationError: If a period date is not ISO 8601, the period ends
+                before it starts, or a control has an unknown effectiveness rating.
         """
-        result = self.sox_compliance.generate_management_assertion(
-            control_results=control_results,
-            reporting_period_start=reporting_period_start,
-            reporting_period_end=reporting_period_end,
+        try:
+            period_start = datetime.fromisoformat(reporting_period_start)
+            period_end = datetime.fromisoformat(reporting_period_end)
+        except ValueError as exc:
+            raise ValidationError(message=f"Invalid reporting period date: {exc}") from exc
+        if period_start.tzinfo is None:
+            period_start = period_start.replace(tzinfo=timezone.utc)
+        if period_end.tzinfo is None:
+            period_end = period_end.replace(tzinfo=timezone.utc)
+        if period_end < period_start:
+            raise ValidationError(message="reporting_period_end precedes reporting_period_start")
+
+        rating_counts = dict.fromkeys(_SOX_EFFECTIVENESS_RATINGS, 0)
+        for result in control_results:
+            rating = result.get("effectiveness_rating")
+            if rating not in rating_counts:
+                raise ValidationError(
+                    message=f"Unknown effectiveness_rating {rating!r} for control {result.get('control_id')!r}",
+                )
+            rating_counts[rating] += 1
+
+        assertion = self.sox_compliance.generate_management_assertion(
+            tenant_id=tenant_id,
             entity_name=entity_name,
+            fiscal_year_end=period_end,
+            controls_effective=rating_counts["EFFECTIVE"],
+            controls_deficient=rating_counts["DEFICIENCY"] + rating_counts["SIGNIFICANT_DEFICIENCY"],
+            controls_material_weakness=rating_counts["MATERIAL_WEAKNESS"],
+            attestation_period_start=period_start,
         )
         logger.info(
             "SOX management assertion generated",
             tenant_id=str(tenant_id),
             entity_name=entity_name,
             total_controls=len(control_results),
-            attestation_ready=result.get("attestation_ready"),
+            icfr_effective=assertion.sox_404_assertion["icfr_effective"],
         )
-        return result
+        return assertion.to_dict()
 
     def perform_pci_deep_scan(
         self,
@@ -36,7 +36,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
 
     logger.info("aumos-finserv-overlay shutting down")
-    # TODO: Close Kafka producer
+    await close_event_publisher()
     # TODO: Close Redis connection
 
 
@@ -49,6 +49,6 @@ app = create_app(
 )
 
 # Include finserv router
-from aumos_finserv_overlay.api.router import router  # noqa: E402
+from aumos_finserv_overlay.api.router import close_event_publisher, router  # noqa: E402
 
 app.include_router(router, prefix="/api/v1")
@@ -109,6 +109,10 @@ class Settings(AumOSSettings):
         default="/app/templates/reports",
         description="Directory for Jinja2 regulatory report templates",
     )
+    report_template_cache_dir: str | None = Field(
+        default=None,
+        description="Directory for compiled Jinja2 template bytecode (disabled when unset)",
+    )
     supported_regulators: list[str] = Field(
         default_factory=lambda: ["SEC", "CFPB", "FINRA", "OCC", "FDIC", "FRB"],
         description="Supported regulatory bodies for report generation",
@@ -0,0 +1,72 @@
+"""Unit tests for the compliance tools service SOX management assertion."""
+
+import uuid
+from typing import Any
+
+import pytest
+from aumos_common.errors import ValidationError
+
+from aumos_finserv_overlay.core.services import FinServComplianceToolsService
+
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+class _Publisher:
+    async def publish(self, *args: object, **kwargs: object) -> None:
+        pass
+
+
+@pytest.fixture
+def service() -> FinServComplianceToolsService:
+    """Return a compliance tools service with a no-op publisher."""
+    return FinServComplianceToolsService(event_publisher=_Publisher(), settings=None)  # type: ignore[arg-type]
+
+
+def _results(*ratings: str) -> list[dict[str, Any]]:
+    return [{"control_id": f"C{i}", "effectiveness_rating": rating} for i, rating in enumerate(ratings)]
+
+
+def test_management_assertion_counts_ratings_and_keeps_the_period(service: FinServComplianceToolsService) -> None:
+    assertion = service.generate_sox_management_assertion(
+        control_results=_results("EFFECTIVE", "DEFICIENCY", "SIGNIFICANT_DEFICIENCY", "EFFECTIVE"),
+        reporting_period_start="2025-01-01",
+        reporting_period_end="2025-12-31",
+        entity_name="Acme Bank",
+        tenant_id=_TENANT_ID,
+    )
+
+    assert assertion["sox_404_assertion"]["total_controls_assessed"] == 4
+    assert assertion["sox_404_assertion"]["effective_controls"] == 2
+    assert assertion["sox_404_assertion"]["deficient_controls"] == 2
+    assert assertion["sox_404_assertion"]["overall_opinion"] == "QUALIFIED"
+    assert assertion["attestation_period_start"] == "2025-01-01T00:00:00+00:00"
+    assert assertion["attestation_period_end"] == "2025-12-31T00:00:00+00:00"
+
+
+@pytest.mark.parametrize(
+    ("period_start", "period_end"),
+    [("2025-01-01", "31/12/2025"), ("not-a-date", "2025-12-31"), ("2025-12-31", "2025-01-01")],
+)
+def test_management_assertion_rejects_invalid_periods(
+    service: FinServComplianceToolsService, period_start: str, period_end: str
+) -> None:
+    with pytest.raises(ValidationError):
+        service.generate_sox_management_assertion(
+            control_results=_results("EFFECTIVE"),
+            reporting_period_start=period_start,
+            reporting_period_end=period_end,
+            entity_name="Acme Bank",
+            tenant_id=_TENANT_ID,
+        )
+
+
+@pytest.mark.parametrize("rating", ["effective", "NOT_TESTED", None])
+def test_management_assertion_rejects_unknown_ratings(service: FinServComplianceToolsService, rating: str) -> None:
+    with pytest.raises(ValidationError):
+        service.generate_sox_management_assertion(
+            control_results=[*_results("EFFECTIVE"), {"control_id": "C9", "effectiveness_rating": rating}],
+            reporting_period_start="2025-01-01",
+            reporting_period_end="2025-12-31",
+            entity_name="Acme Bank",
+            tenant_id=_TENANT_ID,
+        )
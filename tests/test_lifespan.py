@@ -0,0 +1,73 @@
+"""Tests for the service startup/shutdown lifespan."""
+
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+
+from aumos_finserv_overlay import main
+from aumos_finserv_overlay.api import router
+
+
+class _ClosingPublisher:
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _SyncClosingPublisher:
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _PublisherWithoutClose:
+    pass
+
+
+@pytest.fixture(autouse=True)
+def _isolated_lifespan(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(main, "init_database", lambda *_: None)
+    router.get_event_publisher.cache_clear()
+    yield
+    router.get_event_publisher.cache_clear()
+
+
+async def test_shutdown_closes_shared_publisher(monkeypatch: pytest.MonkeyPatch) -> None:
+    publisher = _ClosingPublisher()
+    monkeypatch.setattr(router, "FinServEventPublisher", lambda: publisher)
+
+    async with main.lifespan(FastAPI()):
+        assert router.get_event_publisher() is publisher
+
+    assert publisher.closed
+    assert router.get_event_publisher.cache_info().currsize == 0
+
+
+async def test_shutdown_calls_synchronous_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    publisher = _SyncClosingPublisher()
+    monkeypatch.setattr(router, "FinServEventPublisher", lambda: publisher)
+
+    async with main.lifespan(FastAPI()):
+        router.get_event_publisher()
+
+    assert publisher.closed
+    assert router.get_event_publisher.cache_info().currsize == 0
+
+
+async def test_shutdown_tolerates_publisher_without_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(router, "FinServEventPublisher", _PublisherWithoutClose)
+
+    async with main.lifespan(FastAPI()):
+        router.get_event_publisher()
+
+    assert router.get_event_publisher.cache_info().currsize == 0
+
+
+async def test_shutdown_without_publisher_is_a_no_op() -> None:
+    async with main.lifespan(FastAPI()):
+        pass
+
+    assert router.get_event_publisher.cache_info().currsize == 0
@@ -0,0 +1,75 @@
+"""Unit tests for PCI DSS cardholder data detection."""
+
+import pytest
+
+from aumos_finserv_overlay.adapters.pci_dss_checker import PCIDSSChecker
+
+_VISA_TEST_PAN = "4111111111111111"
+
+
+def _pan_report(sample_text: str) -> tuple[int, list[str]]:
+    result = PCIDSSChecker().detect_cardholder_data(sample_text, "prod", [])
+    return result["potential_pan_patterns_found"], result["masked_pan_samples"]
+
+
+@pytest.mark.parametrize(
+    "sample_text",
+    [
+        "4111111111111111",
+        "card 4111 1111 1111 1111 on file",
+        "card 4111-1111-1111-1111 on file",
+        "ref 4111111111111111 123",
+        "4111 1111 1111 1111 12 items",
+        "4111-1111-1111-1111-99",
+        "order 12 4111 1111 1111 1111",
+    ],
+)
+def test_pan_is_found_with_or_without_adjacent_numbers(sample_text: str) -> None:
+    assert _pan_report(sample_text) == (1, ["411111****1111"])
+
+
+@pytest.mark.parametrize(
+    "sample_text",
+    [
+        "4111111111111112",
+        "invoice 1234 5678 9012",
+        "41111111111111111111",
+        "ab4111111111111111",
+    ],
+)
+def test_non_pan_digit_runs_are_not_counted(sample_text: str) -> None:
+    assert _pan_report(sample_text) == (0, [])
+
+
+def test_each_pan_in_a_run_is_counted_once() -> None:
+    count, masked = _pan_report(f"{_VISA_TEST_PAN} {_VISA_TEST_PAN}, 5500 0000 0000 0004")
+
+    assert count == 3
+    assert masked == ["411111****1111", "411111****1111", "550000****0004"]
+
+
+def test_masked_samples_are_capped_at_five() -> None:
+    count, masked = _pan_report(", ".join([_VISA_TEST_PAN] * 8))
+
+    assert count == 8
+    assert len(masked) == 5
+
+
+def test_keywords_and_flows_put_environment_in_scope() -> None:
+    result = PCIDSSChecker().detect_cardholder_data("CVV stored in Cardholder table", "prod", ["Card tokenizer"])
+
+    assert result["pci_dss_in_scope"] is True
+    assert result["potential_pan_patterns_found"] == 0
+    assert result["cardholder_data_keywords"] == ["cardholder", "CVV"]
+    assert result["at_risk_data_flows"][0]["risk_indicators"] == ["card"]
+
+
+def test_batch_matches_single_detection() -> None:
+    checker = PCIDSSChecker()
+    items = [("ref 4111111111111111 123", "a", []), ("nothing here", "b", ["logging"])]
+
+    batch = checker.detect_cardholder_data_batch(items)
+
+    assert [r["potential_pan_patterns_found"] for r in batch] == [1, 0]
+    assert [r["pci_dss_in_scope"] for r in batch] == [True, False]
+    assert batch[0]["scanned_at"] == batch[1]["scanned_at"]
@@ -0,0 +1,208 @@
+"""Unit tests for the regulatory change feed adapter."""
+
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import pytest
+from lxml import etree
+
+from aumos_finserv_overlay.adapters.regulatory_feed import REGULATOR_FEEDS, RegulatoryFeedAdapter
+
+_SINCE = datetime(2025, 1, 1, tzinfo=UTC)
+
+_RSS_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <title>FINRA Notices</title>
+    <link>https://www.finra.org/</link>
+    <item>
+      <title>Regulatory Notice on Model Risk Validation</title>
+      <link>https://www.finra.org/notices/25-01</link>
+      <pubDate>Wed, 05 Mar 2025 13:00:00 GMT</pubDate>
+    </item>
+    <item>
+      <title>Anti-Money Laundering reminder</title>
+      <link>https://www.finra.org/notices/25-02</link>
+      <pubDate>Thu, 06 Mar 2025 09:30:00 -0000</pubDate>
+    </item>
+    <item>
+      <title>Entry with an unparseable date</title>
+      <link>https://www.finra.org/notices/25-03</link>
+      <pubDate>sometime next week</pubDate>
+    </item>
+    <item>
+      <title>Old notice</title>
+      <link>https://www.finra.org/notices/24-99</link>
+      <pubDate>Mon, 02 Dec 2024 10:00:00 +0000</pubDate>
+    </item>
+  </channel>
+</rss>
+"""
+
+_ATOM_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>EDGAR filings</title>
+  <entry>
+    <title>Sarbanes-Oxley internal control filing</title>
+    <link href="https://www.sec.gov/filing/1"/>
+    <updated>2025-02-01T12:00:00Z</updated>
+  </entry>
+  <entry>
+    <title>Machine learning disclosure</title>
+    <link href="https://www.sec.gov/filing/2"/>
+    <published>2025-02-02T08:00:00</published>
+    <updated>2025-02-03T08:00:00+00:00</updated>
+  </entry>
+  <entry>
+    <title>Missing date</title>
+    <link href="https://www.sec.gov/filing/3"/>
+  </entry>
+</feed>
+"""
+
+
+class _FeedServer:
+    """Mock transport handler serving one feed body with optional validators."""
+
+    def __init__(self, body: bytes, headers: dict[str, str] | None = None) -> None:
+        self.body = body
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = self.headers.get("ETag")
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=self.body, headers=self.headers)
+
+
+@pytest.fixture
+def server() -> _FeedServer:
+    """Return a server for the sample RSS feed."""
+    return _FeedServer(_RSS_FEED, {"ETag": '"v1"'})
+
+
+@pytest.fixture
+async def adapter(server: _FeedServer) -> AsyncIterator[RegulatoryFeedAdapter]:
+    """Return an adapter whose client is served by the mock feed server."""
+    async with httpx.AsyncClient(transport=httpx.MockTransport(server)) as client:
+        yield RegulatoryFeedAdapter(client)
+
+
+async def test_rss_feed_yields_entries_after_since(adapter: RegulatoryFeedAdapter) -> None:
+    updates = await adapter.fetch_updates("FINRA", _SINCE)
+
+    assert [update["url"] for update in updates] == [
+        "https://www.finra.org/notices/25-01",
+        "https://www.finra.org/notices/25-02",
+    ]
+    assert updates[0]["published_at"] == datetime(2025, 3, 5, 13, 0, tzinfo=UTC)
+    assert updates[0]["affected_domains"] == ["SR_11_7"]
+    assert updates[1]["affected_domains"] == ["AML"]
+    assert len(updates[0]["content_hash"]) == 32
+
+
+async def test_rss_unzoned_dates_are_utc(adapter: RegulatoryFeedAdapter) -> None:
+    updates = await adapter.fetch_updates("FINRA", datetime(2025, 3, 6, 9, 0))
+
+    assert [update["published_at"] for update in updates] == [datetime(2025, 3, 6, 9, 30, tzinfo=UTC)]
+
+
+async def test_atom_feed_reads_href_links_and_published_or_updated(
+    server: _FeedServer, adapter: RegulatoryFeedAdapter
+) -> None:
+    server.body = _ATOM_FEED
+
+    updates = await adapter.fetch_updates("SEC", _SINCE)
+
+    assert [update["url"] for update in updates] == ["https://www.sec.gov/filing/1", "https://www.sec.gov/filing/2"]
+    assert updates[0]["published_at"] == datetime(2025, 2, 1, 12, 0, tzinfo=UTC)
+    assert updates[0]["affected_domains"] == ["SOX"]
+    assert updates[1]["published_at"] == datetime(2025, 2, 2, 8, 0, tzinfo=UTC)
+    assert updates[1]["affected_domains"] == ["SEC_AI"]
+
+
+async def test_parsed_entries_and_their_siblings_are_released(
+    server: _FeedServer, adapter: RegulatoryFeedAdapter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    items = b"".join(
+        b"<item><title>Notice %d</title><link>https://x/%d</link>"
+        b"<pubDate>Wed, 05 Mar 2025 13:00:00 GMT</pubDate></item>" % (i, i)
+        for i in range(200)
+    )
+    server.body = b"<rss><channel><title>Feed</title>" + items + b"</channel></rss>"
+    contexts: list[Any] = []
+    iterparse = etree.iterparse
+
+    def _recording_iterparse(*args: object, **kwargs: object) -> Iterator[Any]:
+        context = iterparse(*args, **kwargs)
+        contexts.append(context)
+        return context
+
+    monkeypatch.setattr(etree, "iterparse", _recording_iterparse)
+
+    updates = await adapter.fetch_updates("FINRA", _SINCE)
+
+    channel = contexts[0].root[0]
+    assert [update["title"] for update in updates] == [f"Notice {i}" for i in range(200)]
+    assert len(channel) == 1
+    assert len(channel[0]) == 0
+
+
+async def test_unchanged_feed_returns_304_without_parsing(server: _FeedServer, adapter: RegulatoryFeedAdapter) -> None:
+    assert len(await adapter.fetch_updates("FINRA", _SINCE)) == 2
+
+    assert await adapter.fetch_updates("FINRA", _SINCE) == []
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_wider_window_skips_conditional_request(server: _FeedServer, adapter: RegulatoryFeedAdapter) -> None:
+    await adapter.fetch_updates("FINRA", datetime(2025, 3, 6, tzinfo=UTC))
+
+    updates = await adapter.fetch_updates("FINRA", _SINCE)
+
+    assert "If-None-Match" not in server.requests[1].headers
+    assert len(updates) == 2
+
+
+async def test_last_modified_before_since_skips_parsing(server: _FeedServer, adapter: RegulatoryFeedAdapter) -> None:
+    server.body = b"<rss><channel><item>"
+    server.headers = {"Last-Modified": "Tue, 31 Dec 2024 23:59:59 GMT"}
+
+    assert await adapter.fetch_updates("FINRA", _SINCE) == []
+    await adapter.fetch_updates("FINRA", _SINCE)
+
+    assert server.requests[1].headers["If-Modified-Since"] == "Tue, 31 Dec 2024 23:59:59 GMT"
+
+
+async def test_malformed_feed_does_not_store_validators(server: _FeedServer, adapter: RegulatoryFeedAdapter) -> None:
+    server.body = b"<rss><channel><item><title>Broken"
+
+    with pytest.raises(etree.XMLSyntaxError):
+        await adapter.fetch_updates("FINRA", _SINCE)
+    server.body = _RSS_FEED
+    updates = await adapter.fetch_updates("FINRA", _SINCE)
+
+    assert "If-None-Match" not in server.requests[1].headers
+    assert len(updates) == 2
+
+
+async def test_fetch_all_updates_omits_failed_feeds() -> None:
+    def _serve(request: httpx.Request) -> httpx.Response:
+        if request.url == httpx.URL(REGULATOR_FEEDS["OCC"]):
+            return httpx.Response(503)
+        return httpx.Response(200, content=_RSS_FEED)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(_serve)) as client:
+        updates = await RegulatoryFeedAdapter(client).fetch_all_updates(_SINCE)
+
+    assert sorted(updates) == ["CFPB", "FINRA", "FRB", "SEC"]
+    assert all(len(entries) == 2 for entries in updates.values())
+
+
+async def test_unknown_regulator_is_rejected(adapter: RegulatoryFeedAdapter) -> None:
+    with pytest.raises(ValueError, match="Unknown regulator"):
+        await adapter.fetch_updates("ESMA", _SINCE)
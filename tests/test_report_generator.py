@@ -0,0 +1,84 @@
+"""Unit tests for the regulatory report generator."""
+
+import threading
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import orjson
+import pytest
+from lxml import etree
+
+from aumos_finserv_overlay.adapters import report_generator
+from aumos_finserv_overlay.adapters.report_generator import ReportGenerator
+from aumos_finserv_overlay.api.schemas import RegulatoryBody, RegulatoryReportRequest, ReportType
+from aumos_finserv_overlay.settings import Settings
+
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+@pytest.fixture
+def generator(tmp_path: Path) -> ReportGenerator:
+    """Return a generator that renders only the built-in templates."""
+    return ReportGenerator(Settings(report_template_dir=str(tmp_path)))
+
+
+def _request(regulator: RegulatoryBody, entity_name: str = "Acme Bank") -> RegulatoryReportRequest:
+    return RegulatoryReportRequest(
+        regulator=regulator,
+        report_type=ReportType.FORM_10K,
+        reporting_period_start=datetime(2025, 1, 1, tzinfo=UTC),
+        reporting_period_end=datetime(2025, 12, 31, tzinfo=UTC),
+        entity_name=entity_name,
+    )
+
+
+@pytest.mark.parametrize(
+    "entity_name",
+    ["Acme --> <evil/> Bank", "Acme\x0bBank", "Acme\x00\x1f\ufffe Bank-"],
+)
+async def test_xbrl_report_tolerates_hostile_entity_names(generator: ReportGenerator, entity_name: str) -> None:
+    document, report_format, _ = await generator.generate_report(
+        _request(RegulatoryBody.SEC, entity_name), _TENANT_ID, [], []
+    )
+
+    root = etree.fromstring(document)
+    comments = [node.text for node in root.iter(etree.Comment)]
+    metadata = root.find("{http://www.xbrl.org/2003/instance}metadata")
+
+    assert report_format == "XBRL"
+    assert len(comments) == 4
+    assert all("--" not in comment for comment in comments)
+    assert comments[3].startswith(" Entity: Acme")
+    assert metadata is not None
+    assert orjson.loads(metadata.text)["report_metadata"]["entity_name"] == entity_name
+
+
+async def test_xbrl_comment_replaces_control_characters(generator: ReportGenerator) -> None:
+    document, _, _ = await generator.generate_report(_request(RegulatoryBody.SEC, "Acme\x0bBank"), _TENANT_ID, [], [])
+
+    assert "<!-- Entity: Acme\ufffdBank -->" in document.decode("utf-8")
+
+
+async def test_pdf_report_layout_runs_in_a_worker_thread(
+    generator: ReportGenerator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loop_thread = threading.get_ident()
+    render_threads: list[int] = []
+    render_pdf = report_generator._render_pdf
+
+    def _recording_render(text: str, title: str) -> bytes:
+        render_threads.append(threading.get_ident())
+        return render_pdf(text, title)
+
+    monkeypatch.setattr(report_generator, "_render_pdf", _recording_render)
+    evidence = [{"control_id": f"C{i}", "status": "approved"} for i in range(50)]
+
+    document, report_format, _ = await generator.generate_report(
+        _request(RegulatoryBody.FINRA), _TENANT_ID, [], evidence
+    )
+
+    assert report_format == "PDF"
+    assert document.startswith(b"%PDF")
+    assert len(render_threads) == 1
+    assert render_threads[0] != loop_thread
@@ -0,0 +1,197 @@
+"""Unit tests for keyset page cursors and the shared page query helper."""
+
+import base64
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from aumos_common.errors import ValidationError
+from aumos_common.pagination import PageRequest
+
+from aumos_finserv_overlay.adapters.repositories import _fetch_page, decode_page_cursor, encode_page_cursor
+from aumos_finserv_overlay.core.models import SOXEvidence
+from aumos_finserv_overlay.core.services import RegulatoryReportService
+
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_CREATED_AT = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+
+class _Row:
+    """Result row carrying the selected entity and the total column."""
+
+    def __init__(self, record: object, total: int) -> None:
+        self._record = record
+        self.total = total
+
+    def __getitem__(self, index: int) -> object:
+        return self._record
+
+
+class _Result:
+    def __init__(self, rows: list[_Row], scalar: int | None = None) -> None:
+        self._rows = rows
+        self._scalar = scalar
+
+    def all(self) -> list[_Row]:
+        return self._rows
+
+    def scalar_one(self) -> int | None:
+        return self._scalar
+
+
+class _Session:
+    """Async session stand-in replaying canned results and recording statements."""
+
+    def __init__(self, *results: _Result) -> None:
+        self._results = list(results)
+        self.statements: list[object] = []
+
+    async def execute(self, statement: object) -> _Result:
+        self.statements.append(statement)
+        return self._results.pop(0)
+
+
+class _ReportRepository:
+    def __init__(self, next_position: tuple[datetime, uuid.UUID] | None) -> None:
+        self.cursors: list[tuple[datetime, uuid.UUID] | None] = []
+        self._next_position = next_position
+
+    async def list_by_tenant(
+        self,
+        tenant_id: uuid.UUID,
+        regulator: str | None,
+        page: int,
+        page_size: int,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+    ) -> tuple[list[Any], int, tuple[datetime, uuid.UUID] | None]:
+        self.cursors.append(cursor)
+        return [], 7, self._next_position
+
+
+def _records(count: int) -> list[SimpleNamespace]:
+    return [SimpleNamespace(created_at=_CREATED_AT - timedelta(minutes=i), id=uuid.uuid4()) for i in range(count)]
+
+
+def _report_service(repository: _ReportRepository) -> RegulatoryReportService:
+    return RegulatoryReportService(repository, None, None, None, None, None)  # type: ignore[arg-type]
+
+
+# ---------------------------------------------------------------------------
+# Cursor tokens
+# ---------------------------------------------------------------------------
+
+
+def test_page_cursor_round_trips() -> None:
+    record_id = uuid.uuid4()
+
+    token = encode_page_cursor(_CREATED_AT, record_id)
+
+    assert decode_page_cursor(token) == (_CREATED_AT, record_id)
+    assert token.isascii()
+    assert not set(token) & set("+/")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "not base64!",
+        "é",
+        base64.urlsafe_b64encode(b"2025-03-01T00:00:00").decode(),
+        base64.urlsafe_b64encode(b"yesterday|00000000-0000-0000-0000-000000000001").decode(),
+        base64.urlsafe_b64encode(b"2025-03-01T00:00:00|not-a-uuid").decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+    ],
+)
+def test_malformed_page_cursor_is_rejected(token: str) -> None:
+    with pytest.raises(ValueError, match="Invalid page cursor"):
+        decode_page_cursor(token)
+
+
+async def test_list_reports_turns_malformed_cursor_into_validation_error() -> None:
+    repository = _ReportRepository(None)
+
+    with pytest.raises(ValidationError):
+        await _report_service(repository).list_reports(_TENANT_ID, None, PageRequest(page=1, page_size=5), "bogus")
+    assert repository.cursors == []
+
+
+async def test_list_reports_round_trips_the_next_cursor() -> None:
+    position = (_CREATED_AT, uuid.uuid4())
+    repository = _ReportRepository(position)
+    service = _report_service(repository)
+
+    first = await service.list_reports(_TENANT_ID, None, PageRequest(page=1, page_size=5))
+    second = await service.list_reports(_TENANT_ID, None, PageRequest(page=1, page_size=5), first.next_cursor)
+
+    assert first.next_cursor is not None
+    assert repository.cursors == [None, position]
+    assert second.total == 7
+
+
+# ---------------------------------------------------------------------------
+# Page query
+# ---------------------------------------------------------------------------
+
+
+async def test_full_page_returns_last_record_as_next_cursor() -> None:
+    records = _records(3)
+    session = _Session(_Result([_Row(record, 10) for record in records]))
+
+    page, total, next_cursor = await _fetch_page(session, SOXEvidence, [], 1, 3)  # type: ignore[arg-type]
+
+    assert page == records
+    assert total == 10
+    assert next_cursor == (records[-1].created_at, records[-1].id)
+
+
+async def test_short_page_has_no_next_cursor() -> None:
+    records = _records(2)
+    session = _Session(_Result([_Row(record, 5) for record in records]))
+
+    _, total, next_cursor = await _fetch_page(
+        session,  # type: ignore[arg-type]
+        SOXEvidence,
+        [],
+        1,
+        3,
+        cursor=(_CREATED_AT, uuid.uuid4()),
+    )
+
+    assert total == 5
+    assert next_cursor is None
+    assert "(fsv_sox_evidence.created_at, fsv_sox_evidence.id) <" in str(session.statements[0])
+
+
+async def test_page_past_the_end_counts_separately() -> None:
+    session = _Session(_Result([]), _Result([], scalar=4))
+
+    page, total, next_cursor = await _fetch_page(session, SOXEvidence, [], 3, 3)  # type: ignore[arg-type]
+
+    assert (page, total, next_cursor) == ([], 4, None)
+    assert len(session.statements) == 2
+
+
+async def test_cursor_past_the_end_counts_separately() -> None:
+    session = _Session(_Result([]), _Result([], scalar=4))
+
+    page, total, next_cursor = await _fetch_page(
+        session,  # type: ignore[arg-type]
+        SOXEvidence,
+        [],
+        1,
+        3,
+        cursor=(_CREATED_AT, uuid.uuid4()),
+    )
+
+    assert (page, total, next_cursor) == ([], 4, None)
+    assert len(session.statements) == 2
+
+
+async def test_empty_first_page_skips_the_count_query() -> None:
+    session = _Session(_Result([]))
+
+    assert await _fetch_page(session, SOXEvidence, [], 1, 3) == ([], 0, None)  # type: ignore[arg-type]
+    assert len(session.statements) == 1
@@ -0,0 +1,36 @@
+"""Unit tests for the SOC2 Type II evidence service."""
+
+import json
+import uuid
+from datetime import date
+
+from aumos_finserv_overlay.adapters.soc2_evidence import SOC2EvidenceService
+
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+def test_evidence_package_is_stdlib_json_serialisable() -> None:
+    evidence_id = uuid.uuid4()
+    package = SOC2EvidenceService().generate_evidence_package(
+        _TENANT_ID,
+        date(2025, 1, 1),
+        date(2025, 12, 31),
+        [{"id": evidence_id, "evidence_type": "mfa"}, {"evidence_type": "encryption"}],
+    )
+
+    decoded = json.loads(json.dumps(package))
+
+    assert decoded["tenant_id"] == str(_TENANT_ID)
+    assert decoded["audit_period"] == {"start": "2025-01-01", "end": "2025-12-31"}
+    assert decoded["controls"]["CC6.1"]["evidence"][0]["evidence_id"] == str(evidence_id)
+    assert decoded["controls"]["CC6.1"]["evidence"][0]["collected_at"] == package["generated_at"]
+    assert isinstance(decoded["controls"]["C1.1"]["evidence"][0]["evidence_id"], str)
+    assert decoded["tsc_coverage"]["controls_with_evidence"] == 2
+
+
+def test_streamed_evidence_uses_string_ids() -> None:
+    records = list(SOC2EvidenceService().stream_evidence_package([{"id": 42, "evidence_type": "rollback"}]))
+
+    assert records == [("CC8.1", records[0][1])]
+    assert records[0][1]["evidence_id"] == "42"
+    assert isinstance(records[0][1]["collected_at"], str)
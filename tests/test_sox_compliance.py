@@ -0,0 +1,296 @@
+"""Unit tests for the SOX compliance adapter.
+
+Pin the audit-chain and evidence-fingerprint encodings, which are persisted
+as integrity hashes, and the PCAOB effectiveness threshold boundaries.
+"""
+
+import dataclasses
+import hashlib
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+import pytest
+
+from aumos_finserv_overlay.adapters.sox_compliance import (
+    SOXComplianceAdapter,
+    _encode_chain_record,
+    _evidence_fingerprint,
+)
+
+_TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+_NOW = "2025-01-01T00:00:00+00:00"
+
+
+@pytest.fixture
+def adapter() -> SOXComplianceAdapter:
+    """Return a fresh SOX compliance adapter."""
+    return SOXComplianceAdapter()
+
+
+def _fingerprint(evidence_artifacts: list[str], control_owner: str = "controller") -> bytes:
+    """Fingerprint a fixed evidence package, varying only the given fields."""
+    return _evidence_fingerprint(
+        "ITGC-01",
+        "ITGC",
+        "Quarterly access review",
+        evidence_artifacts,
+        "system_report",
+        len(evidence_artifacts),
+        True,
+        ("SOX-302", "SOX-404(a)", "SOX-404(b)"),
+        "2025-01-01T00:00:00+00:00",
+        "2025-03-31T00:00:00+00:00",
+        control_owner,
+        True,
+        _NOW,
+        None,
+        None,
+    )
+
+
+def _steps(passed: int, total: int) -> list[dict[str, Any]]:
+    """Build test steps of which the first ``passed`` succeed."""
+    return [{"description": f"step {i}", "passed": i < passed} for i in range(total)]
+
+
+# ---------------------------------------------------------------------------
+# Audit chain encoding
+# ---------------------------------------------------------------------------
+
+
+def test_chain_record_encoding_is_length_prefixed() -> None:
+    record = {"control_id": "C1", "evidence_type": "log", "collected_at": "t", "integrity_hash": "ab"}
+
+    assert _encode_chain_record(3, record) == (
+        b"\x00\x00\x00\x013"
+        + b"\x00\x00\x00\x02C1"
+        + b"\x00\x00\x00\x03log"
+        + b"\x00\x00\x00\x01t"
+        + b"\x00\x00\x00\x02ab"
+    )
+
+
+def test_chain_record_encoding_defaults_missing_fields_to_empty() -> None:
+    assert _encode_chain_record(0, {}) == b"\x00\x00\x00\x010" + b"\x00\x00\x00\x00" * 4
+
+
+def test_audit_trail_links_follow_the_pinned_encoding(adapter: SOXComplianceAdapter) -> None:
+    records = [
+        {"control_id": "C1", "evidence_type": "log", "collected_at": _NOW, "integrity_hash": "aa"},
+        {"control_id": "C2", "evidence_type": "screenshot", "collected_at": _NOW, "integrity_hash": "bb"},
+    ]
+
+    trail = adapter.generate_audit_trail(_TENANT_ID, records, fiscal_year=2025, now=_NOW)
+
+    tenant = str(_TENANT_ID).encode()
+    prefix = len(tenant).to_bytes(4, "big") + tenant + b"\x00\x00\x00\x042025"
+    previous = b"GENESIS"
+    expected: list[str] = []
+    for index, record in enumerate(records):
+        previous = hashlib.sha256(prefix + previous + _encode_chain_record(index, record)).digest()
+        expected.append(previous.hex())
+
+    assert trail.chain["current_hash"] == expected
+    assert trail.chain["previous_hash"] == ["GENESIS", expected[0]]
+    assert trail.terminal_hash == expected[-1]
+    assert trail.chain_length == 2
+
+
+def test_audit_trail_separator_bytes_cannot_shift_between_fields(adapter: SOXComplianceAdapter) -> None:
+    left = adapter.generate_audit_trail(_TENANT_ID, [{"control_id": "A\x1fB", "evidence_type": "C"}], 2025, now=_NOW)
+    right = adapter.generate_audit_trail(_TENANT_ID, [{"control_id": "A", "evidence_type": "B\x1fC"}], 2025, now=_NOW)
+
+    assert left.terminal_hash != right.terminal_hash
+
+
+def test_audit_trail_is_bound_to_tenant_and_fiscal_year(adapter: SOXComplianceAdapter) -> None:
+    records = [{"control_id": "C1", "evidence_type": "log"}]
+    base = adapter.generate_audit_trail(_TENANT_ID, records, 2025, now=_NOW).terminal_hash
+
+    assert adapter.generate_audit_trail(uuid.uuid4(), records, 2025, now=_NOW).terminal_hash != base
+    assert adapter.generate_audit_trail(_TENANT_ID, records, 2026, now=_NOW).terminal_hash != base
+
+
+def test_empty_audit_trail_terminates_at_genesis(adapter: SOXComplianceAdapter) -> None:
+    trail = adapter.generate_audit_trail(_TENANT_ID, [], 2025, now=_NOW)
+
+    assert trail.chain_length == 0
+    assert trail.terminal_hash == "GENESIS"
+    assert adapter.chain_as_rows(trail.chain) == []
+
+
+# ---------------------------------------------------------------------------
+# Evidence fingerprint
+# ---------------------------------------------------------------------------
+
+
+def test_evidence_fingerprint_is_stable() -> None:
+    assert _fingerprint(["s3://evidence/a.pdf"]) == _fingerprint(["s3://evidence/a.pdf"])
+
+
+def test_evidence_fingerprint_separates_list_items() -> None:
+    assert _fingerprint(["a\x1eb", "c"]) != _fingerprint(["a", "b\x1ec"])
+
+
+def test_evidence_fingerprint_covers_every_field() -> None:
+    assert _fingerprint(["a"], control_owner="controller") != _fingerprint(["a"], control_owner="cfo")
+
+
+def test_collect_evidence_integrity_hash_is_reproducible(adapter: SOXComplianceAdapter) -> None:
+    kwargs: dict[str, Any] = {
+        "control_id": "ITGC-01",
+        "control_area": "ITGC",
+        "evidence_description": "Quarterly access review",
+        "evidence_artifacts": ["s3://evidence/a.pdf"],
+        "evidence_type": "system_report",
+        "review_period_start": datetime(2025, 1, 1, tzinfo=UTC),
+        "review_period_end": datetime(2025, 3, 31, tzinfo=UTC),
+        "control_owner": "controller",
+        "is_key_control": True,
+        "now": _NOW,
+    }
+
+    first = adapter.collect_evidence(**kwargs)
+    second = adapter.collect_evidence(**kwargs)
+
+    assert first.pcaob_accepted is True
+    assert first.integrity_hash == second.integrity_hash
+    assert first.integrity_hash == hashlib.sha256(_fingerprint(["s3://evidence/a.pdf"])).hexdigest()
+
+
+def test_results_do_not_alias_caller_collections(adapter: SOXComplianceAdapter) -> None:
+    artifacts = ["s3://evidence/a.pdf"]
+    compensating = ["MC-01"]
+    metadata = {"system": "SAP"}
+    package = adapter.collect_evidence(
+        control_id="ITGC-01",
+        control_area="ITGC",
+        evidence_description="Quarterly access review",
+        evidence_artifacts=artifacts,
+        evidence_type="system_report",
+        review_period_start=datetime(2025, 1, 1, tzinfo=UTC),
+        review_period_end=datetime(2025, 3, 31, tzinfo=UTC),
+        control_owner="controller",
+        is_key_control=True,
+        now=_NOW,
+    )
+    classification = adapter.classify_deficiency("ITGC-01", "Late review", "low", True, compensating, False, now=_NOW)
+    definition = adapter.define_control(
+        "ITGC-01",
+        "ITGC",
+        "Quarterly access review",
+        "controller",
+        True,
+        "quarterly",
+        False,
+        datetime(2025, 1, 1, tzinfo=UTC),
+        datetime(2025, 3, 31, tzinfo=UTC),
+        metadata=metadata,
+        now=_NOW,
+    )
+
+    artifacts.append("s3://evidence/forged.pdf")
+    compensating.clear()
+    metadata["system"] = "tampered"
+
+    assert package.evidence_artifacts == ("s3://evidence/a.pdf",)
+    assert package.integrity_hash == hashlib.sha256(_fingerprint(["s3://evidence/a.pdf"])).hexdigest()
+    assert classification.compensating_controls == ("MC-01",)
+    assert definition.metadata == {"system": "SAP"}
+    assert definition.to_dict()["metadata"] == {"system": "SAP"}
+    with pytest.raises(TypeError):
+        definition.metadata["system"] = "tampered"  # type: ignore[index]
+
+
+# ---------------------------------------------------------------------------
+# Effectiveness thresholds
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("passed", "total", "rating", "deficiency_type"),
+    [
+        (10, 10, "EFFECTIVE", None),
+        (9, 10, "EFFECTIVE", None),
+        (89, 100, "DEFICIENCY", "Control Deficiency"),
+        (7, 10, "DEFICIENCY", "Control Deficiency"),
+        (69, 100, "SIGNIFICANT_DEFICIENCY", "Significant Deficiency"),
+        (5, 10, "SIGNIFICANT_DEFICIENCY", "Significant Deficiency"),
+        (49, 100, "MATERIAL_WEAKNESS", "Material Weakness"),
+        (0, 10, "MATERIAL_WEAKNESS", "Material Weakness"),
+        (0, 0, "MATERIAL_WEAKNESS", "Material Weakness"),
+    ],
+)
+def test_effectiveness_threshold_boundaries(
+    adapter: SOXComplianceAdapter, passed: int, total: int, rating: str, deficiency_type: str | None
+) -> None:
+    result = adapter.test_control_effectiveness(
+        control_id="C1",
+        control_area="ITGC",
+        is_key_control=False,
+        test_steps=_steps(passed, total),
+        population_size=0,
+        sample_size=0,
+        automated_control=True,
+        now=_NOW,
+    )
+
+    assert result.effectiveness_rating == rating
+    assert result.deficiency_type == deficiency_type
+    assert result.sox_articles == ("SOX-302", "SOX-404(a)", "SOX-404(b)")
+    assert result.remediation_required is (rating != "EFFECTIVE")
+
+
+def test_significant_deficiency_on_key_control_is_material_weakness(adapter: SOXComplianceAdapter) -> None:
+    result = adapter.test_control_effectiveness(
+        control_id="C1",
+        control_area="ITGC",
+        is_key_control=True,
+        test_steps=_steps(5, 10),
+        population_size=0,
+        sample_size=0,
+        automated_control=True,
+        now=_NOW,
+    )
+
+    assert result.effectiveness_rating == "SIGNIFICANT_DEFICIENCY"
+    assert result.deficiency_type == "Material Weakness (Key Control)"
+    assert result.management_disclosure_required is True
+
+
+def test_batch_ratings_match_scalar_boundaries(adapter: SOXComplianceAdapter) -> None:
+    cases = [(9, 10), (89, 100), (7, 10), (69, 100), (5, 10), (49, 100), (0, 0)]
+    outcomes = np.concatenate([np.arange(total) < passed for passed, total in cases])
+    offsets = np.cumsum([0] + [total for _, total in cases[:-1]])
+
+    _, ratings = adapter.test_control_effectiveness_batch(outcomes, offsets)
+
+    assert ratings == [
+        "EFFECTIVE",
+        "DEFICIENCY",
+        "DEFICIENCY",
+        "SIGNIFICANT_DEFICIENCY",
+        "SIGNIFICANT_DEFICIENCY",
+        "MATERIAL_WEAKNESS",
+        "MATERIAL_WEAKNESS",
+    ]
+
+
+def test_result_to_dict_follows_field_order(adapter: SOXComplianceAdapter) -> None:
+    assertion = adapter.generate_management_assertion(
+        tenant_id=_TENANT_ID,
+        entity_name="Acme Bank",
+        fiscal_year_end=datetime(2025, 12, 31, tzinfo=UTC),
+        controls_effective=3,
+        controls_deficient=0,
+        controls_material_weakness=0,
+        now=_NOW,
+    )
+
+    as_dict = assertion.to_dict()
+
+    assert list(as_dict) == [field.name for field in dataclasses.fields(assertion)]
+    assert as_dict["attestation_period_start"] is None
+    assert as_dict["sox_404_assertion"]["overall_opinion"] == "UNQUALIFIED"
@@ -0,0 +1,78 @@
+"""Unit tests for the synthetic transaction generator."""
+
+import csv
+import io
+from datetime import datetime
+from decimal import Decimal
+
+from aumos_finserv_overlay.adapters.transaction_generator import _CHUNK_ROWS, TransactionGenerator
+from aumos_finserv_overlay.api.schemas import SyntheticTransactionRequest
+
+_HEADER = [
+    "transaction_id",
+    "timestamp",
+    "account_from",
+    "account_to",
+    "amount",
+    "currency",
+    "transaction_type",
+    "channel",
+    "is_fraud",
+    "fraud_reason",
+    "merchant_name",
+    "merchant_mcc",
+    "device_id",
+    "ip_address",
+]
+
+
+async def _collect(request: SyntheticTransactionRequest) -> list[tuple[bytes, int, int]]:
+    return [chunk async for chunk in TransactionGenerator().generate(request)]
+
+
+async def test_generated_csv_spans_chunks_with_consistent_rows_and_counts() -> None:
+    num_transactions = _CHUNK_ROWS + 1234
+    request = SyntheticTransactionRequest(
+        num_transactions=num_transactions,
+        fraud_rate=0.3,
+        amount_min=Decimal("5.00"),
+        amount_max=Decimal("5000.00"),
+        num_accounts=10,
+        include_merchant_data=True,
+        include_device_data=True,
+        seed=7,
+    )
+
+    chunks = await _collect(request)
+
+    header_chunk, *row_chunks = chunks
+    assert next(csv.reader(io.StringIO(header_chunk[0].decode()))) == _HEADER
+    assert header_chunk[1:] == (0, 0)
+    assert len(row_chunks) == 2
+
+    total_rows = 0
+    for data, fraud, legitimate in row_chunks:
+        rows = list(csv.reader(io.StringIO(data.decode())))
+        assert all(len(row) == len(_HEADER) for row in rows)
+        assert all(row[2] != row[3] for row in rows)
+        assert fraud == sum(row[8] == "1" for row in rows)
+        assert fraud + legitimate == len(rows)
+        for row in rows:
+            assert Decimal("5.00") <= Decimal(row[4]) <= Decimal("5000.00")
+            assert datetime.fromisoformat(row[1]).utcoffset() is not None
+            assert (row[9] == "velocity_anomaly") is (row[8] == "1")
+        total_rows += len(rows)
+
+    assert total_rows == num_transactions
+    assert [fraud + legitimate for _, fraud, legitimate in row_chunks] == [_CHUNK_ROWS, 1234]
+    assert sum(fraud + legitimate for _, fraud, legitimate in chunks) == num_transactions
+    assert 0 < sum(fraud for _, fraud, _ in chunks) < num_transactions
+
+
+async def test_optional_columns_are_omitted_when_disabled() -> None:
+    request = SyntheticTransactionRequest(num_transactions=5, include_merchant_data=False, seed=1)
+
+    header_chunk, data_chunk = await _collect(request)
+
+    assert next(csv.reader(io.StringIO(header_chunk[0].decode()))) == _HEADER[:10]
+    assert all(len(row) == 10 for row in csv.reader(io.StringIO(data_chunk[0].decode())))
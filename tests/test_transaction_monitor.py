@@ -0,0 +1,151 @@
+"""Unit tests for the real-time AML transaction monitor."""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from aumos_finserv_overlay.adapters.transaction_monitor import (
+    AMLAlert,
+    AMLSeverity,
+    IAMLAlertRepository,
+    TransactionMonitor,
+)
+
+_STRUCTURING_REASON = "Potential structuring pattern detected in 24h window"
+
+
+class _AlertRepository(IAMLAlertRepository):
+    """In-memory repository whose window aggregates are always empty."""
+
+    def __init__(self, fail_accounts: frozenset[str] = frozenset()) -> None:
+        self.alerts: list[dict[str, Any]] = []
+        self._fail_accounts = fail_accounts
+
+    async def create(
+        self,
+        tenant_id: uuid.UUID,
+        transaction_id: uuid.UUID,
+        risk_score: Decimal,
+        severity: AMLSeverity,
+        reasons: list[str],
+    ) -> AMLAlert:
+        self.alerts.append({"transaction_id": transaction_id, "severity": severity, "reasons": reasons})
+        return AMLAlert(uuid.uuid4(), severity, risk_score)
+
+    async def get_24h_total(self, account: str) -> Decimal:
+        await asyncio.sleep(0)
+        if account in self._fail_accounts:
+            raise ConnectionError("repository unavailable")
+        return Decimal("0")
+
+    async def get_1h_count(self, account: str) -> int:
+        await asyncio.sleep(0)
+        return 0
+
+
+class _Publisher:
+    async def publish(self, **kwargs: object) -> None:
+        pass
+
+
+class _Consumer:
+    handler: Callable[[dict], Awaitable[None]]
+
+    async def subscribe(self, topic: str, group_id: str, handler: Callable[[dict], Awaitable[None]]) -> None:
+        self.handler = handler
+
+
+def _transaction(sender_account: str, amount_usd: str = "9500.00") -> dict[str, Any]:
+    return {
+        "tenant_id": str(uuid.uuid4()),
+        "transaction_id": str(uuid.uuid4()),
+        "sender_account": sender_account,
+        "amount_usd": amount_usd,
+    }
+
+
+def _structuring_alerts(repository: _AlertRepository) -> int:
+    return sum(_STRUCTURING_REASON in alert["reasons"] for alert in repository.alerts)
+
+
+async def _started_monitor(repository: _AlertRepository) -> tuple[TransactionMonitor, _Consumer]:
+    consumer = _Consumer()
+    monitor = TransactionMonitor(repository, _Publisher(), consumer, set())  # type: ignore[arg-type]
+    await monitor.start()
+    return monitor, consumer
+
+
+async def test_sequential_burst_from_one_sender_raises_structuring_alert() -> None:
+    repository = _AlertRepository()
+    _, consumer = await _started_monitor(repository)
+
+    for _ in range(3):
+        await consumer.handler(_transaction("ACC-1"))
+
+    assert _structuring_alerts(repository) == 1
+
+
+async def test_scoring_failure_is_raised_to_the_handler() -> None:
+    repository = _AlertRepository(fail_accounts=frozenset({"ACC-BAD"}))
+    _, consumer = await _started_monitor(repository)
+
+    with pytest.raises(ConnectionError):
+        await consumer.handler(_transaction("ACC-BAD"))
+    await consumer.handler(_transaction("ACC-OK"))
+
+    assert repository.alerts == []
+
+
+# ---------------------------------------------------------------------------
+# Sanctions screening
+# ---------------------------------------------------------------------------
+
+
+def _sanctions_monitor(sanctions_list: set[str]) -> TransactionMonitor:
+    return TransactionMonitor(_AlertRepository(), _Publisher(), _Consumer(), sanctions_list)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("name", "sanctioned"),
+    [
+        ("John Doe", True),
+        ("JOHN DOE", True),
+        ("  john doe ", True),
+        ("JOHN A. DOE", True),
+        ("Doe, John", True),
+        ("Jon Doe", False),
+        ("John", False),
+        ("Johnny Doe", False),
+        ("Jane Roe", False),
+    ],
+)
+def test_sanctions_match_normalised_names_and_aliases(name: str, sanctioned: bool) -> None:
+    assert _sanctions_monitor({"John Doe"})._is_sanctioned(name) is sanctioned
+
+
+def test_sanctions_list_entries_are_casefolded() -> None:
+    assert _sanctions_monitor({"  MÜLLER Hans "})._is_sanctioned("hans müller") is True
+
+
+def test_single_token_entry_matches_any_name_containing_it() -> None:
+    # Token containment over-matches short entries: "Al" flags every "Al ..." party
+    monitor = _sanctions_monitor({"Al"})
+
+    assert monitor._is_sanctioned("Al Smith") is True
+    assert monitor._is_sanctioned("Alan Smith") is False
+
+
+async def test_sanctioned_sender_raises_alert() -> None:
+    repository = _AlertRepository()
+    consumer = _Consumer()
+    monitor = TransactionMonitor(repository, _Publisher(), consumer, {"John Doe"})  # type: ignore[arg-type]
+    await monitor.start()
+
+    await consumer.handler({**_transaction("ACC-1", "50.00"), "sender_name": "DOE, JOHN"})
+
+    assert repository.alerts[0]["severity"] == AMLSeverity.MEDIUM
+    assert repository.alerts[0]["reasons"] == ["Sender name matches OFAC/HMT sanctions list"]